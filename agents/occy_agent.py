@@ -161,6 +161,9 @@ class OccyAgent:
             await self._browser.stop()
             self._browser = None
 
+        if self._reviewer:
+            await self._reviewer.close()
+
         self.audit_log.log("occy", "info", "system", "Occy agent stopped")
         logger.info("Occy agent stopped")
 
@@ -14,19 +14,40 @@ Scoring dimensions (each 1-10):
 
 Overall score = weighted average. Threshold: 7.0 for delivery.
 
+Videos are uploaded with the Files API resumable protocol in fixed-size
+chunks read from the file handle, so memory stays flat regardless of video
+size. After a network error the upload resumes from the offset the server
+reports. Uploaded file URIs are cached by content hash, so re-reviewing
+the same render skips the upload while Google still holds the file.
+
 Requires: GOOGLE_API_KEY in .env
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
 from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+import httpx
+
 logger = logging.getLogger(__name__)
 
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com"
+
+# Resumable upload chunks must be multiples of 256 KiB
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# Consecutive failed chunks before giving up
+MAX_UPLOAD_RETRIES = 5
+
+# Uploaded file URIs by content hash (the Files API keeps files for 48h)
+FILE_CACHE_PATH = Path("data/occy_gemini_files.json")
+FILE_CACHE_TTL = timedelta(hours=47)
+
 
 @dataclass
 class QualityScore:
@@ -70,11 +91,26 @@ class OccyReviewer:
     making it ideal for comprehensive quality assessment without frame extraction.
     """
 
-    def __init__(self, knowledge_store=None):
+    def __init__(self, knowledge_store=None, file_cache_path: Path = FILE_CACHE_PATH):
         self.knowledge_store = knowledge_store
         self._google_key = os.environ.get("GOOGLE_API_KEY")
         if not self._google_key:
             logger.warning("GOOGLE_API_KEY not set — video review will be unavailable")
+        self._client: Optional[httpx.AsyncClient] = None
+        self.file_cache_path = Path(file_cache_path)
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(180.0, connect=30.0),
+            )
+        return self._client
+
+    async def close(self):
+        """Close the HTTP client."""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
 
     async def review_video(
         self,
@@ -159,16 +195,13 @@ class OccyReviewer:
         Uses the Google AI Studio Files API to upload the video,
         then asks Gemini to analyze it with a structured scoring prompt.
         """
-        import httpx
-        import time
-
         # Step 1: Upload video to Google AI Files API
         file_uri = await self._upload_video(video_path)
 
         # Step 2: Send analysis request with video reference
         prompt = self._build_review_prompt(script, context)
 
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
+        url = f"{GEMINI_API_BASE}/v1beta/models/gemini-2.0-flash:generateContent"
 
         payload = {
             "contents": [{
@@ -183,30 +216,26 @@ class OccyReviewer:
             },
         }
 
-        async with httpx.AsyncClient(timeout=180) as client:
-            response = await client.post(
-                url,
-                json=payload,
-                params={"key": self._google_key},
-            )
+        client = await self._get_client()
+        response = await client.post(url, json=payload, params={"key": self._google_key})
 
-            if response.status_code != 200:
-                raise Exception(f"Gemini API error {response.status_code}: {response.text}")
+        if response.status_code != 200:
+            raise Exception(f"Gemini API error {response.status_code}: {response.text}")
 
-            result = response.json()
+        result = response.json()
 
-            # Defensive parsing — Gemini response structure can vary
-            text = None
-            for candidate in result.get("candidates", []):
-                for part in candidate.get("content", {}).get("parts", []):
-                    if "text" in part:
-                        text = part["text"]
-                        break
-                if text:
+        # Defensive parsing — Gemini response structure can vary
+        text = None
+        for candidate in result.get("candidates", []):
+            for part in candidate.get("content", {}).get("parts", []):
+                if "text" in part:
+                    text = part["text"]
                     break
+            if text:
+                break
 
-            if not text:
-                raise Exception(f"Gemini response missing text content: {result}")
+        if not text:
+            raise Exception(f"Gemini response missing text content: {result}")
 
         # Step 3: Parse the structured response
         return self._parse_review_response(text)
@@ -215,87 +244,188 @@ class OccyReviewer:
         """
         Upload video to Google AI Files API for Gemini analysis.
 
+        Reuses a still-active upload of identical content when one is cached.
         Returns the file URI to reference in the generate request.
         """
-        import httpx
+        content_hash = await asyncio.to_thread(self._content_hash, video_path)
+        cached = self._load_file_cache().get(content_hash)
+        if cached and datetime.fromisoformat(cached["uploaded_at"]) + FILE_CACHE_TTL > datetime.now():
+            if await self._file_state(cached["name"]) == "ACTIVE":
+                logger.info(f"Video already uploaded, reusing: {cached['uri']}")
+                return cached["uri"]
+
+        file_info = await self._upload_resumable(video_path)
+        file_uri = file_info["uri"]
+        file_name = file_info["name"]
 
+        # Wait for file processing
+        await self._wait_for_file_active(file_name)
+
+        file_cache = self._load_file_cache()
+        file_cache[content_hash] = {
+            "uri": file_uri,
+            "name": file_name,
+            "uploaded_at": datetime.now().isoformat(),
+        }
+        self._save_file_cache(file_cache)
+
+        logger.info(f"Video uploaded: {file_uri}")
+        return file_uri
+
+    async def _upload_resumable(self, video_path: Path) -> dict:
+        """
+        Stream the file in UPLOAD_CHUNK_SIZE chunks via the resumable protocol.
+
+        On a network error or 5xx, asks the server how much it received and
+        resumes from there. Returns the Files API file resource.
+        """
+        client = await self._get_client()
         file_size = video_path.stat().st_size
         mime_type = "video/mp4"
 
-        # Start resumable upload
-        async with httpx.AsyncClient(timeout=120) as client:
-            # Initiate upload
-            init_response = await client.post(
-                "https://generativelanguage.googleapis.com/upload/v1beta/files",
-                params={"key": self._google_key},
-                headers={
-                    "X-Goog-Upload-Protocol": "resumable",
-                    "X-Goog-Upload-Command": "start",
-                    "X-Goog-Upload-Header-Content-Length": str(file_size),
-                    "X-Goog-Upload-Header-Content-Type": mime_type,
-                    "Content-Type": "application/json",
-                },
-                json={"file": {"display_name": video_path.name}},
-            )
+        # Initiate upload
+        init_response = await client.post(
+            f"{GEMINI_API_BASE}/upload/v1beta/files",
+            params={"key": self._google_key},
+            headers={
+                "X-Goog-Upload-Protocol": "resumable",
+                "X-Goog-Upload-Command": "start",
+                "X-Goog-Upload-Header-Content-Length": str(file_size),
+                "X-Goog-Upload-Header-Content-Type": mime_type,
+                "Content-Type": "application/json",
+            },
+            json={"file": {"display_name": video_path.name}},
+        )
 
-            if init_response.status_code != 200:
-                raise Exception(f"Upload init failed: {init_response.status_code}")
-
-            upload_url = init_response.headers.get("X-Goog-Upload-URL")
-            if not upload_url:
-                raise Exception("No upload URL in response")
-
-            # Upload file content
-            with open(video_path, "rb") as f:
-                video_data = f.read()
-
-            upload_response = await client.put(
-                upload_url,
-                content=video_data,
-                headers={
-                    "X-Goog-Upload-Command": "upload, finalize",
-                    "X-Goog-Upload-Offset": "0",
-                    "Content-Length": str(file_size),
-                },
-            )
+        if init_response.status_code != 200:
+            raise Exception(f"Upload init failed: {init_response.status_code}")
 
-            if upload_response.status_code != 200:
-                raise Exception(f"Upload failed: {upload_response.status_code}")
+        upload_url = init_response.headers.get("X-Goog-Upload-URL")
+        if not upload_url:
+            raise Exception("No upload URL in response")
 
-            file_info = upload_response.json()
-            file_uri = file_info["file"]["uri"]
-            file_name = file_info["file"]["name"]
+        offset = 0
+        failures = 0
+        with open(video_path, "rb") as f:
+            while True:
+                f.seek(offset)
+                chunk = f.read(UPLOAD_CHUNK_SIZE)
+                last = offset + len(chunk) >= file_size
+                try:
+                    response = await client.put(
+                        upload_url,
+                        content=chunk,
+                        headers={
+                            "X-Goog-Upload-Command": "upload, finalize" if last else "upload",
+                            "X-Goog-Upload-Offset": str(offset),
+                        },
+                    )
+                    if response.status_code == 200:
+                        if last:
+                            return response.json()["file"]
+                        offset += len(chunk)
+                        failures = 0
+                        continue
+                    if response.status_code < 500 and response.status_code not in (408, 429):
+                        raise Exception(f"Upload failed: {response.status_code}")
+                    error = f"HTTP {response.status_code}"
+                except httpx.TransportError as e:
+                    error = str(e) or type(e).__name__
+
+                failures += 1
+                if failures > MAX_UPLOAD_RETRIES:
+                    raise Exception(f"Upload failed after {MAX_UPLOAD_RETRIES} retries: {error}")
+                await asyncio.sleep(2 ** failures)
+
+                status, received, file_info = await self._query_upload(upload_url)
+                if status == "final" and file_info:
+                    return file_info
+                if received is not None:
+                    offset = received
+                logger.warning(
+                    f"Upload chunk failed ({error}); "
+                    f"resuming from {offset}/{file_size} bytes"
+                )
 
-        # Wait for file processing
-        await self._wait_for_file_active(file_name)
+    async def _query_upload(self, upload_url: str) -> tuple[str, Optional[int], Optional[dict]]:
+        """
+        Ask the upload server how many bytes it has committed.
 
-        logger.info(f"Video uploaded: {file_uri}")
-        return file_uri
+        Returns (status, bytes_received, file resource if already finalized).
+        bytes_received is None if the server couldn't be reached.
+        """
+        client = await self._get_client()
+        try:
+            response = await client.post(
+                upload_url, headers={"X-Goog-Upload-Command": "query"}
+            )
+        except httpx.TransportError:
+            return "unknown", None, None
+
+        status = response.headers.get("X-Goog-Upload-Status", "")
+        received = int(response.headers.get("X-Goog-Upload-Size-Received", 0))
+        file_info = None
+        if status == "final":
+            try:
+                file_info = response.json().get("file")
+            except ValueError:
+                pass
+        return status, received, file_info
+
+    async def _file_state(self, file_name: str) -> Optional[str]:
+        """Processing state of an uploaded file, or None if it doesn't exist."""
+        client = await self._get_client()
+        response = await client.get(
+            f"{GEMINI_API_BASE}/v1beta/{file_name}",
+            params={"key": self._google_key},
+        )
+        if response.status_code != 200:
+            return None
+        return response.json().get("state", "")
 
     async def _wait_for_file_active(self, file_name: str, timeout: int = 120):
         """Wait for uploaded file to become ACTIVE (processed by Google)."""
-        import httpx
-        import asyncio
-
         start = datetime.now()
-        async with httpx.AsyncClient(timeout=30) as client:
-            while (datetime.now() - start).total_seconds() < timeout:
-                response = await client.get(
-                    f"https://generativelanguage.googleapis.com/v1beta/{file_name}",
-                    params={"key": self._google_key},
-                )
+        interval = 1
+        while (datetime.now() - start).total_seconds() < timeout:
+            state = await self._file_state(file_name)
+            if state == "ACTIVE":
+                return
+            elif state == "FAILED":
+                raise Exception("File processing failed")
 
-                if response.status_code == 200:
-                    state = response.json().get("state", "")
-                    if state == "ACTIVE":
-                        return
-                    elif state == "FAILED":
-                        raise Exception("File processing failed")
-
-                await asyncio.sleep(5)
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, 5)
 
         raise Exception(f"File not active after {timeout}s")
 
+    @staticmethod
+    def _content_hash(path: Path) -> str:
+        """SHA-256 of a file, read in blocks."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _load_file_cache(self) -> dict:
+        try:
+            return json.loads(self.file_cache_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_file_cache(self, file_cache: dict):
+        """Write the cache atomically, dropping expired entries."""
+        cutoff = datetime.now() - FILE_CACHE_TTL
+        file_cache = {
+            key: entry for key, entry in file_cache.items()
+            if datetime.fromisoformat(entry["uploaded_at"]) > cutoff
+        }
+        self.file_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.file_cache_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(file_cache, indent=2), encoding="utf-8")
+        tmp.replace(self.file_cache_path)
+
     def _build_review_prompt(self, script: str, context: dict) -> str:
         """Build the structured review prompt for Gemini."""
         model_used = context.get("model", "unknown")
@@ -2,16 +2,17 @@
 Operations Agent (Oprah) — Post-approval pipeline handler.
 
 Owns the entire post-approval pipeline:
-- Polling for approved content (dashboard action files)
+- Handling dashboard actions (approved content, renders, feedback)
 - Scheduling posts via ContentScheduler
 - Triggering video renders via ContentAgent
 - Executing distributions via VideoDistributor
 - Handling failures and routing feedback
 - Reporting results via Telegram notifications
 
-Design: Oprah doesn't run her own event loop. main.py's cron scheduler
-calls poll_dashboard_actions() every 30 seconds. Oprah is the handler,
-not the scheduler.
+Design: Oprah doesn't run her own event loop. The dashboard pushes typed
+actions onto core.action_queue; main.py runs the queue consumer, which
+calls handle_dashboard_action() the moment an action lands. Oprah is the
+handler, not the scheduler.
 """
 
 import asyncio
@@ -22,17 +23,18 @@ from datetime import datetime, timedelta
 from pathlib import Path
 
 from agents.checkin_log import CheckinLog
+from core.action_queue import DeadLetter
 
 logger = logging.getLogger(__name__)
 
-# Directory where dashboard writes action files for polling
+# Legacy directory for dashboard action files (imported into the action queue at startup)
 DASHBOARD_ACTIONS_DIR = Path("data/content_feedback")
 
 
 class OperationsAgent:
     """
     Operations agent that handles the post-approval pipeline.
-    Invoked by main.py's cron scheduler — does not run its own timer.
+    Invoked by main.py's action queue consumer — does not run its own timer.
     """
 
     def __init__(
@@ -63,18 +65,18 @@ class OperationsAgent:
         self.model_router = model_router
         self.david_personality = david_personality
 
-        # Ensure action directory exists
-        DASHBOARD_ACTIONS_DIR.mkdir(parents=True, exist_ok=True)
-
         # Anti-repetition log — prevents duplicate notifications
         self.checkin_log = CheckinLog()
 
+        # Approvals whose side effect is running in this process right now
+        self._active_claims: set = set()
+
         logger.info(
             f"{self.personality.name} ({self.personality.role}) initialized"
         )
 
     def start(self):
-        """No-op — main.py's cron scheduler drives polling."""
+        """No-op — main.py's action queue consumer drives dashboard actions."""
         pass
 
     async def stop(self):
@@ -82,55 +84,42 @@ class OperationsAgent:
         logger.info(f"{self.personality.name} stopping")
 
     # ------------------------------------------------------------------
-    # Pipeline polling — called by main.py cron every 30s
+    # Dashboard actions — pushed by core.action_queue
     # ------------------------------------------------------------------
 
-    async def poll_dashboard_actions(self):
+    async def handle_dashboard_action(self, action_type: str, data: dict):
         """
-        Poll for dashboard action files (schedule, render, execute, feedback).
-        Routes by filename prefix to match what the dashboard writes:
-          schedule_{id}_{ts}.json  -> _handle_schedule_request()
-          render_{id}_{ts}.json    -> _handle_render_request()
-          feedback_{id}_{ts}.json  -> _handle_content_feedback()
-          execute_{id}_{ts}.json   -> _handle_execute_request()
+        Route one dashboard action to its handler:
+          schedule -> _handle_schedule_request()
+          render   -> _handle_render_request()
+          feedback -> _handle_content_feedback()
+          execute  -> _handle_execute_request()
+
+        Exceptions propagate so the queue can retry / dead-letter the action.
+        Delivery is at-least-once, so each handler claims its approval before
+        any side effect (post, schedule, render) and skips it once done. A
+        claim left behind by a crash is resumed for renders; for posts and
+        schedules the outcome is unknown, so the action is dead-lettered and
+        the operator alerted instead.
         """
-        if self.kill_switch.is_active:
-            return
-
-        action_dir = DASHBOARD_ACTIONS_DIR
-        if not action_dir.exists():
-            return
+        if action_type == "schedule":
+            await self._handle_schedule_request(data)
+        elif action_type == "render":
+            await self._handle_render_request(data)
+        elif action_type == "feedback":
+            await self._handle_content_feedback(data)
+        elif action_type == "execute":
+            await self._handle_execute_request(data)
+        else:
+            raise ValueError(f"Unknown dashboard action: {action_type}")
 
-        for action_file in sorted(action_dir.glob("*.json")):
-            try:
-                data = json.loads(action_file.read_text(encoding="utf-8"))
-
-                if action_file.name.startswith("schedule_"):
-                    await self._handle_schedule_request(data)
-                elif action_file.name.startswith("render_"):
-                    await self._handle_render_request(data)
-                elif action_file.name.startswith("feedback_"):
-                    await self._handle_content_feedback(data)
-                elif action_file.name.startswith("execute_"):
-                    await self._handle_execute_request(data)
-                else:
-                    logger.warning(f"Unknown action file: {action_file.name}")
-
-                # Remove processed file
-                action_file.unlink()
-
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in {action_file.name}: {e}")
-                action_file.unlink()
-            except Exception as e:
-                logger.error(f"Error processing {action_file.name}: {e}")
-                self.audit_log.log(
-                    "operations", "reject", "poll",
-                    f"Failed to process {action_file.name}",
-                    details=str(e), success=False,
-                )
-                # Delete the file so it doesn't get re-processed on next poll
-                action_file.unlink(missing_ok=True)
+    def on_dead_letter(self, action_type: str, data: dict, error: str):
+        """Record a dashboard action that failed every retry."""
+        self.audit_log.log(
+            "operations", "reject", "action_queue",
+            f"Dead-lettered {action_type} #{data.get('approval_id', '?')}",
+            details=error, success=False,
+        )
 
     # ------------------------------------------------------------------
     # Action handlers
@@ -158,15 +147,23 @@ class OperationsAgent:
             action_data["action"] = content_type
             action_data["approval_id"] = approval_id
 
+        # Claim first so a redelivered action can't schedule a second post
+        if not await self._claim(approval_id, "schedule"):
+            return
+
         # Schedule via ContentScheduler
-        job_id = self.scheduler.schedule(
-            content_type=content_type,
-            content_data=action_data,
-            scheduled_time=scheduled_time,
-        )
+        try:
+            job_id = self.scheduler.schedule(
+                content_type=content_type,
+                content_data=action_data,
+                scheduled_time=scheduled_time,
+            )
+        except Exception:
+            self._release(approval_id)
+            raise
 
         # Mark as executed in approval queue (it's now scheduled)
-        self.approval_queue.mark_executed(approval_id)
+        self._complete(approval_id)
 
         logger.info(
             f"Dashboard: Scheduled {content_type} #{approval_id} for "
@@ -201,6 +198,11 @@ class OperationsAgent:
             logger.error(f"No script in render request for #{approval_id}")
             return
 
+        # Renders are paid API calls — never start a second one for the same
+        # script. One interrupted by a crash never finished, so it is resumed.
+        if not await self._claim(approval_id, "render", resume_stale=True):
+            return
+
         logger.info(f"Rendering video for approved script #{approval_id}...")
 
         await self._notify(
@@ -220,6 +222,7 @@ class OperationsAgent:
                 theme_title=data.get("theme_title"),
                 category=data.get("category"),
             )
+            self._complete(approval_id)
 
             logger.info(
                 f"Video rendered for script #{approval_id}: "
@@ -244,6 +247,7 @@ class OperationsAgent:
 
         except Exception as e:
             logger.error(f"Video render failed for script #{approval_id}: {e}")
+            self._release(approval_id)
             await self._notify(
                 f"Video render FAILED for script #{approval_id}: {e}",
                 topic="render",
@@ -255,6 +259,7 @@ class OperationsAgent:
                 f"Render failed for script #{approval_id}: {e}",
                 success=False,
             )
+            raise
 
     async def _handle_content_feedback(self, data: dict):
         """Distill rejection feedback into a permanent identity rule, rewrite content.
@@ -492,11 +497,16 @@ class OperationsAgent:
         action_type = data.get("action_type", "")
         action_data = data.get("action_data", {})
 
+        # Claim before posting, so a redelivered action (retry, crash
+        # recovery) can't post twice
+        if not await self._claim(approval_id, action_type):
+            return
+
         try:
             result = await self.execute_action(action_type, action_data)
 
             # Mark as executed in approval queue
-            self.approval_queue.mark_executed(approval_id)
+            self._complete(approval_id)
 
             logger.info(f"Dashboard: Executed {action_type} #{approval_id}: {result[:200]}")
 
@@ -509,6 +519,7 @@ class OperationsAgent:
 
         except Exception as e:
             logger.error(f"Dashboard execute failed for #{approval_id}: {e}")
+            self._release(approval_id)
             await self._notify(
                 f"Execute FAILED for {action_type} #{approval_id}: {e}",
                 topic="execute",
@@ -520,6 +531,53 @@ class OperationsAgent:
                 f"Failed {action_type} #{approval_id}: {e}",
                 success=False,
             )
+            raise
+
+    async def _claim(self, approval_id, action_type: str,
+                     resume_stale: bool = False) -> bool:
+        """
+        Claim an approval before a dashboard action's side effect.
+
+        Returns False if the action is already done or running here. A claim
+        left by an interrupted run is taken over when resume_stale is set;
+        otherwise the operator is alerted and DeadLetter is raised.
+        """
+        if approval_id is None:
+            return True
+        state = self.approval_queue.claim_execution(approval_id)
+        if state is None:
+            self._active_claims.add(approval_id)
+            return True
+        if state == "done" or approval_id in self._active_claims:
+            logger.info(f"Dashboard: {action_type} #{approval_id} already handled, skipping")
+            return False
+
+        # Claimed, but not by this process: an earlier run died mid-action
+        if resume_stale:
+            logger.warning(f"Dashboard: resuming interrupted {action_type} #{approval_id}")
+            self._active_claims.add(approval_id)
+            return True
+        await self._notify(
+            f"{action_type.title()} #{approval_id} was interrupted by a restart "
+            f"and may or may not have gone out. Not retrying — check it and "
+            f"re-trigger by hand if needed.",
+            topic=action_type,
+            action_type="failed",
+            result=f"Interrupted {action_type} #{approval_id}",
+        )
+        raise DeadLetter(f"{action_type} #{approval_id} interrupted mid-run, outcome unknown")
+
+    def _complete(self, approval_id):
+        """Mark a claimed approval executed."""
+        if approval_id is not None:
+            self.approval_queue.mark_executed(approval_id)
+            self._active_claims.discard(approval_id)
+
+    def _release(self, approval_id):
+        """Drop a claim whose side effect failed, so a retry can take it."""
+        if approval_id is not None:
+            self.approval_queue.release_execution(approval_id)
+            self._active_claims.discard(approval_id)
 
     # ------------------------------------------------------------------
     # Scheduled execution (registered with ContentScheduler)
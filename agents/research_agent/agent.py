@@ -12,11 +12,14 @@ Autonomous research agent that:
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
 import yaml
 
+from core.http_pool import close_http_client
+
 from .knowledge_store import KnowledgeStore, ResearchItem
 from .evaluator import GoalEvaluator
 from .action_router import ActionRouter
@@ -26,7 +29,7 @@ from .scrapers import (
     RSSScraper, GitHubScraper, RedditScraper, YouTubeScraper,
     TranscriptScraper, HackerNewsScraper, TwitterScraper,
     GitHubTrendingScraper, ArXivScraper, PerplexityScraper,
-    FirecrawlScraper,
+    FirecrawlScraper, ScrapeBatch,
 )
 
 if TYPE_CHECKING:
@@ -200,24 +203,18 @@ class ResearchAgent:
             "watch": 0,
             "trends": 0,
             "errors": [],
+            "source_timings": {},
         }
 
-        # 1. Scrape all sources in this set
-        all_items = []
-        for scraper in scrapers:
-            try:
-                items = await scraper.scrape()
-                all_items.extend(items)
-                logger.info(f"{scraper.name}: Found {len(items)} items")
-            except Exception as e:
-                error_msg = f"{scraper.name} failed: {e}"
-                logger.error(error_msg)
-                stats["errors"].append(error_msg)
+        # 1. Scrape all sources concurrently, deduping each batch as it lands
+        new_items = []
+        async for scraper, batch in self._fan_out(scrapers, stats):
+            stats["scraped"] += len(batch.items)
+            new_items.extend(self.store.filter_new(batch.items))
+            # Only now are the items recorded, so their feeds may return 304
+            batch.commit_validators()
 
-        stats["scraped"] = len(all_items)
-
-        # 2. Deduplicate against seen items
-        new_items = self.store.filter_new(all_items)
+        # 2. Deduplicate against seen items (done per source above)
         stats["new"] = len(new_items)
         logger.info(f"After dedup: {len(new_items)} new items")
 
@@ -261,6 +258,7 @@ class ResearchAgent:
             "alerts_sent": stats["alerts"],
             "tasks_created": stats["tasks"],
             "content_drafted": stats["content"],
+            "summary": self._format_source_timings(stats["source_timings"]),
         })
 
         # 9. Generate podcast/newsletter (daily only)
@@ -289,6 +287,75 @@ class ResearchAgent:
 
         return stats
 
+    async def _fan_out(self, scrapers: list, stats: dict):
+        """
+        Run scrapers concurrently and yield (scraper, batch) as each finishes.
+
+        Concurrency is bounded by scraping.max_concurrent_scrapers and every
+        source gets its own deadline (scraping.timeouts.<name>, falling back
+        to scraping.default_timeout_seconds). Scrapers fill a ScrapeBatch as
+        each feed / repo / channel finishes, so a source that fails or times
+        out is recorded in stats but still yields what it collected before
+        the deadline, and one slow source never holds up the rest of the tier.
+        The caller commits each batch's validators once its items are stored.
+        """
+        scrape_config = self.config.get("scraping", {})
+        limit = max(1, scrape_config.get("max_concurrent_scrapers", 6))
+        default_timeout = scrape_config.get("default_timeout_seconds", 180)
+        timeouts = scrape_config.get("timeouts", {})
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run_one(scraper):
+            timeout = timeouts.get(scraper.name, default_timeout)
+            batch = ScrapeBatch()
+            async with semaphore:
+                started = time.monotonic()
+                try:
+                    await asyncio.wait_for(scraper.scrape(batch), timeout=timeout)
+                    status = "ok"
+                except asyncio.TimeoutError:
+                    status = "timeout"
+                    error_msg = (
+                        f"{scraper.name} timed out after {timeout}s "
+                        f"(kept {len(batch.items)} items)"
+                    )
+                    logger.error(error_msg)
+                    stats["errors"].append(error_msg)
+                except Exception as e:
+                    status = "error"
+                    error_msg = f"{scraper.name} failed: {e} (kept {len(batch.items)} items)"
+                    logger.error(error_msg)
+                    stats["errors"].append(error_msg)
+                elapsed = time.monotonic() - started
+
+            stats["source_timings"][scraper.name] = {
+                "seconds": round(elapsed, 2),
+                "items": len(batch.items),
+                "status": status,
+            }
+            if status == "ok":
+                logger.info(f"{scraper.name}: Found {len(batch.items)} items in {elapsed:.1f}s")
+            return scraper, batch
+
+        tasks = [asyncio.create_task(run_one(s)) for s in scrapers]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _format_source_timings(timings: dict) -> str:
+        """One-line per-source timing summary, slowest first."""
+        parts = []
+        for name, t in sorted(timings.items(), key=lambda kv: -kv[1]["seconds"]):
+            entry = f"{name} {t['seconds']:.1f}s ({t['items']})"
+            if t["status"] != "ok":
+                entry += f" [{t['status']}]"
+            parts.append(entry)
+        return ", ".join(parts)
+
     async def _send_digest(self, stats: dict, start_time: datetime,
                            trends: list = None):
         """Send daily digest to operator via Telegram in Echo's voice."""
@@ -312,6 +379,11 @@ class ResearchAgent:
             f"Cycle time: {duration:.1f}s"
         )
 
+        timings = stats.get("source_timings", {})
+        if timings:
+            slowest = self._format_source_timings(timings).split(", ")[:3]
+            digest += f"\nSlowest sources: {', '.join(slowest)}"
+
         if stats["errors"]:
             digest += f"\n\nErrors ({len(stats['errors'])}):\n"
             for err in stats["errors"][:5]:
@@ -359,4 +431,6 @@ class ResearchAgent:
                 await scraper.close()
             except Exception as e:
                 logger.warning(f"Error closing {scraper.name}: {e}")
+        self.store.close()
+        await close_http_client()
         logger.info("Echo signing off")
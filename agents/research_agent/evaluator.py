@@ -11,12 +11,14 @@ just because it has nothing to do with surveillance.
 Uses Haiku for bulk evaluation (~$0.02/50 items).
 """
 
+import asyncio
 import json
 import logging
-from typing import List, Set
+from typing import Dict, List, Optional, Set
 
 import yaml
 
+from core.keyword_matcher import get_matcher
 from core.model_router import ModelRouter, ModelTier
 from .knowledge_store import ResearchItem
 
@@ -187,6 +189,27 @@ Content: {content}
 
 Return ONLY the category ID (e.g. "improve_architecture" or "none"). Nothing else."""
 
+# Same categories, several items per call. Used by evaluate_batch to pack
+# short zero-keyword items into one classification round trip.
+BATCH_CLASSIFIER_PROMPT = """Classify EACH numbered item below into ONE of these categories.
+
+Categories:
+- improve_architecture: AI agents, tool use, memory systems, voice assistants, MCP, autonomous systems
+- david_content: Surveillance, CBDCs, digital ID, privacy, government control, debanking
+- security_updates: Security vulnerabilities, exploits, prompt injection, breaches
+- cost_optimization: LLM costs, token efficiency, caching, optimization
+- competitor_watch: AI coding tools, agent frameworks, AI companies, new AI projects
+- claude_updates: Claude, Anthropic, new models or features from Anthropic
+- deva_gamedev: Unity, game development, Unreal, Godot, multiplayer
+- model_releases: New LLM releases, benchmarks, model comparisons
+- flipt_relevant: Crypto, Solana, NFT, marketplaces
+- none: Not relevant to any category
+
+{items}
+
+Return ONLY valid JSON mapping each item number to its category ID, e.g.
+{{"1": "improve_architecture", "2": "none"}}"""
+
 # Goals that should use the David Flip rubric
 DAVID_FLIP_GOALS = {"david_content"}
 
@@ -208,17 +231,46 @@ class GoalEvaluator:
 
     def __init__(self, model_router: ModelRouter):
         self.router = model_router
-        self.goals = self._load_goals()
+        config = self._load_config()
+        self.goals = config.get("goals", [])
+
+        # All goal keywords compiled into one matcher: keyword -> goal IDs
+        goal_keywords: Dict[str, Set[str]] = {}
+        for goal in self.goals:
+            for keyword in goal.get("keywords", []):
+                goal_keywords.setdefault(keyword.lower(), set()).add(goal["id"])
+        self.keyword_matcher = get_matcher(goal_keywords)
+
+        # Evaluation pipeline limits (see "evaluation" in research_goals.yaml)
+        eval_config = config.get("evaluation", {})
+        self.max_concurrent = max(1, eval_config.get("max_concurrent_llm_calls", 8))
+        self.classify_pack_max_chars = eval_config.get("classify_pack_max_chars", 600)
+        self._llm_slots = asyncio.Semaphore(self.max_concurrent)
 
-    def _load_goals(self) -> List[dict]:
-        """Load goals from config."""
+    def _load_config(self) -> dict:
+        """Load research config (goals + evaluation settings)."""
         try:
             with open(CONFIG_PATH, "r") as f:
-                config = yaml.safe_load(f)
-            return config.get("goals", [])
+                return yaml.safe_load(f) or {}
         except Exception as e:
             logger.error(f"Failed to load goals: {e}")
-            return []
+            return {}
+
+    async def _invoke_cheap(self, prompt: str, max_tokens: int) -> Optional[dict]:
+        """Invoke the cheap model under the evaluator's concurrency limit.
+
+        Returns the router response, or None if no cheap model is configured.
+        """
+        model = self.router.models.get(ModelTier.CHEAP)
+        if not model:
+            return None
+
+        async with self._llm_slots:
+            return await self.router.invoke(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens
+            )
 
     def _format_goals_description(self) -> str:
         """Format goals for the prompt."""
@@ -245,17 +297,11 @@ class GoalEvaluator:
         )
 
         try:
-            model = self.router.models.get(ModelTier.CHEAP)
-            if not model:
+            response = await self._invoke_cheap(prompt, max_tokens=800)
+            if response is None:
                 logger.warning("No cheap model for transcript summarization")
                 return item.content[:1500]
 
-            response = await self.router.invoke(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=800
-            )
-
             summary = response.get("content", "").strip()
             if summary:
                 logger.info(f"Summarized transcript: {item.title[:50]} ({len(item.content)} -> {len(summary)} chars)")
@@ -278,17 +324,11 @@ class GoalEvaluator:
         )
 
         try:
-            model = self.router.models.get(ModelTier.CHEAP)
-            if not model:
+            response = await self._invoke_cheap(prompt, max_tokens=500)
+            if response is None:
                 logger.error(f"No cheap model for {rubric_name} evaluation")
                 return {}
 
-            response = await self.router.invoke(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=500
-            )
-
             result = self._parse_response(response.get("content", ""))
             if result:
                 logger.debug(f"{rubric_name} score for '{item.title[:40]}': {result.get('score', 0)}")
@@ -311,44 +351,84 @@ class GoalEvaluator:
         )
 
         try:
-            model = self.router.models.get(ModelTier.CHEAP)
-            if not model:
+            response = await self._invoke_cheap(prompt, max_tokens=50)
+            if response is None:
                 return set()
 
-            response = await self.router.invoke(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=50
-            )
+            goal_ids = self._category_to_goals(response.get("content", ""))
+            if goal_ids:
+                logger.debug(f"LLM classified '{item.title[:40]}' as {next(iter(goal_ids))}")
+            return goal_ids
 
-            category = response.get("content", "").strip().lower().strip('"').strip("'")
+        except Exception as e:
+            logger.debug(f"LLM classification failed for {item.title[:40]}: {e}")
+            return set()
 
-            # Map to goal IDs
-            valid_goals = {g["id"] for g in self.goals}
-            if category in valid_goals:
-                logger.debug(f"LLM classified '{item.title[:40]}' as {category}")
-                return {category}
-            elif category == "none":
-                return set()
-            else:
-                # Try partial match
-                for goal_id in valid_goals:
-                    if goal_id in category or category in goal_id:
-                        return {goal_id}
-                return set()
+    async def _llm_classify_packed(self, items: List[ResearchItem]) -> List[Set[str]]:
+        """
+        Classify several short items in one LLM call.
+
+        Returns one goal-ID set per input item, in order. If the packed
+        response can't be parsed, falls back to per-item classification so a
+        bad batch never silently drops items.
+        """
+        if len(items) == 1:
+            return [await self._llm_classify(items[0])]
+
+        blocks = []
+        for n, item in enumerate(items, 1):
+            content = item.content[:self.classify_pack_max_chars]
+            blocks.append(f"[{n}]\nTitle: {item.title}\nContent: {content}")
+        prompt = BATCH_CLASSIFIER_PROMPT.format(items="\n\n".join(blocks))
+
+        try:
+            response = await self._invoke_cheap(prompt, max_tokens=20 * len(items) + 50)
+            if response is None:
+                return [set() for _ in items]
+
+            result = self._parse_response(response.get("content", ""))
+            if isinstance(result, dict) and result:
+                return [
+                    self._category_to_goals(str(result.get(str(n), "none")))
+                    for n in range(1, len(items) + 1)
+                ]
+            logger.debug(f"Packed classification unparseable for {len(items)} items, retrying singly")
 
         except Exception as e:
-            logger.debug(f"LLM classification failed for {item.title[:40]}: {e}")
+            logger.debug(f"Packed classification failed for {len(items)} items: {e}")
+
+        return list(await asyncio.gather(*(self._llm_classify(i) for i in items)))
+
+    def _category_to_goals(self, category: str) -> Set[str]:
+        """Map a classifier category string onto a goal-ID set."""
+        category = category.strip().lower().strip('"').strip("'")
+
+        valid_goals = {g["id"] for g in self.goals}
+        if category in valid_goals:
+            return {category}
+        elif category == "none":
+            return set()
+        else:
+            # Try partial match
+            for goal_id in valid_goals:
+                if goal_id in category or category in goal_id:
+                    return {goal_id}
             return set()
 
-    async def evaluate(self, item: ResearchItem) -> ResearchItem:
-        """Evaluate a single item against goals using dual rubrics."""
-        # Pre-filter: Check if any keywords match and which goals
-        matched_goal_ids = self._keyword_match_goals(item)
+    async def evaluate(self, item: ResearchItem,
+                       matched_goal_ids: Optional[Set[str]] = None) -> ResearchItem:
+        """Evaluate a single item against goals using dual rubrics.
 
-        # LLM fallback: if no keywords matched, try cheap LLM classification
-        if not matched_goal_ids:
-            matched_goal_ids = await self._llm_classify(item)
+        matched_goal_ids may be supplied by evaluate_batch when the goal
+        pre-filter (keywords + classifier) has already been run for the item.
+        """
+        if matched_goal_ids is None:
+            # Pre-filter: Check if any keywords match and which goals
+            matched_goal_ids = self._keyword_match_goals(item)
+
+            # LLM fallback: if no keywords matched, try cheap LLM classification
+            if not matched_goal_ids:
+                matched_goal_ids = await self._llm_classify(item)
 
         if not matched_goal_ids:
             item.relevance_score = 0
@@ -371,30 +451,26 @@ class GoalEvaluator:
         if not use_david and not use_technical:
             use_technical = True
 
-        best_result = None
-        best_score = 0
-
-        # Run David Flip rubric if surveillance/privacy goals matched
+        # Run the applicable rubrics in parallel; the HIGHER score wins
+        rubrics = []
         if use_david:
-            david_result = await self._score_with_rubric(
-                DAVID_FLIP_PROMPT, item, eval_content, "DavidFlip"
-            )
-            if david_result:
-                score = float(david_result.get("score", david_result.get("david_score", 0)))
-                if score > best_score:
-                    best_score = score
-                    best_result = david_result
-
-        # Run Technical rubric if AI/gamedev/tools goals matched
+            rubrics.append((DAVID_FLIP_PROMPT, "DavidFlip"))
         if use_technical:
-            tech_result = await self._score_with_rubric(
-                TECHNICAL_PROMPT, item, eval_content, "Technical"
-            )
-            if tech_result:
-                score = float(tech_result.get("score", 0))
+            rubrics.append((TECHNICAL_PROMPT, "Technical"))
+
+        results = await asyncio.gather(*(
+            self._score_with_rubric(template, item, eval_content, name)
+            for template, name in rubrics
+        ))
+
+        best_result = None
+        best_score = 0
+        for result in results:
+            if result:
+                score = float(result.get("score", result.get("david_score", 0)))
                 if score > best_score:
                     best_score = score
-                    best_result = tech_result
+                    best_result = result
 
         # Apply the winning result
         if best_result:
@@ -410,20 +486,61 @@ class GoalEvaluator:
 
     async def evaluate_batch(self, items: List[ResearchItem],
                              batch_size: int = 5) -> List[ResearchItem]:
-        """Evaluate multiple items efficiently."""
-        evaluated = []
+        """
+        Evaluate multiple items concurrently.
 
-        for i, item in enumerate(items):
-            try:
-                result = await self.evaluate(item)
-                evaluated.append(result)
+        1. Keyword pre-filter runs locally for every item.
+        2. Short items with no keyword hits are packed batch_size at a time
+           into a single classification prompt (batch_size=1 disables packing).
+        3. Every item is then evaluated concurrently, with both rubrics run
+           in parallel per item. All LLM calls share the evaluator's
+           max_concurrent_llm_calls limit.
 
-                if (i + 1) % 10 == 0:
-                    logger.info(f"Evaluated {i + 1}/{len(items)} items")
+        Returned items keep the input order.
+        """
+        matched: Dict[int, Set[str]] = {}
+        unmatched_short = []
+        for idx, item in enumerate(items):
+            goal_ids = self._keyword_match_goals(item)
+            if goal_ids:
+                matched[idx] = goal_ids
+            elif batch_size > 1 and len(item.content) <= self.classify_pack_max_chars:
+                unmatched_short.append(idx)
+            # Anything else falls through to evaluate()'s own classifier
+
+        if unmatched_short:
+            packs = [
+                unmatched_short[i:i + batch_size]
+                for i in range(0, len(unmatched_short), batch_size)
+            ]
+            pack_results = await asyncio.gather(*(
+                self._llm_classify_packed([items[idx] for idx in pack])
+                for pack in packs
+            ))
+            for pack, goal_sets in zip(packs, pack_results):
+                for idx, goal_ids in zip(pack, goal_sets):
+                    matched[idx] = goal_ids
+            logger.info(
+                f"Classified {len(unmatched_short)} unmatched items in {len(packs)} packed calls"
+            )
+
+        done = 0
 
+        async def run_one(idx: int, item: ResearchItem) -> ResearchItem:
+            nonlocal done
+            try:
+                result = await self.evaluate(item, matched.get(idx))
             except Exception as e:
-                logger.error(f"Error evaluating item {i}: {e}")
-                evaluated.append(item)
+                logger.error(f"Error evaluating item {idx}: {e}")
+                result = item
+            done += 1
+            if done % 10 == 0:
+                logger.info(f"Evaluated {done}/{len(items)} items")
+            return result
+
+        evaluated = list(await asyncio.gather(*(
+            run_one(idx, item) for idx, item in enumerate(items)
+        )))
 
         # Log summary
         relevant = [i for i in evaluated if i.relevance_score > 3]
@@ -437,16 +554,7 @@ class GoalEvaluator:
 
     def _keyword_match_goals(self, item: ResearchItem) -> Set[str]:
         """Return set of goal IDs whose keywords match the item."""
-        text = f"{item.title} {item.content}".lower()
-        matched = set()
-
-        for goal in self.goals:
-            for keyword in goal.get("keywords", []):
-                if keyword.lower() in text:
-                    matched.add(goal["id"])
-                    break  # One match per goal is enough
-
-        return matched
+        return self.keyword_matcher.find_values(f"{item.title} {item.content}")
 
     def _parse_response(self, content: str) -> dict:
         """Parse JSON from LLM response."""
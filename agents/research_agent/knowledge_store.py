@@ -7,6 +7,7 @@ Stores scraped items, evaluation results, and tracks what's been seen.
 import json
 import logging
 import sqlite3
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -52,6 +53,26 @@ class KnowledgeStore:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_db()
 
+        # Long-lived connection for the bulk dedup/save path
+        self._bulk_conn: Optional[sqlite3.Connection] = None
+        self._bulk_lock = threading.Lock()
+
+    def _get_bulk_conn(self) -> sqlite3.Connection:
+        """Return the reused WAL-mode connection used by bulk operations."""
+        if self._bulk_conn is None:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._bulk_conn = conn
+        return self._bulk_conn
+
+    def close(self):
+        """Close the bulk connection (per-call connections close themselves)."""
+        with self._bulk_lock:
+            if self._bulk_conn is not None:
+                self._bulk_conn.close()
+                self._bulk_conn = None
+
     def _init_db(self):
         """Initialize database tables."""
         conn = sqlite3.connect(self.db_path)
@@ -175,28 +196,66 @@ class KnowledgeStore:
         conn.close()
 
     def filter_new(self, items: List[ResearchItem]) -> List[ResearchItem]:
-        """Filter out items we've already seen."""
+        """
+        Filter out items we've already seen, marking the rest as seen.
+
+        The whole scrape is checked against seen_items in one query via a
+        temp table, and the new keys are inserted in the same transaction.
+        Duplicates within the batch itself are also dropped.
+        """
+        if not items:
+            return []
+
+        keys = list({(item.source, item.source_id) for item in items})
+
+        with self._bulk_lock:
+            conn = self._get_bulk_conn()
+            with conn:
+                conn.execute("""
+                    CREATE TEMP TABLE IF NOT EXISTS incoming_keys (
+                        source TEXT, source_id TEXT,
+                        PRIMARY KEY (source, source_id)
+                    )
+                """)
+                conn.execute("DELETE FROM incoming_keys")
+                conn.executemany(
+                    "INSERT OR IGNORE INTO incoming_keys (source, source_id) VALUES (?, ?)",
+                    keys
+                )
+                seen = set(conn.execute("""
+                    SELECT i.source, i.source_id FROM incoming_keys i
+                    JOIN seen_items s
+                      ON s.source = i.source AND s.source_id = i.source_id
+                """).fetchall())
+                conn.execute("""
+                    INSERT OR IGNORE INTO seen_items (source, source_id)
+                    SELECT source, source_id FROM incoming_keys
+                """)
+                conn.execute("DELETE FROM incoming_keys")
+
         new_items = []
         for item in items:
-            if not self.has_seen(item.source, item.source_id):
+            key = (item.source, item.source_id)
+            if key not in seen:
                 new_items.append(item)
-                self.mark_seen(item.source, item.source_id)
+                seen.add(key)  # Drop in-batch duplicates too
+
         logger.info(f"Filtered {len(items)} items to {len(new_items)} new items")
         return new_items
 
-    def save(self, item: ResearchItem) -> int:
-        """Save a research item to the database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT OR REPLACE INTO research_items (
-                source, source_id, url, title, content, summary,
-                published_at, matched_goals, relevance_score,
-                priority, suggested_action, reasoning,
-                processed, action_taken, action_id
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    _SAVE_SQL = """
+        INSERT OR REPLACE INTO research_items (
+            source, source_id, url, title, content, summary,
+            published_at, matched_goals, relevance_score,
+            priority, suggested_action, reasoning,
+            processed, action_taken, action_id
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _item_params(item: ResearchItem) -> tuple:
+        """Column values for _SAVE_SQL."""
+        return (
             item.source,
             item.source_id,
             item.url,
@@ -212,7 +271,14 @@ class KnowledgeStore:
             item.processed,
             item.action_taken,
             item.action_id
-        ))
+        )
+
+    def save(self, item: ResearchItem) -> int:
+        """Save a research item to the database."""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute(self._SAVE_SQL, self._item_params(item))
 
         item_id = cursor.lastrowid
         conn.commit()
@@ -220,9 +286,14 @@ class KnowledgeStore:
         return item_id
 
     def save_batch(self, items: List[ResearchItem]):
-        """Save multiple items efficiently."""
-        for item in items:
-            self.save(item)
+        """Save multiple items in a single transaction."""
+        if not items:
+            return
+
+        with self._bulk_lock:
+            conn = self._get_bulk_conn()
+            with conn:
+                conn.executemany(self._SAVE_SQL, [self._item_params(i) for i in items])
         logger.info(f"Saved {len(items)} research items")
 
     def get_unprocessed(self, limit: int = 100) -> List[ResearchItem]:
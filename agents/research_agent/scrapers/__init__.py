@@ -11,10 +11,11 @@ from .github_trending_scraper import GitHubTrendingScraper
 from .arxiv_scraper import ArXivScraper
 from .perplexity_scraper import PerplexityScraper
 from .firecrawl_scraper import FirecrawlScraper
+from .batch import ScrapeBatch
 
 __all__ = [
     "RSSScraper", "GitHubScraper", "RedditScraper", "YouTubeScraper",
     "TranscriptScraper", "HackerNewsScraper", "TwitterScraper",
     "GitHubTrendingScraper", "ArXivScraper", "PerplexityScraper",
-    "FirecrawlScraper",
+    "FirecrawlScraper", "ScrapeBatch",
 ]
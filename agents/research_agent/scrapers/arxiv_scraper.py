@@ -8,13 +8,16 @@ Frequency: DAILY tier.
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional, Tuple
 from xml.etree import ElementTree
 
 import httpx
 import yaml
 
+from core.http_pool import get_http_client
+
 from ..knowledge_store import ResearchItem
+from .batch import ScrapeBatch
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +33,7 @@ class ArXivScraper:
 
     def __init__(self):
         self.config = self._load_config()
-        self.client = httpx.AsyncClient(timeout=60.0)
+        self.client = get_http_client()
         self.categories = self.config.get("categories", ["cs.AI", "cs.CL", "cs.MA"])
         self.keywords = self.config.get("search_keywords", [])
         self.max_per_category = self.config.get("max_results_per_category", 20)
@@ -46,17 +49,18 @@ class ArXivScraper:
             logger.error(f"Failed to load ArXiv config: {e}")
             return {}
 
-    async def scrape(self) -> List[ResearchItem]:
+    async def scrape(self, batch: Optional[ScrapeBatch] = None) -> List[ResearchItem]:
         """Scrape ArXiv for recent relevant papers."""
         if not self.config.get("enabled", True):
             return []
 
-        items = []
+        if batch is None:
+            batch = ScrapeBatch()
+        items = batch.items
 
         for category in self.categories:
             try:
-                papers = await self._search_category(category)
-                items.extend(papers)
+                batch.add(*await self._search_category(category))
                 # ArXiv asks for 3-second delay between requests
                 await asyncio.sleep(3)
             except Exception as e:
@@ -65,8 +69,15 @@ class ArXivScraper:
         logger.info(f"ArXiv scraper found {len(items)} papers from {len(self.categories)} categories")
         return items
 
-    async def _search_category(self, category: str) -> List[ResearchItem]:
-        """Search a single ArXiv category for relevant papers."""
+    async def _search_category(
+        self, category: str
+    ) -> Tuple[List[ResearchItem], Optional[httpx.Response]]:
+        """
+        Search a single ArXiv category for relevant papers.
+
+        Returns the items plus the response to commit validators for, which
+        is None unless the search was fetched and parsed.
+        """
         items = []
 
         # Build query: category + keywords
@@ -82,7 +93,12 @@ class ArXivScraper:
         }
 
         try:
-            response = await self.client.get(ARXIV_API, params=params)
+            response = await self.client.get(
+                ARXIV_API, params=params, timeout=60.0, conditional=True
+            )
+            if response.status_code == 304:
+                logger.debug(f"ArXiv {category} unchanged since last fetch")
+                return items, None
             response.raise_for_status()
 
             root = ElementTree.fromstring(response.text)
@@ -156,6 +172,8 @@ class ArXivScraper:
                     logger.debug(f"Error parsing ArXiv entry: {e}")
                     continue
 
+            return items, response
+
         except httpx.HTTPError as e:
             logger.warning(f"ArXiv API error for {category}: {e}")
         except ElementTree.ParseError as e:
@@ -163,8 +181,8 @@ class ArXivScraper:
         except Exception as e:
             logger.error(f"Error searching ArXiv {category}: {e}")
 
-        return items
+        return items, None
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Nothing to release; the shared HTTP pool is closed by the agent."""
+        pass
@@ -0,0 +1,41 @@
+"""Per-run accumulator shared by ResearchAgent and the scrapers."""
+
+from typing import List, Optional
+
+import httpx
+
+from core.http_pool import get_http_client
+
+from ..knowledge_store import ResearchItem
+
+
+class ScrapeBatch:
+    """
+    Items one scrape() run has collected so far.
+
+    Scrapers append each feed's / repo's / channel's items to `items` as
+    soon as that unit finishes, so if the source hits its deadline
+    ResearchAgent still keeps everything collected before it.
+
+    Conditional-GET responses are added alongside the items parsed from
+    them, and their validators are only saved by commit_validators() once
+    ResearchAgent has stored those items — a feed whose items were lost is
+    refetched in full next time instead of coming back as a 304.
+    """
+
+    def __init__(self):
+        self.items: List[ResearchItem] = []
+        self.responses: List[httpx.Response] = []
+
+    def add(self, items: List[ResearchItem], response: Optional[httpx.Response] = None):
+        """Add one unit's items, with the conditional GET they were parsed from."""
+        self.items.extend(items)
+        if response is not None:
+            self.responses.append(response)
+
+    def commit_validators(self):
+        """Save the validators of every response whose items have been stored."""
+        client = get_http_client()
+        for response in self.responses:
+            client.commit(response)
+        self.responses.clear()
@@ -11,12 +11,14 @@ import hashlib
 import logging
 import os
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
-import httpx
 import yaml
 
+from core.http_pool import get_http_client
+
 from ..knowledge_store import ResearchItem
+from .batch import ScrapeBatch
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +35,7 @@ class FirecrawlScraper:
     def __init__(self):
         self.config = self._load_config()
         self.api_key = os.getenv("FIRECRAWL_API_KEY", "")
-        self.client = httpx.AsyncClient(timeout=60.0)
+        self.client = get_http_client()
         self.max_pages = self.config.get("max_pages_per_site", 10)
 
     def _load_config(self) -> dict:
@@ -46,7 +48,7 @@ class FirecrawlScraper:
             logger.error(f"Failed to load Firecrawl config: {e}")
             return {}
 
-    async def scrape(self) -> List[ResearchItem]:
+    async def scrape(self, batch: Optional[ScrapeBatch] = None) -> List[ResearchItem]:
         """Crawl all configured target URLs."""
         if not self.config.get("enabled", True):
             return []
@@ -60,7 +62,7 @@ class FirecrawlScraper:
             logger.warning("No Firecrawl target URLs configured")
             return []
 
-        items = []
+        items = batch.items if batch is not None else []
 
         for target in targets:
             url = target.get("url", "")
@@ -109,7 +111,7 @@ class FirecrawlScraper:
         }
 
         response = await self.client.post(
-            f"{FIRECRAWL_API}/crawl", json=payload, headers=headers
+            f"{FIRECRAWL_API}/crawl", json=payload, headers=headers, timeout=60.0
         )
         response.raise_for_status()
         data = response.json()
@@ -127,7 +129,7 @@ class FirecrawlScraper:
         for i in range(max_polls):
             await asyncio.sleep(10)
 
-            poll_response = await self.client.get(poll_url, headers=headers)
+            poll_response = await self.client.get(poll_url, headers=headers, timeout=60.0)
             poll_response.raise_for_status()
             poll_data = poll_response.json()
 
@@ -164,5 +166,5 @@ class FirecrawlScraper:
         return pages
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Nothing to release; the shared HTTP pool is closed by the agent."""
+        pass
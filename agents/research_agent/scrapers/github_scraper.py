@@ -5,12 +5,15 @@ GitHub Scraper - Monitors repositories for releases, commits, and updates.
 import logging
 import os
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional, Tuple
 
 import httpx
 import yaml
 
+from core.http_pool import get_http_client
+
 from ..knowledge_store import ResearchItem
+from .batch import ScrapeBatch
 
 logger = logging.getLogger(__name__)
 
@@ -25,14 +28,10 @@ class GitHubScraper:
     def __init__(self):
         self.config = self._load_config()
         self.token = os.environ.get("GITHUB_TOKEN", "")
-        self.client = httpx.AsyncClient(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={
-                "Accept": "application/vnd.github.v3+json",
-                "Authorization": f"token {self.token}" if self.token else "",
-            }
-        )
+        self.client = get_http_client()
+        self.headers = {"Accept": "application/vnd.github.v3+json"}
+        if self.token:
+            self.headers["Authorization"] = f"token {self.token}"
 
     def _load_config(self) -> dict:
         """Load GitHub configuration."""
@@ -44,9 +43,11 @@ class GitHubScraper:
             logger.error(f"Failed to load GitHub config: {e}")
             return {}
 
-    async def scrape(self) -> List[ResearchItem]:
+    async def scrape(self, batch: Optional[ScrapeBatch] = None) -> List[ResearchItem]:
         """Scrape all configured GitHub repos."""
-        items = []
+        if batch is None:
+            batch = ScrapeBatch()
+        items = batch.items
         repos = self.config.get("repos", [])
         check_releases = self.config.get("check_releases", True)
         check_commits = self.config.get("check_commits", True)
@@ -54,8 +55,7 @@ class GitHubScraper:
         for repo in repos:
             try:
                 if check_releases:
-                    releases = await self._get_releases(repo)
-                    items.extend(releases)
+                    batch.add(*await self._get_releases(repo))
 
                 if check_commits:
                     commits = await self._get_recent_commits(repo)
@@ -67,17 +67,31 @@ class GitHubScraper:
         logger.info(f"GitHub scraper found {len(items)} items from {len(repos)} repos")
         return items
 
-    async def _get_releases(self, repo: str, limit: int = 5) -> List[ResearchItem]:
-        """Get recent releases from a repository."""
+    async def _get_releases(
+        self, repo: str, limit: int = 5
+    ) -> Tuple[List[ResearchItem], Optional[httpx.Response]]:
+        """
+        Get recent releases from a repository.
+
+        Returns the items plus the response to commit validators for, which
+        is None unless the releases were fetched and parsed.
+        """
         items = []
         url = f"https://api.github.com/repos/{repo}/releases"
 
         try:
-            response = await self.client.get(url, params={"per_page": limit})
+            # Conditional GET: a 304 doesn't count against the rate limit
+            response = await self.client.get(
+                url, params={"per_page": limit}, headers=self.headers, conditional=True
+            )
+
+            if response.status_code == 304:
+                logger.debug(f"No new releases for {repo}")
+                return items, None
 
             if response.status_code == 404:
                 logger.debug(f"No releases found for {repo}")
-                return items
+                return items, None
 
             response.raise_for_status()
             releases = response.json()
@@ -97,13 +111,14 @@ class GitHubScraper:
                     content=body[:2000] if body else f"New release {name} for {repo}",
                     published_at=self._parse_date(published)
                 ))
+            return items, response
 
         except httpx.HTTPError as e:
             logger.warning(f"HTTP error getting releases for {repo}: {e}")
         except Exception as e:
             logger.error(f"Error getting releases for {repo}: {e}")
 
-        return items
+        return items, None
 
     async def _get_recent_commits(self, repo: str, days: int = 1) -> List[ResearchItem]:
         """Get commits from the last N days."""
@@ -115,7 +130,7 @@ class GitHubScraper:
             response = await self.client.get(url, params={
                 "since": since,
                 "per_page": 20
-            })
+            }, headers=self.headers)
 
             if response.status_code == 404:
                 logger.debug(f"Repo not found: {repo}")
@@ -169,5 +184,5 @@ class GitHubScraper:
             return None
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Nothing to release; the shared HTTP pool is closed by the agent."""
+        pass
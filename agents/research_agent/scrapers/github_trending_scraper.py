@@ -8,12 +8,15 @@ Frequency: WARM tier (every 8-12 hours).
 import logging
 import re
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 import httpx
 import yaml
 
+from core.http_pool import get_http_client
+
 from ..knowledge_store import ResearchItem
+from .batch import ScrapeBatch
 
 logger = logging.getLogger(__name__)
 
@@ -28,13 +31,11 @@ class GitHubTrendingScraper:
 
     def __init__(self):
         self.config = self._load_config()
-        self.client = httpx.AsyncClient(
-            timeout=30.0,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                              "AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
-            }
-        )
+        self.client = get_http_client()
+        self.headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                          "AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
+        }
         self.keywords = [k.lower() for k in self.config.get("relevance_keywords", [])]
         self.min_stars = self.config.get("min_stars_today", 50)
 
@@ -48,12 +49,12 @@ class GitHubTrendingScraper:
             logger.error(f"Failed to load GitHub Trending config: {e}")
             return {}
 
-    async def scrape(self) -> List[ResearchItem]:
+    async def scrape(self, batch: Optional[ScrapeBatch] = None) -> List[ResearchItem]:
         """Scrape GitHub trending pages for relevant repos."""
         if not self.config.get("enabled", True):
             return []
 
-        items = []
+        items = batch.items if batch is not None else []
         seen_repos = set()
         languages = self.config.get("languages", ["", "python", "typescript"])
 
@@ -74,7 +75,7 @@ class GitHubTrendingScraper:
         url = f"https://github.com/trending/{language}" if language else "https://github.com/trending"
 
         try:
-            response = await self.client.get(url)
+            response = await self.client.get(url, headers=self.headers)
             if response.status_code != 200:
                 logger.warning(f"GitHub trending returned {response.status_code}")
                 return items
@@ -189,5 +190,5 @@ class GitHubTrendingScraper:
         return repos
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Nothing to release; the shared HTTP pool is closed by the agent."""
+        pass
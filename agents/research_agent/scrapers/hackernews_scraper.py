@@ -8,12 +8,15 @@ Frequency: HOT tier (every 2-4 hours).
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 
 import httpx
 import yaml
 
+from core.http_pool import get_http_client
+
 from ..knowledge_store import ResearchItem
+from .batch import ScrapeBatch
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +32,7 @@ class HackerNewsScraper:
 
     def __init__(self):
         self.config = self._load_config()
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = get_http_client()
         self.max_stories = self.config.get("max_stories", 30)
         self.min_score = self.config.get("min_score", 20)
         self.keywords = [k.lower() for k in self.config.get("keywords", [])]
@@ -44,12 +47,13 @@ class HackerNewsScraper:
             logger.error(f"Failed to load HN config: {e}")
             return {}
 
-    async def scrape(self) -> List[ResearchItem]:
+    async def scrape(self, batch: Optional[ScrapeBatch] = None) -> List[ResearchItem]:
         """Scrape top HN stories, filtered by relevance."""
         if not self.config.get("enabled", True):
             return []
 
-        items = []
+        items = batch.items if batch is not None else []
+        tasks = []
 
         try:
             # Get top story IDs
@@ -60,16 +64,12 @@ class HackerNewsScraper:
             # Fetch each story (in batches to be polite)
             cutoff = datetime.utcnow() - timedelta(hours=24)
 
-            tasks = [self._fetch_story(sid) for sid in story_ids]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for result in results:
-                if isinstance(result, Exception):
+            # Handle stories as they arrive, so a deadline keeps the finished ones
+            tasks = [asyncio.ensure_future(self._fetch_story(sid)) for sid in story_ids]
+            for next_story in asyncio.as_completed(tasks):
+                story = await next_story
+                if story is None:
                     continue
-                if result is None:
-                    continue
-
-                story = result
 
                 # Filter: must be a story (not job/poll)
                 if story.get("type") != "story":
@@ -118,6 +118,9 @@ class HackerNewsScraper:
             logger.warning(f"HN API error: {e}")
         except Exception as e:
             logger.error(f"HN scraper error: {e}")
+        finally:
+            for task in tasks:
+                task.cancel()
 
         logger.info(f"HN scraper found {len(items)} relevant stories")
         return items
@@ -135,5 +138,5 @@ class HackerNewsScraper:
             return None
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Nothing to release; the shared HTTP pool is closed by the agent."""
+        pass
@@ -10,12 +10,14 @@ import hashlib
 import logging
 import os
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
-import httpx
 import yaml
 
+from core.http_pool import get_http_client
+
 from ..knowledge_store import ResearchItem
+from .batch import ScrapeBatch
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +35,7 @@ class PerplexityScraper:
     def __init__(self):
         self.config = self._load_config()
         self.api_key = os.getenv("OPENROUTER_API_KEY", "")
-        self.client = httpx.AsyncClient(timeout=120.0)
+        self.client = get_http_client()
 
     def _load_config(self) -> dict:
         """Load Perplexity configuration."""
@@ -45,7 +47,7 @@ class PerplexityScraper:
             logger.error(f"Failed to load Perplexity config: {e}")
             return {}
 
-    async def scrape(self) -> List[ResearchItem]:
+    async def scrape(self, batch: Optional[ScrapeBatch] = None) -> List[ResearchItem]:
         """Run all configured search queries through Perplexity Sonar Pro."""
         if not self.config.get("enabled", True):
             return []
@@ -59,7 +61,7 @@ class PerplexityScraper:
             logger.warning("No Perplexity queries configured")
             return []
 
-        items = []
+        items = batch.items if batch is not None else []
 
         for entry in queries:
             query = entry.get("query", "")
@@ -99,7 +101,9 @@ class PerplexityScraper:
             ],
         }
 
-        response = await self.client.post(OPENROUTER_API, json=payload, headers=headers)
+        response = await self.client.post(
+            OPENROUTER_API, json=payload, headers=headers, timeout=120.0
+        )
         response.raise_for_status()
 
         data = response.json()
@@ -111,5 +115,5 @@ class PerplexityScraper:
         return ""
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Nothing to release; the shared HTTP pool is closed by the agent."""
+        pass
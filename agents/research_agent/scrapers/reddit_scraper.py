@@ -6,12 +6,15 @@ Uses Reddit's public JSON API (no auth needed for reading).
 
 import logging
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 import httpx
 import yaml
 
+from core.http_pool import get_http_client
+
 from ..knowledge_store import ResearchItem
+from .batch import ScrapeBatch
 
 logger = logging.getLogger(__name__)
 
@@ -25,12 +28,10 @@ class RedditScraper:
 
     def __init__(self):
         self.subreddits = self._load_subreddits()
-        self.client = httpx.AsyncClient(
-            timeout=30.0,
-            headers={
-                "User-Agent": "DavidFlipResearchAgent/1.0 (Research bot for AI agent project)"
-            }
-        )
+        self.client = get_http_client()
+        self.headers = {
+            "User-Agent": "DavidFlipResearchAgent/1.0 (Research bot for AI agent project)"
+        }
 
     def _load_subreddits(self) -> List[str]:
         """Load subreddit configuration."""
@@ -42,9 +43,9 @@ class RedditScraper:
             logger.error(f"Failed to load Reddit config: {e}")
             return []
 
-    async def scrape(self) -> List[ResearchItem]:
+    async def scrape(self, batch: Optional[ScrapeBatch] = None) -> List[ResearchItem]:
         """Scrape all configured subreddits."""
-        items = []
+        items = batch.items if batch is not None else []
 
         for subreddit in self.subreddits:
             try:
@@ -65,7 +66,7 @@ class RedditScraper:
             response = await self.client.get(url, params={
                 "limit": limit,
                 "raw_json": 1
-            })
+            }, headers=self.headers)
 
             if response.status_code == 403:
                 logger.warning(f"r/{subreddit} is private or banned")
@@ -121,5 +122,5 @@ class RedditScraper:
         return items
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Nothing to release; the shared HTTP pool is closed by the agent."""
+        pass
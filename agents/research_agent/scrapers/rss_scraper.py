@@ -5,13 +5,16 @@ RSS Feed Scraper - Monitors news feeds for relevant content.
 import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional, Tuple
 from xml.etree import ElementTree
 
 import httpx
 import yaml
 
+from core.http_pool import get_http_client
+
 from ..knowledge_store import ResearchItem
+from .batch import ScrapeBatch
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +29,7 @@ class RSSScraper:
 
     def __init__(self):
         self.feeds = self._load_feeds()
-        self.client = httpx.AsyncClient(timeout=30.0, follow_redirects=True)
+        self.client = get_http_client()
 
     def _load_feeds(self) -> List[dict]:
         """Load RSS feed configuration."""
@@ -38,33 +41,46 @@ class RSSScraper:
             logger.error(f"Failed to load RSS config: {e}")
             return []
 
-    async def scrape(self) -> List[ResearchItem]:
+    async def scrape(self, batch: Optional[ScrapeBatch] = None) -> List[ResearchItem]:
         """Scrape all configured RSS feeds."""
-        items = []
+        if batch is None:
+            batch = ScrapeBatch()
+        items = batch.items
 
-        tasks = [self._scrape_feed(feed) for feed in self.feeds]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"RSS scrape error: {result}")
-            else:
-                items.extend(result)
+        # Collect each feed as it lands, so a deadline keeps the finished ones
+        tasks = [asyncio.ensure_future(self._scrape_feed(feed)) for feed in self.feeds]
+        try:
+            for next_feed in asyncio.as_completed(tasks):
+                try:
+                    batch.add(*await next_feed)
+                except Exception as e:
+                    logger.error(f"RSS scrape error: {e}")
+        finally:
+            for task in tasks:
+                task.cancel()
 
         logger.info(f"RSS scraper found {len(items)} items from {len(self.feeds)} feeds")
         return items
 
-    async def _scrape_feed(self, feed: dict) -> List[ResearchItem]:
-        """Scrape a single RSS feed."""
+    async def _scrape_feed(self, feed: dict) -> Tuple[List[ResearchItem], Optional[httpx.Response]]:
+        """
+        Scrape a single RSS feed.
+
+        Returns the items plus the response to commit validators for, which
+        is None unless the feed was fetched and parsed.
+        """
         items = []
         feed_name = feed.get("name", "Unknown")
         feed_url = feed.get("url", "")
 
         if not feed_url:
-            return items
+            return items, None
 
         try:
-            response = await self.client.get(feed_url)
+            response = await self.client.get(feed_url, conditional=True)
+            if response.status_code == 304:
+                logger.debug(f"{feed_name} unchanged since last fetch")
+                return items, None
             response.raise_for_status()
 
             # Parse XML
@@ -80,6 +96,7 @@ class RSSScraper:
                 items = self._parse_rss(root, feed_name)
 
             logger.debug(f"Scraped {len(items)} items from {feed_name}")
+            return items, response
 
         except httpx.HTTPError as e:
             logger.warning(f"HTTP error fetching {feed_name}: {e}")
@@ -88,7 +105,7 @@ class RSSScraper:
         except Exception as e:
             logger.error(f"Error scraping {feed_name}: {e}")
 
-        return items
+        return items, None
 
     def _parse_rss(self, root: ElementTree.Element, source_name: str) -> List[ResearchItem]:
         """Parse RSS 2.0 format."""
@@ -219,5 +236,5 @@ class RSSScraper:
         return clean[:2000]  # Limit length
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Nothing to release; the shared HTTP pool is closed by the agent."""
+        pass
@@ -13,13 +13,16 @@ import logging
 import os
 import json
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from xml.etree import ElementTree
 
 import httpx
 import yaml
 
+from core.http_pool import get_http_client
+
 from ..knowledge_store import ResearchItem
+from .batch import ScrapeBatch
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +39,7 @@ class TranscriptScraper:
 
     def __init__(self):
         self.config = self._load_config()
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = get_http_client()
         self.channel_cache = self._load_channel_cache()
         self.delay = self.config.get("delay_between_fetches", 5)
         self.max_length = self.config.get("max_transcript_length", 15000)
@@ -75,16 +78,17 @@ class TranscriptScraper:
         except Exception as e:
             logger.warning(f"Failed to save channel cache: {e}")
 
-    async def scrape(self) -> List[ResearchItem]:
+    async def scrape(self, batch: Optional[ScrapeBatch] = None) -> List[ResearchItem]:
         """Scrape transcripts from all configured sources."""
-        items = []
+        if batch is None:
+            batch = ScrapeBatch()
+        items = batch.items
 
         # YouTube transcripts
         youtube_channels = self.config.get("youtube_channels", [])
         for channel in youtube_channels:
             try:
-                channel_items = await self._scrape_youtube_channel(channel)
-                items.extend(channel_items)
+                batch.add(*await self._scrape_youtube_channel(channel))
             except Exception as e:
                 logger.error(f"Error scraping transcripts for {channel}: {e}")
 
@@ -103,8 +107,16 @@ class TranscriptScraper:
 
     # ==================== YOUTUBE ====================
 
-    async def _scrape_youtube_channel(self, channel_handle: str) -> List[ResearchItem]:
-        """Get transcripts from recent videos on a YouTube channel."""
+    async def _scrape_youtube_channel(
+        self, channel_handle: str
+    ) -> Tuple[List[ResearchItem], Optional[httpx.Response]]:
+        """
+        Get transcripts from recent videos on a YouTube channel.
+
+        Returns the items plus the channel feed response to commit validators
+        for, which is None unless every video's transcript was fetched —
+        otherwise a 304 next run would skip the videos that failed.
+        """
         items = []
         handle = channel_handle.lstrip("@")
 
@@ -112,10 +124,10 @@ class TranscriptScraper:
         channel_id = await self._resolve_channel_id(handle)
         if not channel_id:
             logger.warning(f"Could not resolve channel ID for @{handle}")
-            return items
+            return items, None
 
         # Get recent video IDs from RSS feed (free, no API key)
-        video_entries = await self._get_channel_videos_via_rss(channel_id, handle)
+        video_entries, response = await self._get_channel_videos_via_rss(channel_id, handle)
 
         # Fetch transcript for each new video
         for video_id, title, published in video_entries:
@@ -134,14 +146,18 @@ class TranscriptScraper:
                         content=transcript_text,
                         published_at=published
                     ))
+                else:
+                    # Unavailable or failed; don't let a 304 skip it next run
+                    response = None
 
                 # Throttle to avoid YouTube blocking
                 await asyncio.sleep(self.delay)
 
             except Exception as e:
                 logger.warning(f"Failed to get transcript for {video_id}: {e}")
+                response = None
 
-        return items
+        return items, response
 
     async def _resolve_channel_id(self, handle: str) -> Optional[str]:
         """Resolve a YouTube @handle to a channel ID. Uses cache."""
@@ -190,20 +206,24 @@ class TranscriptScraper:
 
     async def _get_channel_videos_via_rss(
         self, channel_id: str, handle: str, max_age_days: int = 7
-    ) -> List[tuple]:
+    ) -> Tuple[List[tuple], Optional[httpx.Response]]:
         """
         Get recent videos from a channel's RSS feed.
-        Returns list of (video_id, title, published_datetime) tuples.
+        Returns list of (video_id, title, published_datetime) tuples, plus
+        the feed response if it was fetched and parsed (else None).
         Free, no API key, no quota limits.
         """
         videos = []
         rss_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
 
         try:
-            response = await self.client.get(rss_url)
+            response = await self.client.get(rss_url, conditional=True)
+            if response.status_code == 304:
+                logger.debug(f"No new videos for @{handle}")
+                return videos, None
             if response.status_code != 200:
                 logger.warning(f"RSS feed returned {response.status_code} for @{handle}")
-                return videos
+                return videos, None
 
             # Parse Atom feed
             root = ElementTree.fromstring(response.text)
@@ -238,9 +258,10 @@ class TranscriptScraper:
 
         except Exception as e:
             logger.error(f"Error fetching RSS for @{handle}: {e}")
+            return videos, None
 
         logger.debug(f"RSS: @{handle} has {len(videos)} recent videos")
-        return videos
+        return videos, response
 
     async def _fetch_youtube_transcript(self, video_id: str) -> Optional[str]:
         """
@@ -321,5 +342,5 @@ class TranscriptScraper:
         return None
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Nothing to release; the shared HTTP pool is closed by the agent."""
+        pass
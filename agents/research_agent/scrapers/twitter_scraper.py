@@ -10,11 +10,12 @@ Requires TWITTER_BEARER_TOKEN in environment.
 import logging
 import os
 from datetime import datetime, timedelta, timezone
-from typing import List
+from typing import List, Optional
 
 import yaml
 
 from ..knowledge_store import ResearchItem
+from .batch import ScrapeBatch
 
 logger = logging.getLogger(__name__)
 
@@ -63,7 +64,7 @@ class TwitterScraper:
             logger.error(f"Failed to initialize tweepy: {e}")
             self.client = None
 
-    async def scrape(self) -> List[ResearchItem]:
+    async def scrape(self, batch: Optional[ScrapeBatch] = None) -> List[ResearchItem]:
         """Scrape recent tweets from monitored accounts."""
         if not self.config.get("enabled", True):
             return []
@@ -71,7 +72,7 @@ class TwitterScraper:
         if not self.client:
             return []
 
-        items = []
+        items = batch.items if batch is not None else []
         accounts = self.config.get("accounts", [])
         max_per_account = self.config.get("max_tweets_per_account", 10)
         min_engagement = self.config.get("min_engagement", 10)
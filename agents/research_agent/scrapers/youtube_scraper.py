@@ -7,12 +7,15 @@ Uses YouTube Data API v3. Requires YOUTUBE_API_KEY environment variable.
 import logging
 import os
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional, Tuple
 
 import httpx
 import yaml
 
+from core.http_pool import get_http_client
+
 from ..knowledge_store import ResearchItem
+from .batch import ScrapeBatch
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +30,7 @@ class YouTubeScraper:
     def __init__(self):
         self.config = self._load_config()
         self.api_key = os.environ.get("YOUTUBE_API_KEY", "")
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = get_http_client()
 
         if not self.api_key:
             logger.warning("YOUTUBE_API_KEY not set - YouTube scraper disabled")
@@ -42,20 +45,21 @@ class YouTubeScraper:
             logger.error(f"Failed to load YouTube config: {e}")
             return {}
 
-    async def scrape(self) -> List[ResearchItem]:
+    async def scrape(self, batch: Optional[ScrapeBatch] = None) -> List[ResearchItem]:
         """Scrape all configured YouTube channels."""
         if not self.api_key:
             return []
 
-        items = []
+        if batch is None:
+            batch = ScrapeBatch()
+        items = batch.items
         channels = self.config.get("channels", [])
 
         for channel_handle in channels:
             try:
                 # Remove @ prefix if present
                 handle = channel_handle.lstrip("@")
-                videos = await self._get_recent_videos(handle)
-                items.extend(videos)
+                batch.add(*await self._get_recent_videos(handle))
             except Exception as e:
                 logger.error(f"Error scraping YouTube channel {channel_handle}: {e}")
 
@@ -84,22 +88,29 @@ class YouTubeScraper:
 
         return ""
 
-    async def _get_recent_videos(self, handle: str, max_results: int = 5) -> List[ResearchItem]:
-        """Get recent videos from a channel."""
+    async def _get_recent_videos(
+        self, handle: str, max_results: int = 5
+    ) -> Tuple[List[ResearchItem], Optional[httpx.Response]]:
+        """
+        Get recent videos from a channel.
+
+        Returns the items plus the response to commit validators for, which
+        is None unless the uploads playlist was fetched and parsed.
+        """
         items = []
 
         # First get channel ID from handle
         channel_id = await self._get_channel_id(handle)
         if not channel_id:
             logger.warning(f"Could not find channel ID for @{handle}")
-            return items
+            return items, None
 
         # Get uploads playlist (it's UC + channel_id with UU prefix)
         uploads_playlist = "UU" + channel_id[2:] if channel_id.startswith("UC") else None
 
         if not uploads_playlist:
             # Fallback to search
-            return await self._search_channel_videos(channel_id, handle, max_results)
+            return await self._search_channel_videos(channel_id, handle, max_results), None
 
         # Get playlist items
         url = "https://www.googleapis.com/youtube/v3/playlistItems"
@@ -111,7 +122,10 @@ class YouTubeScraper:
         }
 
         try:
-            response = await self.client.get(url, params=params)
+            response = await self.client.get(url, params=params, conditional=True)
+            if response.status_code == 304:
+                logger.debug(f"No new uploads for @{handle}")
+                return items, None
             response.raise_for_status()
             data = response.json()
 
@@ -140,13 +154,14 @@ class YouTubeScraper:
                         content=description[:2000] if description else f"New video from {channel_title}",
                         published_at=pub_date
                     ))
+            return items, response
 
         except httpx.HTTPError as e:
             logger.warning(f"HTTP error getting videos for @{handle}: {e}")
         except Exception as e:
             logger.error(f"Error getting videos for @{handle}: {e}")
 
-        return items
+        return items, None
 
     async def _search_channel_videos(self, channel_id: str, handle: str, max_results: int = 5) -> List[ResearchItem]:
         """Fallback: Search for recent videos from a channel."""
@@ -206,5 +221,5 @@ class YouTubeScraper:
             return None
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Nothing to release; the shared HTTP pool is closed by the agent."""
+        pass
@@ -12,6 +12,8 @@ from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Set, Tuple
 
+from core.keyword_matcher import get_matcher
+
 from .knowledge_store import ResearchItem
 
 logger = logging.getLogger(__name__)
@@ -81,6 +83,7 @@ class TrendDetector:
 
     def __init__(self, similarity_threshold: float = 0.3):
         self.similarity_threshold = similarity_threshold
+        self.entity_matcher = get_matcher(KNOWN_ENTITIES)
 
     def detect_trends(self, items: List[ResearchItem],
                       time_window_hours: int = 24) -> List[dict]:
@@ -213,13 +216,8 @@ class TrendDetector:
 
         Returns set of canonical entity names found in the text.
         """
-        entities = set()
-        text_lower = text.lower()
-
-        # Check for known entities first (most reliable)
-        for pattern, canonical in KNOWN_ENTITIES.items():
-            if pattern in text_lower:
-                entities.add(canonical)
+        # Check for known entities first (most reliable) - one automaton pass
+        entities = self.entity_matcher.find_values(text)
 
         # Also extract significant words (2+ chars, not stop words)
         words = re.findall(r'[a-zA-Z][a-zA-Z0-9_.-]+', text)
@@ -4,13 +4,23 @@ Comic Pipeline — Image Generator.
 Generates comic panel images using Flux Kontext Pro via fal.ai REST API.
 Uses queue-based async flow: submit → poll → fetch.
 
-Sequential generation: Panel 1's output is used as character reference
-for Panel 2+, maintaining visual consistency across panels.
+Two generation modes:
+- sequential (default): each panel uses the previous panel's output as its
+  character reference, maintaining visual consistency across panels.
+- anchor: the first panel (or the supplied reference) becomes a single
+  anchor reference, and every remaining panel is generated concurrently
+  against it. Total time is roughly two generation cycles instead of N.
+
+Mode and in-flight limit come from FLUX_GENERATION_MODE and
+FLUX_MAX_IN_FLIGHT, or per call via generate_panels(mode=...).
 """
 
 import asyncio
+import base64
+import hashlib
 import logging
 import os
+import random
 import tempfile
 from pathlib import Path
 from typing import Optional
@@ -18,6 +28,7 @@ from typing import Optional
 import httpx
 
 from comic_pipeline.models import ComicProject, Panel
+from core.asset_cache import data_uri, get_asset_cache
 
 logger = logging.getLogger(__name__)
 
@@ -32,15 +43,32 @@ COST_PER_IMAGE = 0.04
 PANEL_WIDTH = 1024
 PANEL_HEIGHT = 1024
 
+GENERATION_MODES = ("sequential", "anchor")
+GENERATION_MODE = os.environ.get("FLUX_GENERATION_MODE", "sequential")
+
+# Concurrent fal.ai requests in anchor mode
+MAX_IN_FLIGHT = int(os.environ.get("FLUX_MAX_IN_FLIGHT", "4"))
+
 
 class FluxImageGenerator:
     """Generates comic panel images via Flux Kontext Pro on fal.ai."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        mode: str = GENERATION_MODE,
+        max_in_flight: int = MAX_IN_FLIGHT,
+    ):
         self.api_key = api_key or os.environ.get("FAL_API_KEY", "")
         if not self.api_key:
             logger.warning("FAL_API_KEY not set — image generation will fail")
+        self.mode = mode
+        self.max_in_flight = max(1, max_in_flight)
+        # Reference used by the last anchor-mode run; ImageJudge regenerates
+        # flagged panels against it so retries stay on-model
+        self.anchor_image_url: Optional[str] = None
         self._client: Optional[httpx.AsyncClient] = None
+        self.asset_cache = get_asset_cache()
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -64,53 +92,157 @@ class FluxImageGenerator:
         project: ComicProject,
         output_dir: str,
         reference_image_url: Optional[str] = None,
+        mode: Optional[str] = None,
+        regenerate: bool = False,
     ) -> ComicProject:
         """
         Generate images for all panels in a project.
 
-        Sequential generation: each panel uses the previous panel's image
-        as a character reference for Flux Kontext, maintaining consistency.
+        Sequential mode: each panel uses the previous panel's image as a
+        character reference for Flux Kontext, maintaining consistency.
+        Anchor mode: one anchor reference, then all other panels in parallel.
 
         Args:
             project: ComicProject with panels that have image_prompts
             output_dir: Directory to save generated images
             reference_image_url: Optional initial character reference image URL
+            mode: "sequential" or "anchor" (defaults to self.mode)
+            regenerate: Use a fresh random seed instead of any cached image
 
         Returns:
             Updated ComicProject with image_path set on each panel
         """
+        mode = mode or self.mode
+        if mode not in GENERATION_MODES:
+            raise ValueError(f"Unknown generation mode: {mode} (expected one of {GENERATION_MODES})")
         Path(output_dir).mkdir(parents=True, exist_ok=True)
-        prev_image_url = reference_image_url
 
-        for i, panel in enumerate(project.panels):
-            logger.info(f"Generating panel {panel.panel_number}/{len(project.panels)}: "
-                        f"{panel.image_prompt[:60]}...")
+        reference = self._reference(reference_image_url) if reference_image_url else None
+
+        if mode == "anchor":
+            return await self._generate_anchored(project, output_dir, reference, regenerate)
+
+        for panel in project.panels:
+            generated = await self._generate_panel(
+                project, panel, output_dir, reference, regenerate
+            )
+            if generated:
+                reference = generated  # Use as reference for next panel
+
+        return project
+
+    async def _generate_anchored(
+        self,
+        project: ComicProject,
+        output_dir: str,
+        reference: Optional[tuple[str, str]] = None,
+        regenerate: bool = False,
+    ) -> ComicProject:
+        """
+        Anchor mode: settle on one reference, then fan out.
+
+        Without a supplied reference, panels are tried in order until one
+        generates; its image becomes the anchor for all the others.
+        """
+        anchor = reference
+        remaining = list(project.panels)
+        while anchor is None and remaining:
+            panel = remaining.pop(0)
+            anchor = await self._generate_panel(project, panel, output_dir, None, regenerate)
+
+        self.anchor_image_url = anchor[0] if anchor else None
+        if anchor:
+            project.log(f"Anchor reference: {anchor[0][:80]}")
+
+        semaphore = asyncio.Semaphore(self.max_in_flight)
 
-            output_path = str(Path(output_dir) / f"panel_{panel.panel_number:02d}.png")
+        async def generate(panel: Panel):
+            async with semaphore:
+                await self._generate_panel(project, panel, output_dir, anchor, regenerate)
+
+        await asyncio.gather(*(generate(panel) for panel in remaining))
+        return project
 
-            try:
+    @staticmethod
+    def _reference(url: str) -> tuple[str, str]:
+        """
+        Wrap a caller-supplied reference URL as (url, cache key).
+
+        Inline data URIs are keyed by their content; hosted URLs by the URL.
+        """
+        if url.startswith("data:"):
+            data = base64.b64decode(url.split(",", 1)[1])
+            return url, hashlib.sha256(data).hexdigest()
+        return url, url
+
+    async def _generate_panel(
+        self,
+        project: ComicProject,
+        panel: Panel,
+        output_dir: str,
+        reference: Optional[tuple[str, str]],
+        regenerate: bool = False,
+    ) -> Optional[tuple[str, str]]:
+        """
+        Generate (or reuse from cache) one panel image.
+
+        Returns (url, cache key) for using this image as a reference, or
+        None if generation failed. The URL is the fresh fal.ai URL, or a
+        data URI of the cached bytes on a cache hit (stored hosted URLs
+        expire). Failures are logged and don't abort the run.
+        """
+        logger.info(f"Generating panel {panel.panel_number}/{len(project.panels)}: "
+                    f"{panel.image_prompt[:60]}...")
+
+        output_path = str(Path(output_dir) / f"panel_{panel.panel_number:02d}.png")
+        reference_url, reference_key = reference or (None, None)
+
+        params = {
+            "model": FLUX_KONTEXT_IMG2IMG if reference_url else FLUX_KONTEXT_TXT2IMG,
+            "prompt": panel.image_prompt, "reference": reference_key,
+            "width": PANEL_WIDTH, "height": PANEL_HEIGHT,
+        }
+        if regenerate:
+            # A new seed gives a new image (and cache entry) for the same prompt
+            params["seed"] = random.randrange(2 ** 32)
+
+        try:
+            async def generate(prompt=panel.image_prompt, output_path=output_path):
                 image_url = await self._generate_single(
-                    prompt=panel.image_prompt,
-                    reference_image_url=prev_image_url,
+                    prompt=prompt,
+                    reference_image_url=reference_url,
                     output_path=output_path,
+                    seed=params.get("seed"),
                 )
-                panel.image_path = output_path
-                prev_image_url = image_url  # Use as reference for next panel
-                project.total_cost += COST_PER_IMAGE
-                project.log(f"Panel {panel.panel_number} image generated: {output_path}")
+                return Path(output_path).read_bytes(), {"image_url": image_url}
 
-            except Exception as e:
-                logger.error(f"Panel {panel.panel_number} generation failed: {e}")
-                project.log(f"Panel {panel.panel_number} FAILED: {e}")
-                # Continue with remaining panels — don't abort entire run
+            image_data, meta, hit = await self.asset_cache.get_or_generate(
+                "flux", params, generate,
+            )
+            if hit:
+                Path(output_path).write_bytes(image_data)
+            else:
+                project.total_cost += COST_PER_IMAGE
+            panel.image_path = output_path
+            project.log(
+                f"Panel {panel.panel_number} image {'reused from cache' if hit else 'generated'}: "
+                f"{output_path}"
+            )
+            image_url = data_uri(image_data) if hit else meta["image_url"]
+            return image_url, hashlib.sha256(image_data).hexdigest()
 
-        return project
+        except Exception as e:
+            logger.error(f"Panel {panel.panel_number} generation failed: {e}")
+            project.log(f"Panel {panel.panel_number} FAILED: {e}")
+            # Continue with remaining panels — don't abort entire run
+            return None
 
     async def _generate_single(
         self,
         prompt: str,
         reference_image_url: Optional[str] = None,
         output_path: Optional[str] = None,
+        seed: Optional[int] = None,
     ) -> str:
         """
         Generate a single image via Flux Kontext Pro.
@@ -121,6 +253,7 @@ class FluxImageGenerator:
             prompt: Image generation prompt
             reference_image_url: URL of reference image for character consistency
             output_path: Local path to save the image
+            seed: Optional generation seed
 
         Returns:
             URL of the generated image (for use as reference in next panel)
@@ -135,6 +268,8 @@ class FluxImageGenerator:
             "safety_tolerance": "2",
             "output_format": "png",
         }
+        if seed is not None:
+            payload["seed"] = seed
 
         # Choose endpoint: text-to-image (no reference) vs image-to-image (with reference)
         if reference_image_url:
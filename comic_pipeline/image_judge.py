@@ -3,18 +3,35 @@ Comic Pipeline — Image Judge.
 
 Uses Claude vision to verify each generated image matches its script prompt.
 Rejects images that don't match, flags issues, and can trigger regeneration.
+
+Panels are judged concurrently, and on Anthropic models several panels are
+packed into one multi-image request. Verdicts are cached by image hash +
+prompt, so re-running on unchanged panels costs nothing. Failed panels are
+regenerated together as one parallel batch, then re-judged.
 """
 
+import asyncio
 import base64
+import hashlib
+import json
 import logging
 import os
 from pathlib import Path
 from typing import Optional
 
 from comic_pipeline.models import ComicProject, Panel
+from core.asset_cache import get_asset_cache
 
 logger = logging.getLogger(__name__)
 
+# Judge requests (and regenerations) in flight at once
+JUDGE_CONCURRENCY = int(os.environ.get("IMAGE_JUDGE_CONCURRENCY", "4"))
+
+# Panels per multi-image request (Anthropic only; 1 disables batching)
+JUDGE_BATCH_SIZE = int(os.environ.get("IMAGE_JUDGE_BATCH_SIZE", "3"))
+
+CRITICAL_CATEGORIES = ["characters", "action", "objects"]
+
 JUDGE_PROMPT = """You are a meticulous image quality judge for a comic parable pipeline.
 
 You will be shown:
@@ -77,6 +94,26 @@ Scoring guide:
 
 Be EXTREMELY specific. Check every single detail. If the prompt says "standing on a wooden crate" and the character is standing on the ground, that is WRONG — do not gloss over it."""
 
+BATCH_JUDGE_PROMPT = JUDGE_PROMPT + """
+
+BATCH MODE: You will be shown several panels, each as its PANEL text followed by its image.
+Judge every panel independently, against its own prompt and narration only.
+Return ONLY valid JSON of the form:
+{"panels": [{"panel_number": N, ...the JSON object above for that panel...}]}
+Include exactly one entry per panel."""
+
+# Bump whenever _apply_checklist_rules() changes how verdicts are derived
+JUDGE_RULES_VERSION = 1
+
+# Cache key component: changes with either prompt, the critical categories
+# or the local rules, so stale verdicts are never reused
+JUDGE_VERSION = hashlib.sha256("\n".join([
+    JUDGE_PROMPT,
+    BATCH_JUDGE_PROMPT,
+    ",".join(CRITICAL_CATEGORIES),
+    str(JUDGE_RULES_VERSION),
+]).encode()).hexdigest()[:12]
+
 
 def _summarise_checklist(checklist: dict) -> str:
     """Build a short one-line summary of checklist results."""
@@ -122,6 +159,10 @@ class ImageJudge:
         """
         Judge all panel images against their prompts.
 
+        All panels are judged first (concurrently, batched, cached). The
+        failures are then regenerated as one parallel batch and re-judged,
+        up to max_retries rounds.
+
         Args:
             project: ComicProject with generated panel images
             max_retries: How many times to regenerate a failed image
@@ -132,20 +173,15 @@ class ImageJudge:
         """
         router = self._get_router()
         panels_with_images = [p for p in project.panels if p.image_path]
+        semaphore = asyncio.Semaphore(JUDGE_CONCURRENCY)
 
-        passed = 0
-        failed = 0
-
-        for panel in panels_with_images:
-            logger.info(
-                f"Judging panel {panel.panel_number}/{len(panels_with_images)}..."
-            )
-
-            result = await self._judge_single(router, panel)
+        logger.info(f"Judging {len(panels_with_images)} panels...")
+        results = await self._judge_many(router, panels_with_images, semaphore)
 
+        failed_panels = []
+        for panel, result in zip(panels_with_images, results):
+            score = result.get("score", "?")
             if result.get("pass", False):
-                passed += 1
-                score = result.get("score", "?")
                 checklist_summary = _summarise_checklist(
                     result.get("checklist", {})
                 )
@@ -158,10 +194,7 @@ class ImageJudge:
                     f"(score: {score})"
                 )
             else:
-                failed += 1
-                score = result.get("score", "?")
                 issues = result.get("issues", [])
-                suggestion = result.get("suggestion", "")
                 logger.warning(
                     f"Panel {panel.panel_number}: FAIL (score: {score}) "
                     f"- Issues: {issues}"
@@ -170,65 +203,46 @@ class ImageJudge:
                     f"Panel {panel.panel_number} judge: FAIL "
                     f"(score: {score}) - {'; '.join(issues)}"
                 )
-
-                # Attempt regeneration if we have a generator
-                if regenerator and max_retries > 0:
-                    logger.info(
-                        f"Regenerating panel {panel.panel_number}: "
-                        f"{suggestion}"
-                    )
-                    # Enhance the prompt with the judge's suggestion
-                    enhanced_prompt = panel.image_prompt
-                    if suggestion:
-                        enhanced_prompt += (
-                            f" IMPORTANT: {suggestion}"
+                failed_panels.append((panel, result))
+
+        # Regenerate failures as a batch, then re-judge them together
+        if regenerator:
+            for _ in range(max_retries):
+                if not failed_panels:
+                    break
+                regenerated = await asyncio.gather(*(
+                    self._regenerate(project, panel, result, regenerator, semaphore)
+                    for panel, result in failed_panels
+                ))
+                retry_panels = [
+                    panel for (panel, _), ok in zip(failed_panels, regenerated) if ok
+                ]
+                retry_results = await self._judge_many(router, retry_panels, semaphore)
+                retried = dict(zip(map(id, retry_panels), retry_results))
+
+                still_failed = []
+                for panel, result in failed_panels:
+                    result2 = retried.get(id(panel))
+                    if result2 is None:
+                        still_failed.append((panel, result))
+                    elif result2.get("pass", False):
+                        logger.info(
+                            f"Panel {panel.panel_number}: PASS on retry "
+                            f"(score: {result2.get('score', '?')})"
                         )
-
-                    try:
-                        output_dir = str(
-                            Path(panel.image_path).parent
+                        project.log(
+                            f"Panel {panel.panel_number} regen: PASS"
                         )
-                        old_prompt = panel.image_prompt
-                        panel.image_prompt = enhanced_prompt
-
-                        temp_project = ComicProject(
-                            title="regen",
-                            theme_id="regen",
-                            art_style=project.art_style,
-                            art_style_negative=project.art_style_negative,
-                        )
-                        temp_project.panels = [panel]
-
-                        await regenerator.generate_panels(
-                            temp_project, output_dir
-                        )
-
-                        panel.image_prompt = old_prompt  # Restore original
-
-                        # Re-judge
-                        result2 = await self._judge_single(router, panel)
-                        if result2.get("pass", False):
-                            logger.info(
-                                f"Panel {panel.panel_number}: PASS on retry "
-                                f"(score: {result2.get('score', '?')})"
-                            )
-                            project.log(
-                                f"Panel {panel.panel_number} regen: PASS"
-                            )
-                            failed -= 1
-                            passed += 1
-                        else:
-                            project.log(
-                                f"Panel {panel.panel_number} regen: "
-                                f"still FAIL"
-                            )
-
-                    except Exception as e:
-                        logger.error(
-                            f"Panel {panel.panel_number} regen failed: {e}"
+                    else:
+                        project.log(
+                            f"Panel {panel.panel_number} regen: "
+                            f"still FAIL"
                         )
-                        panel.image_prompt = panel.image_prompt  # restore
+                        still_failed.append((panel, result2))
+                failed_panels = still_failed
 
+        failed = len(failed_panels)
+        passed = len(panels_with_images) - failed
         logger.info(
             f"Image judge complete: {passed} passed, {failed} failed "
             f"out of {len(panels_with_images)}"
@@ -239,6 +253,164 @@ class ImageJudge:
 
         return project
 
+    async def _regenerate(
+        self,
+        project: ComicProject,
+        panel: Panel,
+        result: dict,
+        regenerator,
+        semaphore: asyncio.Semaphore,
+    ) -> bool:
+        """Regenerate one failed panel with the judge's suggestion. Returns True on success."""
+        suggestion = result.get("suggestion", "")
+        logger.info(
+            f"Regenerating panel {panel.panel_number}: "
+            f"{suggestion}"
+        )
+        # Enhance the prompt with the judge's suggestion
+        old_prompt = panel.image_prompt
+        old_image = panel.image_path
+        if suggestion:
+            panel.image_prompt += f" IMPORTANT: {suggestion}"
+
+        temp_project = ComicProject(
+            title="regen",
+            theme_id="regen",
+            art_style=project.art_style,
+            art_style_negative=project.art_style_negative,
+        )
+        temp_project.panels = [panel]
+
+        try:
+            async with semaphore:
+                # Regenerate against the anchor reference when the
+                # generator ran in anchor mode, so retries stay on-model
+                await regenerator.generate_panels(
+                    temp_project, str(Path(old_image).parent),
+                    reference_image_url=getattr(
+                        regenerator, "anchor_image_url", None
+                    ),
+                    regenerate=True,
+                )
+            return True
+        except Exception as e:
+            logger.error(
+                f"Panel {panel.panel_number} regen failed: {e}"
+            )
+            return False
+        finally:
+            panel.image_prompt = old_prompt  # Restore original
+
+    async def _judge_many(
+        self,
+        router,
+        panels: list[Panel],
+        semaphore: asyncio.Semaphore,
+    ) -> list[dict]:
+        """
+        Judge panels concurrently, serving unchanged panels from cache.
+
+        Returns results in the same order as panels.
+        """
+        model = router.select_model("classify_content")
+        cache = get_asset_cache()
+        results: list[Optional[dict]] = [None] * len(panels)
+        keys: list[Optional[str]] = [None] * len(panels)
+        pending = []
+
+        for i, panel in enumerate(panels):
+            if not panel.image_path or not Path(panel.image_path).exists():
+                results[i] = _missing_image_result()
+                continue
+            keys[i] = self._cache_key(model, panel)
+            cached = cache.get(keys[i], "image_judge")
+            if cached is not None:
+                logger.info(f"Panel {panel.panel_number}: judge result reused from cache")
+                results[i] = json.loads(cached[0])
+            else:
+                pending.append(i)
+
+        batch_size = JUDGE_BATCH_SIZE if model.provider == "anthropic" else 1
+        batches = [
+            pending[j:j + max(1, batch_size)]
+            for j in range(0, len(pending), max(1, batch_size))
+        ]
+
+        async def judge(batch: list[int]):
+            async with semaphore:
+                if len(batch) == 1:
+                    batch_results = [await self._judge_single(router, panels[batch[0]])]
+                else:
+                    batch_results = await self._judge_batch(
+                        router, [panels[i] for i in batch]
+                    )
+            for i, result in zip(batch, batch_results):
+                results[i] = result
+                # Parse failures have no checklist — don't cache those
+                if result.get("checklist"):
+                    cache.put(keys[i], json.dumps(result).encode("utf-8"),
+                              "image_judge", {"panel_number": panels[i].panel_number})
+
+        await asyncio.gather(*(judge(batch) for batch in batches))
+        return results
+
+    @staticmethod
+    def _cache_key(model, panel: Panel) -> str:
+        """Cache key: judge model + rules + image content + what it's judged against."""
+        image_hash = hashlib.sha256(Path(panel.image_path).read_bytes()).hexdigest()
+        return get_asset_cache().make_key("image_judge", {
+            "model": model.name,
+            "judge_version": JUDGE_VERSION,
+            "image_sha256": image_hash,
+            "image_prompt": panel.image_prompt,
+            "narration": panel.narration,
+        })
+
+    async def _judge_batch(self, router, panels: list[Panel]) -> list[dict]:
+        """
+        Judge several panels in one multi-image request.
+
+        Panels missing from the response, or a response that can't be
+        parsed, fall back to individual requests.
+        """
+        content = []
+        for panel in panels:
+            content.append({"type": "text", "text": _panel_text(panel)})
+            content.append(_image_block(Path(panel.image_path).read_bytes()))
+        content.append({
+            "type": "text",
+            "text": (
+                f"Judge all {len(panels)} panels above. "
+                f"Return the JSON object with one entry per panel."
+            ),
+        })
+        messages = [
+            {"role": "system", "content": BATCH_JUDGE_PROMPT},
+            {"role": "user", "content": content},
+        ]
+
+        model = router.select_model("classify_content")
+        response = await router.invoke(model, messages, max_tokens=1024 * len(panels))
+        parsed = _parse_json(response["content"])
+
+        by_number = {}
+        if parsed is not None:
+            for entry in parsed.get("panels", []):
+                if isinstance(entry, dict) and "panel_number" in entry:
+                    by_number[entry["panel_number"]] = entry
+        else:
+            logger.warning("Batch judge response could not be parsed — judging individually")
+
+        results = []
+        for panel in panels:
+            entry = by_number.get(panel.panel_number)
+            if entry is None:
+                results.append(await self._judge_single(router, panel))
+            else:
+                entry.pop("panel_number", None)
+                results.append(_apply_checklist_rules(panel, entry))
+        return results
+
     async def _judge_single(self, router, panel: Panel) -> dict:
         """
         Judge a single panel image against its prompt using a checklist approach.
@@ -250,43 +422,11 @@ class ImageJudge:
         item is MISSING or WRONG. Non-critical categories (setting, composition)
         deduct points but don't auto-fail.
         """
-        import json
-
         if not panel.image_path or not Path(panel.image_path).exists():
-            return {
-                "pass": False,
-                "score": 0,
-                "checklist": {},
-                "critical_pass": False,
-                "issues": ["No image file found"],
-                "suggestion": "Generate the image",
-            }
+            return _missing_image_result()
 
-        # Read image and encode as base64
         with open(panel.image_path, "rb") as f:
             image_data = f.read()
-        image_b64 = base64.b64encode(image_data).decode("utf-8")
-
-        # Detect actual media type from file header (not extension)
-        if image_data[:8] == b'\x89PNG\r\n\x1a\n':
-            media_type = "image/png"
-        elif image_data[:2] == b'\xff\xd8':
-            media_type = "image/jpeg"
-        elif image_data[:4] == b'RIFF' and image_data[8:12] == b'WEBP':
-            media_type = "image/webp"
-        else:
-            media_type = "image/jpeg"  # default fallback
-
-        # Build the user text with both prompt and narration for checklist extraction
-        user_text = (
-            f"PANEL {panel.panel_number}\n\n"
-            f"IMAGE PROMPT:\n{panel.image_prompt}\n\n"
-            f"NARRATION:\n{panel.narration}\n\n"
-            f"STEP 1: Extract a checklist of every visual requirement from the "
-            f"IMAGE PROMPT and NARRATION above.\n"
-            f"STEP 2: Examine the image below and verify each checklist item.\n"
-            f"Return the JSON result."
-        )
 
         # Build message with image — Anthropic vision format
         messages = [
@@ -296,16 +436,9 @@ class ImageJudge:
                 "content": [
                     {
                         "type": "text",
-                        "text": user_text,
-                    },
-                    {
-                        "type": "image",
-                        "source": {
-                            "type": "base64",
-                            "media_type": media_type,
-                            "data": image_b64,
-                        },
+                        "text": _panel_text(panel),
                     },
+                    _image_block(image_data),
                 ],
             },
         ]
@@ -313,26 +446,8 @@ class ImageJudge:
         # Use cheap model for judging (Haiku — fast, cheap, vision-capable)
         model = router.select_model("classify_content")
         response = await router.invoke(model, messages, max_tokens=1024)
-        raw = response["content"].strip()
-
-        # Parse JSON response
-        try:
-            # Handle markdown fences
-            if "```json" in raw:
-                raw = raw.split("```json", 1)[1].split("```", 1)[0]
-            elif "```" in raw:
-                raw = raw.split("```", 1)[1].split("```", 1)[0]
-
-            first = raw.find("{")
-            last = raw.rfind("}")
-            if first != -1 and last != -1:
-                raw = raw[first:last + 1]
-
-            result = json.loads(raw)
-        except (json.JSONDecodeError, ValueError) as e:
-            logger.warning(
-                f"Judge response parse failed: {e}. Raw: {raw[:200]}"
-            )
+        result = _parse_json(response["content"])
+        if result is None:
             # Default to pass if we can't parse (don't block pipeline)
             return {
                 "pass": True,
@@ -343,57 +458,131 @@ class ImageJudge:
                 "suggestion": "",
             }
 
-        # Post-process: enforce critical/non-critical logic locally
-        # in case the model's own pass/fail judgment is too lenient
-        checklist = result.get("checklist", {})
-        critical_categories = ["characters", "action", "objects"]
-        critical_failures = []
-
-        for category in critical_categories:
-            items = checklist.get(category, [])
-            for item in items:
-                status = item.get("status", "").upper()
-                if status in ("MISSING", "WRONG"):
-                    desc = item.get("item", "unknown")
-                    note = item.get("note", "")
-                    critical_failures.append(
-                        f"[{category}] {desc}: {status} — {note}"
-                    )
+        return _apply_checklist_rules(panel, result)
+
+
+def _missing_image_result() -> dict:
+    return {
+        "pass": False,
+        "score": 0,
+        "checklist": {},
+        "critical_pass": False,
+        "issues": ["No image file found"],
+        "suggestion": "Generate the image",
+    }
+
+
+def _panel_text(panel: Panel) -> str:
+    """Prompt + narration text for checklist extraction."""
+    return (
+        f"PANEL {panel.panel_number}\n\n"
+        f"IMAGE PROMPT:\n{panel.image_prompt}\n\n"
+        f"NARRATION:\n{panel.narration}\n\n"
+        f"STEP 1: Extract a checklist of every visual requirement from the "
+        f"IMAGE PROMPT and NARRATION above.\n"
+        f"STEP 2: Examine the image below and verify each checklist item.\n"
+        f"Return the JSON result."
+    )
+
+
+def _image_block(image_data: bytes) -> dict:
+    """Base64 image content block, media type detected from the file header."""
+    # Detect actual media type from file header (not extension)
+    if image_data[:8] == b'\x89PNG\r\n\x1a\n':
+        media_type = "image/png"
+    elif image_data[:2] == b'\xff\xd8':
+        media_type = "image/jpeg"
+    elif image_data[:4] == b'RIFF' and image_data[8:12] == b'WEBP':
+        media_type = "image/webp"
+    else:
+        media_type = "image/jpeg"  # default fallback
+
+    return {
+        "type": "image",
+        "source": {
+            "type": "base64",
+            "media_type": media_type,
+            "data": base64.b64encode(image_data).decode("utf-8"),
+        },
+    }
+
+
+def _parse_json(raw: str) -> Optional[dict]:
+    """Extract the JSON object from a judge response, or None if unparseable."""
+    raw = raw.strip()
+    try:
+        # Handle markdown fences
+        if "```json" in raw:
+            raw = raw.split("```json", 1)[1].split("```", 1)[0]
+        elif "```" in raw:
+            raw = raw.split("```", 1)[1].split("```", 1)[0]
+
+        first = raw.find("{")
+        last = raw.rfind("}")
+        if first != -1 and last != -1:
+            raw = raw[first:last + 1]
+
+        return json.loads(raw)
+    except (json.JSONDecodeError, ValueError) as e:
+        logger.warning(
+            f"Judge response parse failed: {e}. Raw: {raw[:200]}"
+        )
+        return None
+
 
-        # Override model's judgment if it missed critical failures
-        if critical_failures:
-            result["critical_pass"] = False
-            result["pass"] = False
-            # Cap score at 5 if there are critical failures
-            if result.get("score", 0) > 5:
-                result["score"] = 5
-            # Merge any failures into the issues list
-            existing_issues = result.get("issues", [])
-            for failure in critical_failures:
-                if failure not in existing_issues:
-                    existing_issues.append(failure)
-            result["issues"] = existing_issues
-            # Build a suggestion from failures if none provided
-            if not result.get("suggestion"):
-                result["suggestion"] = (
-                    "Fix: " + "; ".join(critical_failures)
+def _apply_checklist_rules(panel: Panel, result: dict) -> dict:
+    """
+    Post-process: enforce critical/non-critical logic locally
+    in case the model's own pass/fail judgment is too lenient.
+    """
+    checklist = result.get("checklist", {})
+    critical_failures = []
+
+    for category in CRITICAL_CATEGORIES:
+        items = checklist.get(category, [])
+        for item in items:
+            status = item.get("status", "").upper()
+            if status in ("MISSING", "WRONG"):
+                desc = item.get("item", "unknown")
+                note = item.get("note", "")
+                critical_failures.append(
+                    f"[{category}] {desc}: {status} — {note}"
+                )
+
+    # Override model's judgment if it missed critical failures
+    if critical_failures:
+        result["critical_pass"] = False
+        result["pass"] = False
+        # Cap score at 5 if there are critical failures
+        if result.get("score", 0) > 5:
+            result["score"] = 5
+        # Merge any failures into the issues list
+        existing_issues = result.get("issues", [])
+        for failure in critical_failures:
+            if failure not in existing_issues:
+                existing_issues.append(failure)
+        result["issues"] = existing_issues
+        # Build a suggestion from failures if none provided
+        if not result.get("suggestion"):
+            result["suggestion"] = (
+                "Fix: " + "; ".join(critical_failures)
+            )
+    else:
+        result["critical_pass"] = True
+        # If all critical items pass, allow score-based pass/fail
+        # (non-critical misses can still lower score but won't auto-fail)
+        if result.get("score", 0) >= 7:
+            result["pass"] = True
+
+    # Log the checklist for debugging
+    for category, items in checklist.items():
+        for item in items:
+            status = item.get("status", "?")
+            desc = item.get("item", "?")
+            if status in ("MISSING", "WRONG"):
+                logger.debug(
+                    f"Panel {panel.panel_number} checklist: "
+                    f"{category}/{desc} = {status}"
                 )
-        else:
-            result["critical_pass"] = True
-            # If all critical items pass, allow score-based pass/fail
-            # (non-critical misses can still lower score but won't auto-fail)
-            if result.get("score", 0) >= 7:
-                result["pass"] = True
-
-        # Log the checklist for debugging
-        for category, items in checklist.items():
-            for item in items:
-                status = item.get("status", "?")
-                desc = item.get("item", "?")
-                if status in ("MISSING", "WRONG"):
-                    logger.debug(
-                        f"Panel {panel.panel_number} checklist: "
-                        f"{category}/{desc} = {status}"
-                    )
 
-        return result
+    return result
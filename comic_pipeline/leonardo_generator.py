@@ -4,21 +4,29 @@ Comic Pipeline — Leonardo Image Generator.
 Generates comic panel images using Leonardo.ai API.
 Text-to-image only (no reference chaining) — each panel is generated
 independently from its prompt for maximum scene variety.
+
+Because panels don't depend on each other, anchor mode (shared with
+FluxImageGenerator) simply generates them all concurrently, capped by
+LEONARDO_MAX_IN_FLIGHT. Sequential mode is the default
+(LEONARDO_GENERATION_MODE).
 """
 
 import asyncio
 import logging
 import os
+import random
 from pathlib import Path
 from typing import Optional
 
 import httpx
 
 from comic_pipeline.models import ComicProject, Panel
+from core.asset_cache import get_asset_cache
 
 logger = logging.getLogger(__name__)
 
 LEONARDO_BASE_URL = "https://cloud.leonardo.ai/api/rest/v1"
+MODEL_ID = "6b645e3a-d64f-4341-a6d8-7a3690fbf042"  # Leonardo Phoenix
 
 # Cost per image (Leonardo)
 COST_PER_IMAGE = 0.02  # Rough estimate — varies by model
@@ -27,14 +35,30 @@ COST_PER_IMAGE = 0.02  # Rough estimate — varies by model
 PANEL_WIDTH = 1024
 PANEL_HEIGHT = 1024
 
+GENERATION_MODES = ("sequential", "anchor")
+GENERATION_MODE = os.environ.get("LEONARDO_GENERATION_MODE", "sequential")
+
+# Concurrent Leonardo generations in anchor mode
+MAX_IN_FLIGHT = int(os.environ.get("LEONARDO_MAX_IN_FLIGHT", "4"))
+
 
 class LeonardoImageGenerator:
     """Generates comic panel images via Leonardo.ai."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        mode: str = GENERATION_MODE,
+        max_in_flight: int = MAX_IN_FLIGHT,
+    ):
         self.api_key = api_key or os.environ.get("LEONARDO_API_KEY", "")
         if not self.api_key:
             logger.warning("LEONARDO_API_KEY not set — image generation will fail")
+        self.mode = mode
+        self.max_in_flight = max(1, max_in_flight)
+        # No reference image is ever used (see module docstring)
+        self.anchor_image_url: Optional[str] = None
+        self.asset_cache = get_asset_cache()
 
     def _headers(self) -> dict:
         return {
@@ -52,6 +76,8 @@ class LeonardoImageGenerator:
         project: ComicProject,
         output_dir: str,
         reference_image_url: Optional[str] = None,
+        mode: Optional[str] = None,
+        regenerate: bool = False,
     ) -> ComicProject:
         """
         Generate images for all panels in a project.
@@ -64,49 +90,93 @@ class LeonardoImageGenerator:
             project: ComicProject with panels that have image_prompts
             output_dir: Directory to save generated images
             reference_image_url: Ignored (kept for API compatibility)
+            mode: "sequential" or "anchor" (concurrent); defaults to self.mode
+            regenerate: Use a fresh random seed instead of any cached image
 
         Returns:
             Updated ComicProject with image_path set on each panel
         """
+        mode = mode or self.mode
+        if mode not in GENERATION_MODES:
+            raise ValueError(f"Unknown generation mode: {mode} (expected one of {GENERATION_MODES})")
         Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-        for i, panel in enumerate(project.panels):
-            logger.info(
-                f"Generating panel {panel.panel_number}/{len(project.panels)}: "
-                f"{panel.image_prompt[:60]}..."
-            )
+        if mode == "sequential":
+            for panel in project.panels:
+                await self._generate_panel(project, panel, output_dir, regenerate)
+            return project
 
-            output_path = str(
-                Path(output_dir) / f"panel_{panel.panel_number:02d}.png"
-            )
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+
+        async def generate(panel: Panel):
+            async with semaphore:
+                await self._generate_panel(project, panel, output_dir, regenerate)
+
+        await asyncio.gather(*(generate(panel) for panel in project.panels))
+        return project
+
+    async def _generate_panel(
+        self,
+        project: ComicProject,
+        panel: Panel,
+        output_dir: str,
+        regenerate: bool = False,
+    ):
+        """Generate (or reuse from cache) one panel image. Failures are logged, not raised."""
+        logger.info(
+            f"Generating panel {panel.panel_number}/{len(project.panels)}: "
+            f"{panel.image_prompt[:60]}..."
+        )
+
+        output_path = str(
+            Path(output_dir) / f"panel_{panel.panel_number:02d}.png"
+        )
+
+        # Build the full prompt with negative prompt
+        full_prompt = panel.image_prompt
+        negative = project.art_style_negative or ""
 
-            # Build the full prompt with negative prompt
-            full_prompt = panel.image_prompt
-            negative = project.art_style_negative or ""
+        params = {"model": MODEL_ID, "prompt": full_prompt, "negative_prompt": negative,
+                  "width": PANEL_WIDTH, "height": PANEL_HEIGHT,
+                  "style": "NONE", "alchemy": True}
+        if regenerate:
+            # A new seed gives a new image (and cache entry) for the same prompt
+            params["seed"] = random.randrange(2 ** 32)
 
-            try:
+        try:
+            async def generate(prompt=full_prompt, negative=negative,
+                               output_path=output_path):
                 image_url = await self._generate_single(
-                    prompt=full_prompt,
+                    prompt=prompt,
                     negative_prompt=negative,
                     output_path=output_path,
+                    seed=params.get("seed"),
                 )
-                panel.image_path = output_path
-                project.total_cost += COST_PER_IMAGE
-                project.log(
-                    f"Panel {panel.panel_number} image generated: {output_path}"
-                )
+                return Path(output_path).read_bytes(), {"image_url": image_url}
 
-            except Exception as e:
-                logger.error(f"Panel {panel.panel_number} generation failed: {e}")
-                project.log(f"Panel {panel.panel_number} FAILED: {e}")
+            image_data, _, hit = await self.asset_cache.get_or_generate(
+                "leonardo", params, generate,
+            )
+            if hit:
+                Path(output_path).write_bytes(image_data)
+            else:
+                project.total_cost += COST_PER_IMAGE
+            panel.image_path = output_path
+            project.log(
+                f"Panel {panel.panel_number} image "
+                f"{'reused from cache' if hit else 'generated'}: {output_path}"
+            )
 
-        return project
+        except Exception as e:
+            logger.error(f"Panel {panel.panel_number} generation failed: {e}")
+            project.log(f"Panel {panel.panel_number} FAILED: {e}")
 
     async def _generate_single(
         self,
         prompt: str,
         negative_prompt: str = "",
         output_path: Optional[str] = None,
+        seed: Optional[int] = None,
     ) -> str:
         """
         Generate a single image via Leonardo.ai.
@@ -123,12 +193,14 @@ class LeonardoImageGenerator:
                 "negative_prompt": negative_prompt,
                 "width": PANEL_WIDTH,
                 "height": PANEL_HEIGHT,
-                "modelId": "6b645e3a-d64f-4341-a6d8-7a3690fbf042",  # Leonardo Phoenix
+                "modelId": MODEL_ID,
                 "num_images": 1,
                 "presetStyle": "NONE",  # Let our prompt control the style entirely
                 "public": False,
                 "alchemy": True,  # Better quality
             }
+            if seed is not None:
+                payload["seed"] = seed
 
             response = await client.post(
                 f"{LEONARDO_BASE_URL}/generations",
@@ -8,6 +8,12 @@ Creates motion comic videos from comic panels:
 4. Background music from existing MusicLibrary
 5. Final assembly: video + voice + music
 
+Two render modes:
+- "parallel": panel clips are encoded concurrently (bounded by CPU cores),
+  then joined with xfade and muxed with the audio.
+- "single_pass": one FFmpeg filtergraph (zoompan -> xfade chain -> audio
+  mix), so the video is encoded exactly once.
+
 Uses FFmpeg directly (no MoviePy) — follows existing postprocessor.py patterns.
 """
 
@@ -17,10 +23,13 @@ import math
 import os
 import re
 import tempfile
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
 from comic_pipeline.models import ComicProject, Panel
+from core.asset_cache import get_asset_cache
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +49,11 @@ VIDEO_HEIGHT = 1080
 VIDEO_FPS = 30
 VIDEO_CRF = 20  # Quality (lower = better, 18-23 typical)
 
+# Render mode: "parallel" (per-panel clips, encoded concurrently) or "single_pass"
+RENDER_MODE = os.environ.get("MOTION_COMIC_RENDER_MODE", "parallel")
+RENDER_MODES = ("parallel", "single_pass")
+MAX_PARALLEL_ENCODES = os.cpu_count() or 2
+
 # Auto-leveling: music peak must be at least this many dB below narration mean
 MUSIC_HEADROOM_DB = 18
 
@@ -50,6 +64,8 @@ class MotionComicGenerator:
     def __init__(self):
         self._ffmpeg_path: Optional[str] = None
         self._ffprobe_path: Optional[str] = None
+        # Per-stage wall-clock seconds from the last create_motion_comic run
+        self.last_timings: dict[str, float] = {}
 
     def _find_ffmpeg(self) -> str:
         """Find FFmpeg executable (reuses postprocessor pattern)."""
@@ -160,7 +176,15 @@ class MotionComicGenerator:
             audio_path = str(Path(output_dir) / f"narration_{panel.panel_number:02d}.mp3")
 
             try:
-                audio_data = await tts.text_to_speech(text=full_text)
+                async def generate(text=full_text):
+                    return await tts.text_to_speech(text=text, model="eleven_v3"), {}
+
+                audio_data, _, _ = await get_asset_cache().get_or_generate(
+                    "elevenlabs",
+                    {"text": full_text, "model": "eleven_v3",
+                     "voice_id": os.environ.get("ELEVENLABS_VOICE_ID", "")},
+                    generate,
+                )
                 with open(audio_path, "wb") as f:
                     f.write(audio_data)
 
@@ -195,68 +219,98 @@ class MotionComicGenerator:
         output_path: str,
         music_path: Optional[str] = None,
         music_volume: float = 0.15,
+        render_mode: Optional[str] = None,
     ) -> str:
         """
         Create the final motion comic video.
 
-        Flow:
-        1. Create Ken Burns clip for each panel (image → video segment)
+        Flow ("parallel"):
+        1. Create Ken Burns clip for each panel, encodes run concurrently
         2. Concatenate with xfade transitions
         3. Build full narration audio track
-        4. Mix narration + background music
-        5. Combine video + audio
+        4. Mix narration + background music, combine video + audio
+
+        Flow ("single_pass"):
+        1. Build full narration audio track
+        2. One FFmpeg run: zoompan per panel -> xfade chain -> audio mix
 
         Args:
             project: ComicProject with panels (need image_path, audio_path, audio_duration)
             output_path: Final video output path
             music_path: Optional background music file
             music_volume: Background music volume (0.0-1.0)
+            render_mode: "parallel" or "single_pass" (default: RENDER_MODE)
 
         Returns:
             Path to final motion comic video
         """
-        ffmpeg = self._find_ffmpeg()
+        render_mode = render_mode or RENDER_MODE
+        if render_mode not in RENDER_MODES:
+            raise ValueError(f"Unknown render mode: {render_mode} (expected one of {RENDER_MODES})")
+
+        self._find_ffmpeg()
         panels = [p for p in project.panels if p.image_path]
         if not panels:
             raise ValueError("No panels with images to create motion comic")
 
         work_dir = tempfile.mkdtemp(prefix="comic_motion_")
-        logger.info(f"Creating motion comic: {len(panels)} panels, work_dir={work_dir}")
+        logger.info(
+            f"Creating motion comic: {len(panels)} panels, mode={render_mode}, "
+            f"work_dir={work_dir}"
+        )
+        self.last_timings = {}
+        started = time.perf_counter()
 
         try:
-            # Step 1: Create Ken Burns video clip for each panel
-            panel_clips = []
-            for panel in panels:
-                duration = max(panel.audio_duration, MIN_PANEL_DURATION)
-                clip_path = os.path.join(work_dir, f"clip_{panel.panel_number:02d}.mp4")
-                await self._create_ken_burns_clip(
-                    image_path=panel.image_path,
-                    output_path=clip_path,
-                    duration=duration,
-                    panel_number=panel.panel_number,
-                )
-                panel_clips.append((clip_path, duration))
-
-            # Step 2: Concatenate clips with xfade transitions
-            video_only_path = os.path.join(work_dir, "video_only.mp4")
-            await self._concat_with_transitions(panel_clips, video_only_path)
-
-            # Step 3: Build full narration audio track
+            panel_clips = [
+                (os.path.join(work_dir, f"clip_{panel.panel_number:02d}.mp4"),
+                 max(panel.audio_duration, MIN_PANEL_DURATION))
+                for panel in panels
+            ]
             narration_path = os.path.join(work_dir, "narration_full.mp3")
-            await self._build_narration_track(panels, narration_path, panel_clips)
-
-            # Step 4: Combine video + narration + music
-            await self._final_mix(
-                video_path=video_only_path,
-                narration_path=narration_path,
-                output_path=output_path,
-                music_path=music_path,
-                music_volume=music_volume,
-            )
 
+            if render_mode == "single_pass":
+                with self._timed("narration_track"):
+                    await self._build_narration_track(panels, narration_path, panel_clips)
+                with self._timed("single_pass_render"):
+                    await self._render_single_pass(
+                        panels=panels,
+                        durations=[d for _, d in panel_clips],
+                        narration_path=narration_path,
+                        output_path=output_path,
+                        music_path=music_path,
+                        music_volume=music_volume,
+                    )
+            else:
+                # Step 1: Ken Burns clip per panel, encoded concurrently.
+                # Narration only needs the durations, so it builds alongside.
+                with self._timed("ken_burns_clips"):
+                    await asyncio.gather(
+                        self._create_clips_parallel(panels, panel_clips),
+                        self._build_narration_track(panels, narration_path, panel_clips),
+                    )
+
+                # Step 2: Concatenate clips with xfade transitions
+                video_only_path = os.path.join(work_dir, "video_only.mp4")
+                with self._timed("xfade_concat"):
+                    await self._concat_with_transitions(panel_clips, video_only_path)
+
+                # Step 3: Combine video + narration + music (video stream copied)
+                with self._timed("final_mix"):
+                    await self._final_mix(
+                        video_path=video_only_path,
+                        narration_path=narration_path,
+                        output_path=output_path,
+                        music_path=music_path,
+                        music_volume=music_volume,
+                    )
+
+            self.last_timings["total"] = round(time.perf_counter() - started, 2)
+            timing_str = ", ".join(f"{k}={v:.1f}s" for k, v in self.last_timings.items())
             project.video_path = output_path
-            project.log(f"Motion comic generated: {output_path}")
-            logger.info(f"Motion comic complete: {output_path}")
+            project.log(f"Motion comic generated ({render_mode}): {output_path}")
+            project.log(f"Motion comic timings: {timing_str}")
+            logger.info(f"Motion comic complete: {output_path} ({timing_str})")
 
             return output_path
 
@@ -268,17 +322,40 @@ class MotionComicGenerator:
             except Exception:
                 pass
 
-    async def _create_ken_burns_clip(
+    @contextmanager
+    def _timed(self, stage: str):
+        """Record wall-clock seconds for a render stage in last_timings."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.last_timings[stage] = round(time.perf_counter() - start, 2)
+
+    async def _create_clips_parallel(
         self,
-        image_path: str,
-        output_path: str,
-        duration: float,
-        panel_number: int,
+        panels: list[Panel],
+        clips: list[tuple[str, float]],
     ):
-        """Create a video clip from a still image with Ken Burns effect."""
-        ffmpeg = self._find_ffmpeg()
+        """Encode every panel's Ken Burns clip, at most one encode per CPU core."""
+        slots = asyncio.Semaphore(MAX_PARALLEL_ENCODES)
 
-        # Alternate between zoom-in and zoom-out + pan direction per panel
+        async def encode(panel: Panel, clip_path: str, duration: float):
+            async with slots:
+                await self._create_ken_burns_clip(
+                    image_path=panel.image_path,
+                    output_path=clip_path,
+                    duration=duration,
+                    panel_number=panel.panel_number,
+                )
+
+        await asyncio.gather(*(
+            encode(panel, clip_path, duration)
+            for panel, (clip_path, duration) in zip(panels, clips)
+        ))
+
+    @staticmethod
+    def _ken_burns_filter(duration: float, panel_number: int) -> str:
+        """zoompan expression for one panel (alternating zoom in / zoom out)."""
         if panel_number % 2 == 0:
             # Even panels: zoom in
             zoom_expr = f"{KB_ZOOM_START}+({KB_ZOOM_END}-{KB_ZOOM_START})*on/({duration}*{VIDEO_FPS})"
@@ -290,8 +367,7 @@ class MotionComicGenerator:
             x_expr = f"(iw-iw/{KB_ZOOM_START})/2"
             y_expr = f"(ih-ih/{KB_ZOOM_START})/2"
 
-        # zoompan filter: creates Ken Burns from still image
-        filter_str = (
+        return (
             f"zoompan=z='{zoom_expr}'"
             f":x='{x_expr}'"
             f":y='{y_expr}'"
@@ -300,6 +376,117 @@ class MotionComicGenerator:
             f":fps={VIDEO_FPS}"
         )
 
+    @staticmethod
+    def _xfade_chain(labels: list[str], durations: list[float], out_label: str) -> list[str]:
+        """xfade dissolve filters joining labelled video streams into out_label."""
+        filter_parts = []
+        current_offset = 0.0
+
+        for i in range(len(labels) - 1):
+            in_label = labels[0] if i == 0 else f"[v{i}]"
+            next_label = labels[i + 1]
+            label = f"[v{i + 1}]" if i < len(labels) - 2 else out_label
+
+            # Offset = when the transition starts (end of current clip minus transition duration)
+            current_offset += durations[i] - TRANSITION_DURATION
+
+            filter_parts.append(
+                f"{in_label}{next_label}xfade=transition=dissolve"
+                f":duration={TRANSITION_DURATION}"
+                f":offset={current_offset:.3f}{label}"
+            )
+
+        return filter_parts
+
+    async def _render_single_pass(
+        self,
+        panels: list[Panel],
+        durations: list[float],
+        narration_path: str,
+        output_path: str,
+        music_path: Optional[str] = None,
+        music_volume: float = 0.15,
+    ):
+        """
+        Render the whole motion comic in one FFmpeg run.
+
+        Each still image feeds a zoompan (one input frame -> d output frames),
+        the clips are chained with xfade and the narration/music mix is built
+        in the same filtergraph, so the video is only encoded once.
+        """
+        ffmpeg = self._find_ffmpeg()
+
+        cmd = [ffmpeg, "-y"]
+        for panel in panels:
+            cmd.extend(["-i", panel.image_path])
+        narration_idx = len(panels)
+        cmd.extend(["-i", narration_path])
+
+        filter_parts = []
+        labels = []
+        for i, (panel, duration) in enumerate(zip(panels, durations)):
+            filter_parts.append(
+                f"[{i}:v]{self._ken_burns_filter(duration, panel.panel_number)},"
+                f"format=yuv420p,setsar=1[kb{i}]"
+            )
+            labels.append(f"[kb{i}]")
+
+        if len(labels) == 1:
+            filter_parts.append(f"{labels[0]}null[vout]")
+        else:
+            filter_parts.extend(self._xfade_chain(labels, durations, "[vout]"))
+
+        audio_map = f"{narration_idx}:a"
+        if music_path and Path(music_path).exists():
+            cmd.extend(["-stream_loop", "-1", "-i", music_path])
+            video_duration = sum(durations) - TRANSITION_DURATION * (len(durations) - 1)
+            effective_volume = await self._music_volume(narration_path, music_path, music_volume)
+            filter_parts.append(self._music_mix_filter(
+                f"[{narration_idx}:a]", f"[{narration_idx + 1}:a]",
+                effective_volume, video_duration,
+            ))
+            audio_map = "[aout]"
+
+        cmd.extend([
+            "-filter_complex", ";".join(filter_parts),
+            "-map", "[vout]",
+            "-map", audio_map,
+            "-c:v", "libx264",
+            "-preset", "fast",
+            "-crf", str(VIDEO_CRF),
+            "-pix_fmt", "yuv420p",
+            "-c:a", "aac",
+            "-b:a", "192k",
+            "-shortest",
+            output_path,
+        ])
+
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+
+        if proc.returncode != 0:
+            error = stderr.decode()[-500:]
+            raise RuntimeError(f"Single-pass render failed: {error}")
+
+        logger.info(f"Single-pass motion comic rendered: {output_path}")
+
+    async def _create_ken_burns_clip(
+        self,
+        image_path: str,
+        output_path: str,
+        duration: float,
+        panel_number: int,
+    ):
+        """Create a video clip from a still image with Ken Burns effect."""
+        ffmpeg = self._find_ffmpeg()
+
+        # Alternate between zoom-in and zoom-out + pan direction per panel
+        filter_str = self._ken_burns_filter(duration, panel_number)
+
         cmd = [
             ffmpeg, "-y",
             "-loop", "1",
@@ -348,27 +535,11 @@ class MotionComicGenerator:
             inputs.extend(["-i", clip_path])
 
         # Build filter_complex for xfade chain
-        filter_parts = []
-        current_offset = 0.0
-
-        for i in range(len(clips) - 1):
-            # Calculate offset: sum of durations up to clip i, minus transition overlap
-            if i == 0:
-                in_label = f"[{i}:v]"
-            else:
-                in_label = f"[v{i}]"
-
-            next_label = f"[{i + 1}:v]"
-            out_label = f"[v{i + 1}]" if i < len(clips) - 2 else "[vout]"
-
-            # Offset = when the transition starts (end of current clip minus transition duration)
-            current_offset += clips[i][1] - TRANSITION_DURATION
-
-            filter_parts.append(
-                f"{in_label}{next_label}xfade=transition=dissolve"
-                f":duration={TRANSITION_DURATION}"
-                f":offset={current_offset:.3f}{out_label}"
-            )
+        filter_parts = self._xfade_chain(
+            [f"[{i}:v]" for i in range(len(clips))],
+            [duration for _, duration in clips],
+            "[vout]",
+        )
 
         filter_complex = ";".join(filter_parts)
 
@@ -580,6 +751,29 @@ class MotionComicGenerator:
             # If measurement fails, return a safe conservative default
             return 0.10
 
+    async def _music_volume(self, narration_path: str, music_path: str,
+                            music_volume: float) -> float:
+        """Auto-level the music against the narration, capped by the user param."""
+        auto_volume = await self._auto_level_music(narration_path, music_path)
+        effective_volume = min(auto_volume, music_volume)
+        logger.info(
+            f"Music volume: auto={auto_volume:.4f}, "
+            f"cap={music_volume:.4f}, "
+            f"effective={effective_volume:.4f}"
+        )
+        return effective_volume
+
+    @staticmethod
+    def _music_mix_filter(voice_in: str, music_in: str, volume: float,
+                          video_duration: float) -> str:
+        """Narration + faded background music -> [aout]."""
+        return (
+            f"{voice_in}volume=1.0[voice];"
+            f"{music_in}volume={volume},atrim=duration={video_duration},"
+            f"afade=type=in:duration=2,afade=type=out:start_time={video_duration - 2}:duration=2[music];"
+            f"[voice][music]amix=inputs=2:duration=first[aout]"
+        )
+
     async def _final_mix(
         self,
         video_path: str,
@@ -599,22 +793,10 @@ class MotionComicGenerator:
             # Get video duration for music trim
             video_duration = await self._get_media_duration(video_path)
 
-            # Auto-level: calculate ideal music volume, then cap with user param
-            auto_volume = await self._auto_level_music(narration_path, music_path)
-            effective_volume = min(auto_volume, music_volume)
-            logger.info(
-                f"Music volume: auto={auto_volume:.4f}, "
-                f"cap={music_volume:.4f}, "
-                f"effective={effective_volume:.4f}"
-            )
+            effective_volume = await self._music_volume(narration_path, music_path, music_volume)
 
             # Mix narration + music
-            filter_complex = (
-                f"[1:a]volume=1.0[voice];"
-                f"[2:a]volume={effective_volume},atrim=duration={video_duration},"
-                f"afade=type=in:duration=2,afade=type=out:start_time={video_duration - 2}:duration=2[music];"
-                f"[voice][music]amix=inputs=2:duration=first[aout]"
-            )
+            filter_complex = self._music_mix_filter("[1:a]", "[2:a]", effective_volume, video_duration)
 
             cmd.extend([
                 "-filter_complex", filter_complex,
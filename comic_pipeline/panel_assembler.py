@@ -9,14 +9,30 @@ Assembles generated panel images into comic book pages:
 - Individual panel exports with captions (for social/NFT)
 
 Uses Pillow for all image manipulation.
+
+Pages and social exports render in parallel across a process pool, one
+job per output file. Speech bubbles are composited only inside their own
+bounding box, and panel images are decoded at reduced size (JPEG draft
+mode, Pillow's reduce-before-resample) so memory stays bounded by a
+single page per worker. assemble_pages() leaves a per-page timing report
+in `last_report`, alongside the peak memory of the worker that rendered
+each page (a process high-water mark, not a per-page figure).
 """
 
 import logging
 import math
 import os
 import textwrap
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+try:
+    import resource  # Not available on Windows
+except ImportError:
+    resource = None
 
 from PIL import Image, ImageDraw, ImageFont
 
@@ -53,14 +69,44 @@ FONTS_DIR = Path(__file__).parent / "assets" / "fonts"
 SOCIAL_WIDTH = 1080
 SOCIAL_HEIGHT = 1080
 
+# Parallel rendering (set to 1 to render in-process)
+MAX_RENDER_WORKERS = int(os.environ.get("PANEL_RENDER_WORKERS", os.cpu_count() or 1))
+
+# Downscales of this factor or more reduce() first, then LANCZOS
+REDUCING_GAP = 3.0
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident memory of this process in MB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    divisor = 1024 * 1024 if os.uname().sysname == "Darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+_worker_assembler: Optional["PanelAssembler"] = None
+
+
+def _worker_call(method: str, *args):
+    """Process-pool entry point: run an assembler method in the worker."""
+    global _worker_assembler
+    if _worker_assembler is None:
+        # Fonts load lazily, once per worker process
+        _worker_assembler = PanelAssembler(max_workers=1)
+    return getattr(_worker_assembler, method)(*args)
+
 
 class PanelAssembler:
     """Assembles comic panels into pages and exports."""
 
-    def __init__(self):
+    def __init__(self, max_workers: int = MAX_RENDER_WORKERS):
         self._bubble_font: Optional[ImageFont.FreeTypeFont] = None
         self._caption_font: Optional[ImageFont.FreeTypeFont] = None
         self._narration_font: Optional[ImageFont.FreeTypeFont] = None
+        self.max_workers = max(1, max_workers)
+        self.last_report: list[dict] = []
 
     def _load_font(self, preferred_name: str, size: int) -> ImageFont.FreeTypeFont:
         """Load a font, trying bundled → system → default."""
@@ -141,7 +187,8 @@ class PanelAssembler:
             grid_cols: Columns in grid layout
 
         Returns:
-            Updated ComicProject with pages and assembled_path set
+            Updated ComicProject with pages and assembled_path set.
+            Per-page timings and worker peak memory are left in self.last_report.
         """
         Path(output_dir).mkdir(parents=True, exist_ok=True)
 
@@ -156,20 +203,78 @@ class PanelAssembler:
         for i in range(0, len(panels_with_images), panels_per_page):
             page_groups.append(panels_with_images[i:i + panels_per_page])
 
-        # Assemble each page
-        project.pages = []
-        for page_num, page_panels in enumerate(page_groups, 1):
-            page = ComicPage(page_number=page_num, panels=page_panels)
-            page_path = str(Path(output_dir) / f"page_{page_num:02d}.png")
+        # Render pages in parallel
+        page_paths = [
+            str(Path(output_dir) / f"page_{page_num:02d}.png")
+            for page_num in range(1, len(page_groups) + 1)
+        ]
+        start = time.perf_counter()
+        stats = self._run_jobs(
+            "_render_page_timed",
+            [(panels, path, grid_cols) for panels, path in zip(page_groups, page_paths)],
+        )
+        elapsed = time.perf_counter() - start
 
-            self._render_page(page_panels, page_path, grid_cols)
-            page.image_path = page_path
+        project.pages = []
+        self.last_report = []
+        for page_num, (page_panels, page_path, page_stats) in enumerate(
+            zip(page_groups, page_paths, stats), 1
+        ):
+            page = ComicPage(page_number=page_num, panels=page_panels, image_path=page_path)
             project.pages.append(page)
-            project.log(f"Page {page_num} assembled: {page_path}")
-            logger.info(f"Page {page_num}/{len(page_groups)} assembled: {page_path}")
+            self.last_report.append({"page": page_num, "path": page_path, **page_stats})
 
+            peak = page_stats["worker_peak_rss_mb"]
+            detail = f"{page_stats['seconds']:.2f}s" + (
+                f", worker peak {peak:.0f} MB" if peak else ""
+            )
+            project.log(f"Page {page_num} assembled: {page_path} ({detail})")
+            logger.info(f"Page {page_num}/{len(page_groups)} assembled: {page_path} ({detail})")
+
+        logger.info(f"Assembled {len(page_groups)} pages in {elapsed:.2f}s")
         return project
 
+    def _run_jobs(self, method: str, jobs: list[tuple]) -> list:
+        """
+        Run an assembler method once per job, across a process pool.
+
+        Results come back in job order. Falls back to rendering in-process
+        for a single job, when max_workers is 1, or if the pool can't start.
+        """
+        workers = min(self.max_workers, len(jobs))
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [pool.submit(_worker_call, method, *job) for job in jobs]
+                    return [f.result() for f in futures]
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"Render pool unavailable ({e}) — rendering in-process")
+
+        run: Callable = getattr(self, method)
+        return [run(*job) for job in jobs]
+
+    def _render_page_timed(
+        self,
+        panels: list[Panel],
+        output_path: str,
+        grid_cols: int = 2,
+    ) -> dict:
+        """
+        Render a page and report its wall time and the worker's peak memory.
+
+        ru_maxrss is the high-water mark of the whole process, so the peak
+        covers every page that worker has rendered so far (or the parent
+        process when rendering in-process). `worker_pid` groups pages by the
+        process they ran in.
+        """
+        start = time.perf_counter()
+        self._render_page(panels, output_path, grid_cols)
+        return {
+            "seconds": round(time.perf_counter() - start, 3),
+            "worker_pid": os.getpid(),
+            "worker_peak_rss_mb": _peak_rss_mb(),
+        }
+
     def _render_page(
         self,
         panels: list[Panel],
@@ -204,8 +309,7 @@ class PanelAssembler:
 
             # Load and resize panel image
             if panel.image_path and Path(panel.image_path).exists():
-                panel_img = Image.open(panel.image_path)
-                panel_img = self._fit_image(panel_img, panel_w, panel_h)
+                panel_img = self._load_panel_image(panel.image_path, panel_w, panel_h)
                 page.paste(panel_img, (x, y))
             else:
                 # Placeholder for missing images
@@ -241,6 +345,20 @@ class PanelAssembler:
 
         page.save(output_path, quality=95)
 
+    def _load_panel_image(self, path: str, target_w: int, target_h: int) -> Image.Image:
+        """
+        Load a panel image already fitted to the target box.
+
+        JPEGs are decoded in draft mode at the smallest DCT scale that still
+        covers the target, so full-resolution pixels are never materialised.
+        The file handle is closed before returning.
+        """
+        with Image.open(path) as img:
+            scale = max(target_w / img.width, target_h / img.height)
+            if scale < 1:
+                img.draft("RGB", (math.ceil(img.width * scale), math.ceil(img.height * scale)))
+            return self._fit_image(img, target_w, target_h)
+
     def _fit_image(self, img: Image.Image, target_w: int, target_h: int) -> Image.Image:
         """Resize and crop image to fit target dimensions (cover mode)."""
         # Calculate scale to cover the target
@@ -250,7 +368,7 @@ class PanelAssembler:
 
         new_w = int(img.width * scale)
         new_h = int(img.height * scale)
-        img = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+        img = img.resize((new_w, new_h), Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
 
         # Center crop
         left = (new_w - target_w) // 2
@@ -295,10 +413,6 @@ class PanelAssembler:
             text_h = bbox[3] - bbox[1]
             bh = text_h + 2 * BUBBLE_PADDING
 
-        # Draw bubble on overlay for transparency
-        overlay = Image.new("RGBA", page.size, (0, 0, 0, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
-
         # Bubble shape varies by style
         outline = BUBBLE_OUTLINE
         fill = BUBBLE_FILL
@@ -312,9 +426,23 @@ class PanelAssembler:
             # Thought bubbles use dashed appearance (approximate with lighter outline)
             outline = (120, 120, 120)
 
+        # Draw the bubble on a transparent tile covering only its bounding
+        # box (body, tail and outline), then composite that region alone
+        margin = outline_width + 6
+        left = max(0, x - margin)
+        top = max(0, y - margin)
+        right = min(page.width, x + bw + margin)
+        bottom = min(page.height, y + bh + BUBBLE_TAIL_SIZE + margin)
+        if right <= left or bottom <= top:
+            return y + bh + BUBBLE_TAIL_SIZE + 8
+
+        overlay = Image.new("RGBA", (right - left, bottom - top), (0, 0, 0, 0))
+        overlay_draw = ImageDraw.Draw(overlay)
+        bx, by = x - left, y - top
+
         # Draw rounded rectangle
         overlay_draw.rounded_rectangle(
-            [x, y, x + bw, y + bh],
+            [bx, by, bx + bw, by + bh],
             radius=BUBBLE_RADIUS,
             fill=fill,
             outline=outline,
@@ -322,8 +450,8 @@ class PanelAssembler:
         )
 
         # Draw tail (triangle pointing down-left)
-        tail_x = x + bw // 4
-        tail_y = y + bh
+        tail_x = bx + bw // 4
+        tail_y = by + bh
         overlay_draw.polygon(
             [
                 (tail_x, tail_y - 2),
@@ -341,14 +469,13 @@ class PanelAssembler:
             fill=BUBBLE_FILL,
         )
 
-        # Composite overlay onto page
-        page.paste(Image.alpha_composite(
-            page.convert("RGBA"), overlay
-        ).convert("RGB"), (0, 0))
+        # Composite the tile onto its page region
+        box = (left, top, right, bottom)
+        region = page.crop(box).convert("RGBA")
+        region.alpha_composite(overlay)
+        page.paste(region.convert("RGB"), box)
 
         # Draw text
-        # Re-get draw since page was modified
-        draw = ImageDraw.Draw(page)
         text_color = (30, 30, 30)
         if style == "whisper":
             text_color = (100, 100, 100)
@@ -452,42 +579,43 @@ class PanelAssembler:
             List of exported file paths
         """
         Path(output_dir).mkdir(parents=True, exist_ok=True)
-        exports = []
-
-        for panel in project.panels:
-            if not panel.image_path or not Path(panel.image_path).exists():
-                continue
-
-            output_path = str(Path(output_dir) / f"social_panel_{panel.panel_number:02d}.png")
-
-            # Create square canvas
-            canvas = Image.new("RGB", (SOCIAL_WIDTH, SOCIAL_HEIGHT), BACKGROUND_COLOR)
-            draw = ImageDraw.Draw(canvas)
-
-            # Load and fit panel image
-            panel_img = Image.open(panel.image_path)
-            if panel.narration:
-                # Leave room for caption at bottom
-                img_height = SOCIAL_HEIGHT - 120
-            else:
-                img_height = SOCIAL_HEIGHT
-
-            fitted = self._fit_image(panel_img, SOCIAL_WIDTH, img_height)
-            canvas.paste(fitted, (0, 0))
-
-            # Add narration caption at bottom
-            if panel.narration:
-                self._draw_caption_box(
-                    draw, panel.narration,
-                    x=0, y=SOCIAL_HEIGHT - 120,
-                    width=SOCIAL_WIDTH,
-                )
 
-            canvas.save(output_path, quality=95)
-            exports.append(output_path)
+        jobs = [
+            (panel, str(Path(output_dir) / f"social_panel_{panel.panel_number:02d}.png"))
+            for panel in project.panels
+            if panel.image_path and Path(panel.image_path).exists()
+        ]
+        exports = self._run_jobs("_render_social_panel", jobs)
 
         project.panel_exports = exports
         project.log(f"Social panels exported: {len(exports)} files")
         logger.info(f"Exported {len(exports)} social panels to {output_dir}")
 
         return exports
+
+    def _render_social_panel(self, panel: Panel, output_path: str) -> str:
+        """Render one 1080x1080 social export. Returns the output path."""
+        # Create square canvas
+        canvas = Image.new("RGB", (SOCIAL_WIDTH, SOCIAL_HEIGHT), BACKGROUND_COLOR)
+        draw = ImageDraw.Draw(canvas)
+
+        if panel.narration:
+            # Leave room for caption at bottom
+            img_height = SOCIAL_HEIGHT - 120
+        else:
+            img_height = SOCIAL_HEIGHT
+
+        # Load and fit panel image
+        fitted = self._load_panel_image(panel.image_path, SOCIAL_WIDTH, img_height)
+        canvas.paste(fitted, (0, 0))
+
+        # Add narration caption at bottom
+        if panel.narration:
+            self._draw_caption_box(
+                draw, panel.narration,
+                x=0, y=SOCIAL_HEIGHT - 120,
+                width=SOCIAL_WIDTH,
+            )
+
+        canvas.save(output_path, quality=95)
+        return output_path
@@ -0,0 +1,355 @@
+"""
+Action Queue - durable, push-based channel from the dashboard to main.py.
+
+The dashboard used to drop schedule_/render_/feedback_/execute_*.json files
+into data/content_feedback, and main.py globbed that directory every 30s.
+Now the dashboard enqueues typed actions into a small SQLite queue and pings
+the main process over a loopback UDP datagram. The consumer wakes up
+immediately, so an approval takes effect in milliseconds.
+
+Delivery is at-least-once. A row is only deleted after its handler succeeds.
+Rows left in-flight by a crash are re-queued on startup. Failed actions are
+retried with backoff, then moved to a dead-letter table. The notify ping is
+only a wake-up hint: if it is lost (main.py down, port busy) the row is still
+in the queue and is picked up at the next start or safety sweep. Because an
+action can be delivered twice, handlers must be idempotent. A handler that
+cannot safely retry (e.g. a post interrupted by a crash, outcome unknown)
+raises DeadLetter to skip the remaining retries.
+
+Long-running action types (renders) can be listed in background_types. They
+are dispatched as their own tasks, so a ~2 minute render doesn't hold up the
+schedules and posts queued behind it.
+
+Loopback UDP is used instead of a Unix socket so the channel also works on
+Windows event loops.
+
+Usage:
+    # Producer (dashboard, scripts)
+    from core.action_queue import ActionQueue
+    ActionQueue().enqueue("schedule", {"approval_id": 42, ...})
+
+    # Consumer (main.py)
+    queue = ActionQueue()
+    asyncio.create_task(queue.consume(oprah.handle_dashboard_action,
+                                      background_types=("render",)))
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+ACTION_TYPES = ("schedule", "render", "feedback", "execute")
+
+NOTIFY_HOST = "127.0.0.1"
+NOTIFY_PORT = int(os.environ.get("ACTION_QUEUE_PORT", "47821"))
+
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 30
+# Safety sweep interval when no notification arrives
+IDLE_SWEEP_SECONDS = 300
+# Re-check interval while consumption is paused (kill switch)
+PAUSED_RECHECK_SECONDS = 30
+
+
+class DeadLetter(Exception):
+    """Raised by a handler to dead-letter its action at once, without retries."""
+
+
+class _NotifyProtocol(asyncio.DatagramProtocol):
+    """Sets the wake-up event whenever a datagram arrives."""
+
+    def __init__(self, wakeup: asyncio.Event):
+        self.wakeup = wakeup
+
+    def datagram_received(self, data, addr):
+        self.wakeup.set()
+
+
+class ActionQueue:
+    """SQLite-backed action queue with loopback notify and dead-lettering."""
+
+    def __init__(self, db_path: str = "data/action_queue.db",
+                 notify_port: int = NOTIFY_PORT,
+                 max_attempts: int = MAX_ATTEMPTS):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.notify_port = notify_port
+        self.max_attempts = max_attempts
+        self._wakeup: Optional[asyncio.Event] = None
+        self._background: set[asyncio.Task] = set()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS actions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    action_type TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT DEFAULT 'pending',
+                    attempts INTEGER DEFAULT 0,
+                    available_at REAL NOT NULL,
+                    created_at TEXT NOT NULL,
+                    last_error TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_actions_ready
+                    ON actions(status, available_at);
+
+                CREATE TABLE IF NOT EXISTS dead_letters (
+                    id INTEGER PRIMARY KEY,
+                    action_type TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    attempts INTEGER,
+                    last_error TEXT,
+                    created_at TEXT,
+                    failed_at TEXT
+                );
+            """)
+
+    # --- Producer side ---
+
+    def enqueue(self, action_type: str, payload: dict) -> int:
+        """Persist an action and wake the consumer. Returns the action id."""
+        if action_type not in ACTION_TYPES:
+            raise ValueError(f"Unknown action type: {action_type} (expected one of {ACTION_TYPES})")
+
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """INSERT INTO actions (action_type, payload, available_at, created_at)
+                   VALUES (?, ?, ?, ?)""",
+                (action_type, json.dumps(payload), time.time(), datetime.now().isoformat())
+            )
+            action_id = cursor.lastrowid
+        self.notify()
+        return action_id
+
+    def notify(self):
+        """Send a wake-up datagram to the consumer (best effort)."""
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.sendto(b"1", (NOTIFY_HOST, self.notify_port))
+        except OSError as e:
+            logger.debug(f"Action queue notify failed (consumer will sweep): {e}")
+
+    def import_files(self, directory: Path) -> int:
+        """
+        Enqueue legacy action files (schedule_*.json etc.) and remove them.
+
+        Covers files written before the switch, or by old one-off scripts.
+        """
+        directory = Path(directory)
+        if not directory.exists():
+            return 0
+
+        imported = 0
+        for path in sorted(directory.glob("*.json")):
+            action_type = path.name.split("_", 1)[0]
+            if action_type not in ACTION_TYPES:
+                logger.warning(f"Unknown action file: {path.name}")
+                continue
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError as e:
+                logger.error(f"Invalid JSON in {path.name}: {e}")
+                path.unlink(missing_ok=True)
+                continue
+            self.enqueue(action_type, payload)
+            path.unlink(missing_ok=True)
+            imported += 1
+
+        if imported:
+            logger.info(f"Imported {imported} legacy action files from {directory}")
+        return imported
+
+    # --- Consumer side ---
+
+    def _recover_inflight(self):
+        """Re-queue actions that were being handled when the process died."""
+        with self._connect() as conn:
+            count = conn.execute(
+                "UPDATE actions SET status = 'pending' WHERE status = 'processing'"
+            ).rowcount
+        if count:
+            logger.info(f"Re-queued {count} in-flight dashboard actions")
+
+    def _claim_next(self) -> Optional[sqlite3.Row]:
+        with self._connect() as conn:
+            row = conn.execute(
+                """SELECT * FROM actions
+                   WHERE status = 'pending' AND available_at <= ?
+                   ORDER BY id LIMIT 1""",
+                (time.time(),)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE actions SET status = 'processing', attempts = attempts + 1 WHERE id = ?",
+                (row["id"],)
+            )
+        return row
+
+    def _next_due_in(self) -> Optional[float]:
+        """Seconds until the earliest delayed retry is due, or None."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MIN(available_at) FROM actions WHERE status = 'pending'"
+            ).fetchone()
+        if row[0] is None:
+            return None
+        return max(0.0, row[0] - time.time())
+
+    def _ack(self, action_id: int):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM actions WHERE id = ?", (action_id,))
+
+    def _fail(self, row: sqlite3.Row, error: str, final: bool = False) -> bool:
+        """Schedule a retry, or dead-letter the action. Returns True if dead-lettered."""
+        attempts = row["attempts"] + 1
+        with self._connect() as conn:
+            if final or attempts >= self.max_attempts:
+                conn.execute(
+                    """INSERT OR REPLACE INTO dead_letters
+                       (id, action_type, payload, attempts, last_error, created_at, failed_at)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                    (row["id"], row["action_type"], row["payload"], attempts,
+                     error, row["created_at"], datetime.now().isoformat())
+                )
+                conn.execute("DELETE FROM actions WHERE id = ?", (row["id"],))
+                return True
+            conn.execute(
+                """UPDATE actions SET status = 'pending', available_at = ?, last_error = ?
+                   WHERE id = ?""",
+                (time.time() + RETRY_BACKOFF_SECONDS * attempts, error, row["id"])
+            )
+        return False
+
+    async def _handle(
+        self,
+        row: sqlite3.Row,
+        handler: Callable[[str, dict], Awaitable[None]],
+        on_dead_letter: Optional[Callable[[str, dict, str], None]] = None,
+    ) -> bool:
+        """Run the handler for one claimed row, then ack or fail it."""
+        action_type = row["action_type"]
+        payload = json.loads(row["payload"])
+        try:
+            await handler(action_type, payload)
+        except Exception as e:
+            logger.error(f"Dashboard action #{row['id']} ({action_type}) failed: {e}")
+            final = isinstance(e, DeadLetter)
+            if await asyncio.to_thread(self._fail, row, str(e), final):
+                logger.error(f"Dashboard action #{row['id']} moved to dead letters")
+                if on_dead_letter:
+                    on_dead_letter(action_type, payload, str(e))
+            # A background failure lands while consume() may be sleeping;
+            # wake it so the retry's available_at is taken into account
+            if self._wakeup is not None:
+                self._wakeup.set()
+            return False
+        await asyncio.to_thread(self._ack, row["id"])
+        return True
+
+    async def drain(
+        self,
+        handler: Callable[[str, dict], Awaitable[None]],
+        on_dead_letter: Optional[Callable[[str, dict, str], None]] = None,
+        background_types: tuple[str, ...] = (),
+    ) -> int:
+        """
+        Handle every ready action in order. Returns the number handled.
+
+        Actions whose type is in background_types are started as tasks and
+        acked when they finish; they count as handled once dispatched.
+        """
+        handled = 0
+        while True:
+            row = await asyncio.to_thread(self._claim_next)
+            if row is None:
+                return handled
+
+            if row["action_type"] in background_types:
+                task = asyncio.create_task(self._handle(row, handler, on_dead_letter))
+                self._background.add(task)
+                task.add_done_callback(self._background.discard)
+                handled += 1
+            elif await self._handle(row, handler, on_dead_letter):
+                handled += 1
+
+    async def consume(
+        self,
+        handler: Callable[[str, dict], Awaitable[None]],
+        paused: Optional[Callable[[], bool]] = None,
+        on_dead_letter: Optional[Callable[[str, dict, str], None]] = None,
+        background_types: tuple[str, ...] = (),
+    ):
+        """
+        Run forever: drain the queue whenever a notify datagram arrives.
+
+        Args:
+            handler: async handler(action_type, payload)
+            paused: Optional check (e.g. kill switch); while it returns True,
+                actions stay queued
+            on_dead_letter: Optional callback(action_type, payload, error)
+            background_types: Action types to run as their own tasks instead
+                of blocking the queue (e.g. "render")
+        """
+        loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        transport = None
+        try:
+            transport, _ = await loop.create_datagram_endpoint(
+                lambda: _NotifyProtocol(self._wakeup),
+                local_addr=(NOTIFY_HOST, self.notify_port),
+            )
+            logger.info(f"Action queue listening on {NOTIFY_HOST}:{self.notify_port}")
+        except OSError as e:
+            logger.warning(
+                f"Action queue notify port {self.notify_port} unavailable ({e}); "
+                f"falling back to {IDLE_SWEEP_SECONDS}s sweeps"
+            )
+
+        await asyncio.to_thread(self._recover_inflight)
+        try:
+            while True:
+                self._wakeup.clear()
+                is_paused = bool(paused and paused())
+                if not is_paused:
+                    await self.drain(handler, on_dead_letter, background_types)
+
+                timeout = PAUSED_RECHECK_SECONDS if is_paused else IDLE_SWEEP_SECONDS
+                due_in = await asyncio.to_thread(self._next_due_in)
+                if due_in is not None:
+                    timeout = min(timeout, due_in)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if transport is not None:
+                transport.close()
+            # Unfinished background actions stay 'processing' and are
+            # re-queued by _recover_inflight() on the next start
+            for task in list(self._background):
+                task.cancel()
+
+    def stats(self) -> dict:
+        """Queue depth and dead-letter count."""
+        with self._connect() as conn:
+            pending = conn.execute("SELECT COUNT(*) FROM actions").fetchone()[0]
+            dead = conn.execute("SELECT COUNT(*) FROM dead_letters").fetchone()[0]
+        return {"pending": pending, "dead_letters": dead}
@@ -49,9 +49,14 @@ class ApprovalQueue:
                     created_at TEXT NOT NULL,
                     reviewed_at TEXT,
                     executed_at TEXT,
-                    cost_estimate REAL DEFAULT 0.0
+                    cost_estimate REAL DEFAULT 0.0,
+                    execution_state TEXT
                 )
             """)
+            # execution_state: NULL -> 'claimed' (side effect under way) -> 'done'
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(approvals)")}
+            if "execution_state" not in columns:
+                conn.execute("ALTER TABLE approvals ADD COLUMN execution_state TEXT")
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_approvals_status
                 ON approvals(status)
@@ -123,10 +128,48 @@ class ApprovalQueue:
         """Mark an approved action as executed."""
         with self._connect() as conn:
             conn.execute(
-                """UPDATE approvals SET executed_at=? WHERE id=?""",
+                """UPDATE approvals SET executed_at=?, execution_state='done'
+                   WHERE id=?""",
                 (datetime.now().isoformat(), approval_id)
             )
 
+    def claim_execution(self, approval_id: int) -> str | None:
+        """
+        Atomically claim an approval before running its side effect.
+
+        Returns None if this call took the claim. Otherwise returns the state
+        it was already in: 'claimed' (a side effect is under way, or was
+        interrupted by a crash) or 'done' (already executed / scheduled /
+        rendered). Finish with mark_executed() or release_execution().
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """UPDATE approvals SET execution_state='claimed'
+                   WHERE id=? AND execution_state IS NULL
+                   AND executed_at IS NULL""",
+                (approval_id,)
+            )
+            if cursor.rowcount == 1:
+                return None
+            row = conn.execute(
+                "SELECT execution_state, executed_at FROM approvals WHERE id=?",
+                (approval_id,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"Approval #{approval_id} not found")
+        if row["executed_at"] or row["execution_state"] == "done":
+            return "done"
+        return "claimed"
+
+    def release_execution(self, approval_id: int):
+        """Drop a claim after its side effect failed, so it can be retried."""
+        with self._connect() as conn:
+            conn.execute(
+                """UPDATE approvals SET execution_state=NULL
+                   WHERE id=? AND execution_state='claimed'""",
+                (approval_id,)
+            )
+
     def get_pending(self, project_id: str | None = None) -> list[dict]:
         """Get all pending approvals."""
         with self._connect() as conn:
@@ -0,0 +1,224 @@
+"""
+Asset Cache - content-addressed store for generated media.
+
+Image, animation and speech generation (Leonardo, Flux, Runway, ElevenLabs)
+are the most expensive calls in the pipelines. Re-rendering a project after a
+small script tweak used to pay for every asset again. The asset cache keys
+each generated file by a hash of provider + model + prompt + parameters, so
+an identical request is served from disk instead of calling out.
+
+Only the bytes are safe to reuse. Provider-hosted URLs kept in `meta` expire,
+so on a hit callers that need a URL downstream should pass data_uri(data)
+instead of a stored URL.
+
+Files live under data/asset_cache/<xx>/<key>, indexed in a small SQLite DB.
+The store is size-bounded: least-recently-used entries are evicted once the
+total exceeds max_bytes. Hit/miss counts are tracked per provider.
+
+Usage:
+    from core.asset_cache import get_asset_cache
+
+    cache = get_asset_cache()
+    data, meta, hit = await cache.get_or_generate(
+        "leonardo", {"model": model_id, "prompt": prompt}, generate
+    )
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(os.environ.get("ASSET_CACHE_DIR", "data/asset_cache"))
+DEFAULT_MAX_BYTES = int(os.environ.get("ASSET_CACHE_MAX_MB", "5120")) * 1024 * 1024
+
+
+class AssetCache:
+    """Size-bounded, content-addressed LRU store for generated assets."""
+
+    def __init__(self, root: Path = CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.db_path = self.root / "index.db"
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS assets (
+                    key TEXT PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    meta TEXT,
+                    created_at DATETIME,
+                    last_access DATETIME
+                );
+                CREATE INDEX IF NOT EXISTS idx_assets_access
+                    ON assets(last_access);
+
+                CREATE TABLE IF NOT EXISTS cache_stats (
+                    provider TEXT PRIMARY KEY,
+                    hits INTEGER DEFAULT 0,
+                    misses INTEGER DEFAULT 0,
+                    evictions INTEGER DEFAULT 0
+                );
+            """)
+
+    @staticmethod
+    def make_key(provider: str, params: dict) -> str:
+        """Hash provider + generation parameters into a stable cache key."""
+        canonical = json.dumps({"provider": provider, **params}, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def _count(self, conn: sqlite3.Connection, provider: str, column: str, n: int = 1):
+        conn.execute(
+            f"""INSERT INTO cache_stats (provider, {column}) VALUES (?, ?)
+                ON CONFLICT(provider) DO UPDATE SET {column} = {column} + excluded.{column}""",
+            (provider, n)
+        )
+
+    def get(self, key: str, provider: str = "") -> Optional[tuple[bytes, dict]]:
+        """Return (data, meta) for a cached asset, or None on a miss."""
+        path = self._path(key)
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT meta FROM assets WHERE key = ?", (key,)).fetchone()
+            if row is None or not path.exists():
+                if row is not None:
+                    conn.execute("DELETE FROM assets WHERE key = ?", (key,))
+                self._count(conn, provider, "misses")
+                return None
+            conn.execute(
+                "UPDATE assets SET last_access = ? WHERE key = ?",
+                (datetime.now().isoformat(), key)
+            )
+            self._count(conn, provider, "hits")
+        return path.read_bytes(), json.loads(row["meta"] or "{}")
+
+    def put(self, key: str, data: bytes, provider: str,
+            meta: Optional[dict] = None) -> Path:
+        """Store an asset, evicting least-recently-used entries if over budget."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+
+        now = datetime.now().isoformat()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                """INSERT OR REPLACE INTO assets
+                   (key, provider, size, meta, created_at, last_access)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (key, provider, len(data), json.dumps(meta or {}), now, now)
+            )
+            self._evict(conn, keep=key)
+        return path
+
+    def _evict(self, conn: sqlite3.Connection, keep: str):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM assets").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for row in conn.execute(
+            "SELECT key, provider, size FROM assets WHERE key != ? ORDER BY last_access",
+            (keep,)
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._path(row["key"]).unlink(missing_ok=True)
+            conn.execute("DELETE FROM assets WHERE key = ?", (row["key"],))
+            self._count(conn, row["provider"], "evictions")
+            total -= row["size"]
+            logger.debug(f"Asset cache evicted {row['key'][:12]} ({row['size']} bytes)")
+
+    async def get_or_generate(
+        self,
+        provider: str,
+        params: dict,
+        generate: Callable[[], Awaitable[tuple[bytes, dict]]],
+    ) -> tuple[bytes, dict, bool]:
+        """
+        Serve an asset from cache, or generate and store it.
+
+        Args:
+            provider: Provider name (leonardo, flux, runway, elevenlabs, ...)
+            params: Everything that determines the output (model, prompt, settings)
+            generate: Coroutine factory returning (data, meta) on a miss
+
+        Returns:
+            (data, meta, hit)
+        """
+        key = self.make_key(provider, params)
+        cached = self.get(key, provider)
+        if cached is not None:
+            logger.info(f"Asset cache hit: {provider} {key[:12]}")
+            return cached[0], cached[1], True
+
+        data, meta = await generate()
+        self.put(key, data, provider, meta)
+        return data, meta, False
+
+    def stats(self) -> dict:
+        """Hit/miss/eviction counts per provider, plus current store size."""
+        with self._connect() as conn:
+            providers = {
+                row["provider"]: {
+                    "hits": row["hits"],
+                    "misses": row["misses"],
+                    "evictions": row["evictions"],
+                    "hit_rate": round(row["hits"] / (row["hits"] + row["misses"]), 3)
+                    if row["hits"] + row["misses"] else 0.0,
+                }
+                for row in conn.execute("SELECT * FROM cache_stats ORDER BY provider")
+            }
+            size = conn.execute(
+                "SELECT COUNT(*) AS entries, COALESCE(SUM(size), 0) AS bytes FROM assets"
+            ).fetchone()
+        return {
+            "entries": size["entries"],
+            "bytes": size["bytes"],
+            "max_bytes": self.max_bytes,
+            "providers": providers,
+        }
+
+
+def data_uri(data: bytes) -> str:
+    """Inline cached media as a data: URI, for APIs that take a URL input."""
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        mime = "image/png"
+    elif data[:2] == b"\xff\xd8":
+        mime = "image/jpeg"
+    elif data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        mime = "image/webp"
+    else:
+        mime = "application/octet-stream"
+    return f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+_cache: Optional[AssetCache] = None
+
+
+def get_asset_cache() -> AssetCache:
+    """Return the process-wide asset cache."""
+    global _cache
+    if _cache is None:
+        _cache = AssetCache()
+    return _cache
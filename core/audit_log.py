@@ -7,19 +7,45 @@ Every action the system takes is recorded. This provides:
 3. Severity-based alerting (Ganzak Rule 8)
 """
 
+import asyncio
+import atexit
+import logging
 import sqlite3
+import threading
 from datetime import datetime, date
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
 
-class AuditLog:
 
-    def __init__(self, db_path: str = "data/audit_log.db"):
+class AuditLog:
+    """
+    Buffered audit log.
+
+    log() only appends to an in-memory buffer. Entries are written in one
+    transaction when the buffer reaches batch_size, every flush_interval
+    seconds from the background flusher (see start()), immediately for
+    critical severity, and on close()/interpreter exit. Without a running
+    flusher the size trigger writes inline, so sync scripts lose nothing.
+    """
+
+    def __init__(self, db_path: str = "data/audit_log.db",
+                 batch_size: int = 50, flush_interval: float = 2.0):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._alert_callback = None
         self._init_db()
 
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer: list[tuple] = []
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flusher: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        atexit.register(self.flush)
+
     def _init_db(self):
         with self._connect() as conn:
             conn.execute("""
@@ -71,17 +97,20 @@ class AuditLog:
             reject   - Rejected, user intervention needed
             critical - STOP EVERYTHING, alert immediately
         """
-        with self._connect() as conn:
-            conn.execute(
-                """INSERT INTO audit_log
-                   (timestamp, project_id, agent_id, severity,
-                    category, action, details, tokens_used,
-                    cost_usd, model, success)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (datetime.now().isoformat(), project_id, agent_id,
+        entry = (datetime.now().isoformat(), project_id, agent_id,
                  severity, category, action, details, tokens,
                  cost, model, 1 if success else 0)
-            )
+        with self._buffer_lock:
+            self._buffer.append(entry)
+            pending = len(self._buffer)
+
+        if severity == "critical":
+            self.flush()
+        elif pending >= self.batch_size:
+            if self._flusher and not self._flusher.done():
+                self._loop.call_soon_threadsafe(self._wake.set)
+            else:
+                self.flush()
 
         # Alert on high severity (Ganzak Rule 7: pipe errors to messenger)
         if severity in ("block", "reject", "critical") and self._alert_callback:
@@ -89,8 +118,61 @@ class AuditLog:
                 f"[{severity.upper()}] {category}: {action}\n{details}"
             )
 
+    def flush(self):
+        """Write all buffered entries in a single transaction."""
+        with self._flush_lock:
+            with self._buffer_lock:
+                batch, self._buffer = self._buffer, []
+            if not batch:
+                return
+            try:
+                with self._connect() as conn:
+                    conn.executemany(
+                        """INSERT INTO audit_log
+                           (timestamp, project_id, agent_id, severity,
+                            category, action, details, tokens_used,
+                            cost_usd, model, success)
+                           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                        batch
+                    )
+            except sqlite3.Error as e:
+                # Put the batch back so the next flush retries it
+                logger.error(f"Audit flush failed ({len(batch)} entries): {e}")
+                with self._buffer_lock:
+                    self._buffer[:0] = batch
+
+    async def start(self):
+        """Start the background flusher on the running event loop."""
+        if self._flusher and not self._flusher.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        """Flush on the size trigger (woken via _wake) or every flush_interval."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await asyncio.to_thread(self.flush)
+
+    async def close(self):
+        """Stop the background flusher and drain the buffer."""
+        if self._flusher:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await asyncio.to_thread(self.flush)
+
     def get_daily_summary(self, project_id: str) -> dict:
         """Generate daily summary for reporting."""
+        self.flush()
         today = date.today().isoformat()
         with self._connect() as conn:
             total = conn.execute(
@@ -135,6 +217,7 @@ class AuditLog:
     def get_recent(self, project_id: str | None = None,
                    limit: int = 50) -> list[dict]:
         """Get recent log entries."""
+        self.flush()
         with self._connect() as conn:
             if project_id:
                 rows = conn.execute(
@@ -12,10 +12,11 @@ This is the fundamental execution cycle:
 Inspired by OpenClaw's proven architecture but with safety-first design.
 """
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Callable
 
 from core.model_router import ModelRouter, ModelConfig
 from core.approval_queue import ApprovalQueue
@@ -25,6 +26,18 @@ from core.kill_switch import KillSwitch, KillSwitchActive
 
 logger = logging.getLogger(__name__)
 
+# Suffix appended to tool results truncated by AgentEngine._compact_context
+COMPACTION_MARKER = "chars removed by context compaction]"
+
+
+class OutputRejected(Exception):
+    """A streamed response was aborted because it failed output validation."""
+
+    def __init__(self, reason: str, partial: str = ""):
+        super().__init__(reason)
+        self.reason = reason
+        self.partial = partial
+
 
 @dataclass
 class ToolDefinition:
@@ -34,6 +47,7 @@ class ToolDefinition:
     parameters: dict          # JSON Schema for parameters
     requires_approval: bool = False
     execute_fn: Any = None    # Callable that executes the tool
+    timeout: float | None = None  # Seconds; None uses the engine default
 
 
 @dataclass
@@ -104,7 +118,9 @@ class AgentEngine:
                  token_budget: TokenBudgetManager,
                  audit_log: AuditLog,
                  kill_switch: KillSwitch,
-                 allowed_tools: list[str] | None = None):
+                 allowed_tools: list[str] | None = None,
+                 tool_timeout: float = 120.0,
+                 compact_threshold_tokens: int = 40000):
         self.router = model_router
         self.tools = tool_registry
         self.queue = approval_queue
@@ -112,13 +128,24 @@ class AgentEngine:
         self.audit = audit_log
         self.kill = kill_switch
         self.allowed_tools = allowed_tools or []
+        self.tool_timeout = tool_timeout
+        self.compact_threshold_tokens = compact_threshold_tokens
 
     async def run(self, context: AgentContext, task: str,
                   system_prompt: str = "",
-                  max_iterations: int = 20) -> str:
+                  max_iterations: int = 20,
+                  output_validator: Callable[[], Any] | None = None) -> str:
         """
         Execute the tool loop.
 
+        Args:
+            output_validator: Optional factory returning a fresh stream
+                checker (feed(delta) -> reason, finish() -> (ok, reason))
+                per LLM call. When set, responses are streamed and the
+                draft raises OutputRejected (and the stream is closed) as
+                soon as it breaks the rules. Text after a tool call has
+                begun is not validated.
+
         Returns the final text response, or a status message if
         waiting for approval or blocked by safety.
         """
@@ -159,16 +186,23 @@ class AgentEngine:
             if not self.budget.has_budget(context.project_id):
                 return "[BLOCKED] Budget exhausted during execution."
 
+            # Shrink old tool results once the context gets large
+            compacted_tokens = self._compact_context(context)
+
             # Select model
             model = self.router.select_model(context.task_type)
             context.model_used = model.name
 
             # Call LLM
             try:
-                response = await self.router.invoke(
+                response = await self._call_model(
                     model, context.messages,
-                    tools=tool_schemas if tool_schemas else None,
+                    tool_schemas if tool_schemas else None,
+                    output_validator,
                 )
+            except OutputRejected as e:
+                self._record_rejected(context, model, e)
+                raise
             except Exception as e:
                 # Try escalating to a more capable model
                 logger.warning(f"Model {model.name} failed: {e}")
@@ -176,12 +210,16 @@ class AgentEngine:
                 if next_model:
                     logger.info(f"Escalating to {next_model.name}")
                     try:
-                        response = await self.router.invoke(
+                        response = await self._call_model(
                             next_model, context.messages,
-                            tools=tool_schemas if tool_schemas else None,
+                            tool_schemas if tool_schemas else None,
+                            output_validator,
                         )
                         model = next_model
                         context.model_used = model.name
+                    except OutputRejected as e2:
+                        self._record_rejected(context, next_model, e2)
+                        raise
                     except Exception as e2:
                         self.audit.log(
                             context.project_id, "reject", "llm",
@@ -201,9 +239,14 @@ class AgentEngine:
             usage = response.get("usage", {})
             tokens_in = usage.get("input_tokens", 0)
             tokens_out = usage.get("output_tokens", 0)
-            cost = self.budget.calculate_cost(model.name, tokens_in, tokens_out)
+            cache_read = usage.get("cache_read_tokens", 0)
+            cache_write = usage.get("cache_write_tokens", 0)
+            cost = self.budget.calculate_cost(
+                model.name, tokens_in, tokens_out,
+                cache_read_tokens=cache_read, cache_write_tokens=cache_write,
+            )
 
-            context.total_tokens += tokens_in + tokens_out
+            context.total_tokens += tokens_in + cache_read + cache_write + tokens_out
             context.total_cost += cost
 
             self.budget.record_usage(
@@ -212,74 +255,70 @@ class AgentEngine:
                 task_type=context.task_type,
                 agent_id=context.agent_id,
             )
+            self.budget.record_prompt_savings(
+                context.project_id, model.name,
+                uncached_input=tokens_in,
+                cache_read_tokens=cache_read,
+                cache_write_tokens=cache_write,
+                compacted_tokens=compacted_tokens,
+            )
 
             # Process tool calls
             if response.get("tool_calls"):
+                # Calls before the first one needing approval run concurrently;
+                # the approval gate then stops the loop as before.
+                runnable = []
+                approval_call = None
                 for tool_call in response["tool_calls"]:
-                    tool_name = tool_call["name"]
-                    tool_args = tool_call["arguments"]
-
-                    # Check if tool is allowed
-                    if tool_name not in self.allowed_tools:
-                        context.messages.append({
-                            "role": "assistant",
-                            "content": None,
-                            "tool_calls": [tool_call],
-                        })
+                    tool_def = self.tools.get(tool_call["name"])
+                    if (tool_call["name"] in self.allowed_tools
+                            and tool_def and tool_def.requires_approval):
+                        approval_call = tool_call
+                        break
+                    runnable.append(tool_call)
+
+                if runnable:
+                    results = await asyncio.gather(*(
+                        self._run_tool_call(context, tool_call)
+                        for tool_call in runnable
+                    ))
+
+                    # One assistant turn with every tool_use block, then the
+                    # results in the same order the model asked for them
+                    context.messages.append({
+                        "role": "assistant",
+                        "content": None,
+                        "tool_calls": runnable,
+                    })
+                    for tool_call, result in zip(runnable, results):
                         context.messages.append({
                             "role": "tool",
                             "tool_use_id": tool_call["id"],
-                            "content": f"[BLOCKED] Tool '{tool_name}' not allowed.",
+                            "content": result,
                         })
-                        self.audit.log(
-                            context.project_id, "block", "tool",
-                            f"Blocked tool: {tool_name}",
-                            agent_id=context.agent_id
-                        )
-                        continue
-
-                    # Check if tool requires approval
-                    tool_def = self.tools.get(tool_name)
-                    if tool_def and tool_def.requires_approval:
-                        approval_id = self.queue.submit(
-                            project_id=context.project_id,
-                            agent_id=context.agent_id,
-                            action_type=tool_name,
-                            action_data=tool_args,
-                            context_summary=task[:200],
-                            cost_estimate=context.total_cost,
-                        )
-                        self.audit.log(
-                            context.project_id, "info", "approval",
-                            f"Queued for approval: {tool_name}",
-                            details=json.dumps(tool_args)[:500],
-                            agent_id=context.agent_id,
-                        )
-                        return (
-                            f"[AWAITING APPROVAL #{approval_id}] "
-                            f"Action: {tool_name}\n"
-                            f"Preview: {self.queue.format_preview(self.queue.get_by_id(approval_id))}"
-                        )
 
-                    # Execute tool
+                if approval_call:
+                    tool_name = approval_call["name"]
+                    tool_args = approval_call["arguments"]
+                    approval_id = self.queue.submit(
+                        project_id=context.project_id,
+                        agent_id=context.agent_id,
+                        action_type=tool_name,
+                        action_data=tool_args,
+                        context_summary=task[:200],
+                        cost_estimate=context.total_cost,
+                    )
                     self.audit.log(
-                        context.project_id, "info", "tool",
-                        f"Executing: {tool_name}",
+                        context.project_id, "info", "approval",
+                        f"Queued for approval: {tool_name}",
+                        details=json.dumps(tool_args)[:500],
                         agent_id=context.agent_id,
                     )
-                    result = await self.tools.execute(tool_name, tool_args)
-
-                    # Add tool result to conversation
-                    context.messages.append({
-                        "role": "assistant",
-                        "content": None,
-                        "tool_calls": [tool_call],
-                    })
-                    context.messages.append({
-                        "role": "tool",
-                        "tool_use_id": tool_call["id"],
-                        "content": str(result),
-                    })
+                    return (
+                        f"[AWAITING APPROVAL #{approval_id}] "
+                        f"Action: {tool_name}\n"
+                        f"Preview: {self.queue.format_preview(self.queue.get_by_id(approval_id))}"
+                    )
 
             else:
                 # Text response - we're done
@@ -304,3 +343,156 @@ class AgentEngine:
             agent_id=context.agent_id,
         )
         return "[MAX_ITERATIONS] Agent reached iteration limit."
+
+    async def _call_model(self, model: ModelConfig, messages: list,
+                          tools: list[dict] | None,
+                          output_validator: Callable[[], Any] | None) -> dict:
+        """
+        One LLM call. Without a validator this is a plain invoke(); with
+        one, the response is streamed and each text delta is checked.
+
+        A violating draft is aborted as soon as it is seen, before the
+        rest of the completion is generated. Text streamed after a tool
+        call has begun (a tool_start event) belongs to a tool-loop turn
+        and is not checked. Text before it is checked like a final
+        answer, since until then the turn may well be one.
+        """
+        if output_validator is None:
+            return await self.router.invoke(
+                model, messages, tools=tools, cache_prompt=True,
+            )
+
+        checker = output_validator()
+        text = ""
+        calling_tools = False
+        stream = self.router.invoke_stream(
+            model, messages, tools=tools, cache_prompt=True,
+        )
+        try:
+            async for event in stream:
+                if event["type"] == "text":
+                    text += event["text"]
+                    if not calling_tools:
+                        reason = checker.feed(event["text"])
+                        if reason:
+                            raise OutputRejected(reason, text)
+                elif event["type"] == "tool_start":
+                    calling_tools = True
+                elif event["type"] == "done":
+                    if event.get("tool_calls"):
+                        return event
+                    is_valid, reason = checker.finish()
+                    if not is_valid:
+                        raise OutputRejected(reason, text)
+                    return event
+        finally:
+            await stream.aclose()
+        raise RuntimeError(f"{model.name} stream ended without a final response")
+
+    def _record_rejected(self, context: AgentContext, model: ModelConfig,
+                         rejected: OutputRejected):
+        """Account for an aborted draft (usage estimated, no final usage event)."""
+        tokens_in = self._estimate_tokens(context.messages)
+        tokens_out = len(rejected.partial) // 4
+        cost = self.budget.calculate_cost(model.name, tokens_in, tokens_out)
+        context.total_tokens += tokens_in + tokens_out
+        context.total_cost += cost
+        self.budget.record_usage(
+            context.project_id, model.name,
+            tokens_in, tokens_out, cost,
+            task_type=context.task_type,
+            agent_id=context.agent_id,
+        )
+        self.audit.log(
+            context.project_id, "warn", "llm",
+            f"Draft aborted by output validation: {rejected.reason}",
+            details=rejected.partial[:200],
+            agent_id=context.agent_id,
+            model=model.name,
+        )
+
+    def _compact_context(self, context: AgentContext,
+                         keep_recent: int = 2,
+                         keep_chars: int = 400) -> int:
+        """
+        Truncate old tool results once the context passes the token threshold.
+
+        Results from the most recent `keep_recent` tool turns are left intact;
+        older ones are cut to their first `keep_chars` characters. Already
+        compacted results are stable, so the cached prefix only shifts when a
+        new batch gets compacted. Returns the estimated tokens removed.
+        """
+        if self._estimate_tokens(context.messages) <= self.compact_threshold_tokens:
+            return 0
+
+        tool_turns = [
+            i for i, msg in enumerate(context.messages)
+            if msg["role"] == "assistant" and msg.get("tool_calls")
+        ]
+        if len(tool_turns) <= keep_recent:
+            return 0
+        cutoff = tool_turns[-keep_recent]
+
+        removed_chars = 0
+        for msg in context.messages[:cutoff]:
+            content = msg.get("content")
+            if (msg["role"] != "tool" or not isinstance(content, str)
+                    or len(content) <= keep_chars
+                    or content.endswith(COMPACTION_MARKER)):
+                continue
+            msg["content"] = (
+                f"{content[:keep_chars]}\n"
+                f"[... {len(content) - keep_chars} {COMPACTION_MARKER}"
+            )
+            removed_chars += len(content) - len(msg["content"])
+
+        if removed_chars:
+            logger.info(f"Compacted context: ~{removed_chars // 4} tokens removed")
+        return removed_chars // 4
+
+    @staticmethod
+    def _estimate_tokens(messages: list) -> int:
+        """Rough token estimate (~4 chars per token)."""
+        return sum(len(str(m.get("content") or "")) for m in messages) // 4
+
+    async def _run_tool_call(self, context: AgentContext, tool_call: dict) -> str:
+        """
+        Execute one tool call (no approval gate) and return its result text.
+
+        Disallowed tools are blocked, and each execution is bounded by the
+        tool's own timeout or the engine default.
+        """
+        tool_name = tool_call["name"]
+
+        # Check if tool is allowed
+        if tool_name not in self.allowed_tools:
+            self.audit.log(
+                context.project_id, "block", "tool",
+                f"Blocked tool: {tool_name}",
+                agent_id=context.agent_id
+            )
+            return f"[BLOCKED] Tool '{tool_name}' not allowed."
+
+        tool_def = self.tools.get(tool_name)
+        timeout = (tool_def.timeout if tool_def and tool_def.timeout
+                   else self.tool_timeout)
+
+        self.audit.log(
+            context.project_id, "info", "tool",
+            f"Executing: {tool_name}",
+            agent_id=context.agent_id,
+        )
+        try:
+            result = await asyncio.wait_for(
+                self.tools.execute(tool_name, tool_call["arguments"]),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            self.audit.log(
+                context.project_id, "warn", "tool",
+                f"Timed out after {timeout}s: {tool_name}",
+                agent_id=context.agent_id, success=False,
+            )
+            return f"[TIMEOUT] Tool '{tool_name}' did not finish within {timeout}s."
+
+        return str(result)
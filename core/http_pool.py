@@ -0,0 +1,231 @@
+"""
+Shared HTTP client pool.
+
+One pooled httpx.AsyncClient for the whole process, instead of every scraper
+and tool building its own. Adds:
+- HTTP/2 when the optional `h2` package is installed
+- A per-host in-flight limit so concurrent scrapers don't hammer one site
+- A persistent conditional-GET cache (ETag / Last-Modified) so unchanged
+  feeds come back as a cheap 304 that callers can skip entirely
+
+Usage:
+    from core.http_pool import get_http_client
+
+    client = get_http_client()
+    response = await client.get(url, conditional=True)
+    if response.status_code == 304:
+        return []   # Nothing changed since the last fetch
+    items = parse(response)
+    ...             # Once the items are safely stored:
+    client.commit(response)
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = Path("data/http_cache.db")
+
+DEFAULT_MAX_CONNECTIONS = 50
+DEFAULT_PER_HOST = 6
+DEFAULT_TIMEOUT = 30.0
+
+# Query params that carry credentials; never persisted in validator keys
+CREDENTIAL_PARAMS = {"key", "api_key", "apikey", "access_token", "token", "client_secret"}
+
+# Response.extensions key holding the validator cache key until commit()
+VALIDATOR_KEY = "http_pool.validator_key"
+
+
+def _cache_key(url: str) -> str:
+    """Validator cache key: the URL with credential query params removed."""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if k.lower() not in CREDENTIAL_PARAMS]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class SharedHTTPClient:
+    """Process-wide pooled HTTP client with per-host limits and a validator cache."""
+
+    def __init__(self, max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 per_host: int = DEFAULT_PER_HOST,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 cache_path: Path = CACHE_PATH):
+        self.max_connections = max_connections
+        self.per_host = per_host
+        self.timeout = timeout
+        self.cache_path = Path(cache_path)
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_cache()
+        self._cache_lock = threading.Lock()
+
+        self._loop = None
+        self._client: httpx.AsyncClient | None = None
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self.stats = {"requests": 0, "not_modified": 0}
+
+    def _init_cache(self):
+        conn = sqlite3.connect(str(self.cache_path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS http_validators (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                updated_at TEXT
+            )
+        """)
+        # Drop keys written before credentials were stripped from them
+        for (url,) in conn.execute("SELECT url FROM http_validators").fetchall():
+            if _cache_key(url) != url:
+                conn.execute("DELETE FROM http_validators WHERE url = ?", (url,))
+        conn.commit()
+        conn.close()
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        """Build the pooled client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._client is not None:
+            return self._client
+
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        self._loop = loop
+        self._host_slots = {}
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
+        return self._client
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.per_host)
+        return self._host_slots[host]
+
+    # --- Validator cache ---
+
+    def _get_validators(self, url: str) -> dict:
+        with self._cache_lock:
+            conn = sqlite3.connect(str(self.cache_path))
+            row = conn.execute(
+                "SELECT etag, last_modified FROM http_validators WHERE url = ?",
+                (url,)
+            ).fetchone()
+            conn.close()
+        headers = {}
+        if row:
+            if row[0]:
+                headers["If-None-Match"] = row[0]
+            if row[1]:
+                headers["If-Modified-Since"] = row[1]
+        return headers
+
+    def _store_validators(self, url: str, response: httpx.Response):
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        with self._cache_lock:
+            conn = sqlite3.connect(str(self.cache_path))
+            conn.execute(
+                """INSERT OR REPLACE INTO http_validators
+                   (url, etag, last_modified, updated_at) VALUES (?, ?, ?, ?)""",
+                (url, etag, last_modified, datetime.now().isoformat())
+            )
+            conn.commit()
+            conn.close()
+
+    def commit(self, response: httpx.Response):
+        """
+        Save the validators from a conditional 200 once its body is handled.
+
+        Until this is called the next conditional GET refetches the full
+        body, so a response that failed to parse or whose items were never
+        stored isn't turned into a 304 that hides them. No-op for 304s and
+        non-conditional responses.
+        """
+        cache_key = response.extensions.get(VALIDATOR_KEY)
+        if cache_key:
+            self._store_validators(cache_key, response)
+
+    # --- Requests ---
+
+    async def request(self, method: str, url: str, *,
+                      conditional: bool = False, **kwargs) -> httpx.Response:
+        """
+        Send a request through the shared pool.
+
+        With conditional=True (GET only), stored ETag/Last-Modified values
+        are sent. A 304 response is returned as-is for the caller to
+        short-circuit on; a 200's fresh validators are only saved when the
+        caller passes it to commit() after processing the body.
+        """
+        client = self._ensure_client()
+
+        cache_key = None
+        if conditional and method.upper() == "GET":
+            cache_key = _cache_key(str(httpx.URL(url, params=kwargs.get("params"))))
+            validators = self._get_validators(cache_key)
+            if validators:
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), **validators}
+
+        async with self._host_slot(url):
+            response = await client.request(method, url, **kwargs)
+
+        self.stats["requests"] += 1
+        if cache_key:
+            if response.status_code == 304:
+                self.stats["not_modified"] += 1
+            elif response.status_code == 200:
+                response.extensions[VALIDATOR_KEY] = cache_key
+        return response
+
+    async def get(self, url: str, *, conditional: bool = False, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, conditional=conditional, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self):
+        """Close the underlying pooled client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._loop = None
+
+
+_shared: SharedHTTPClient | None = None
+
+
+def get_http_client() -> SharedHTTPClient:
+    """Return the process-wide shared HTTP client."""
+    global _shared
+    if _shared is None:
+        _shared = SharedHTTPClient()
+    return _shared
+
+
+async def close_http_client():
+    """Close the process-wide shared HTTP client (call on shutdown)."""
+    if _shared is not None:
+        await _shared.aclose()
@@ -0,0 +1,166 @@
+"""
+Keyword Matcher - multi-pattern substring matching in one pass.
+
+Entity and keyword dictionaries (trend entities, goal keywords, news
+relevance terms) used to be matched by scanning the text once per pattern.
+KeywordMatcher compiles the whole dictionary into an Aho-Corasick automaton
+so every hit is found in a single linear pass over the text.
+
+Matching is case-insensitive substring matching - the same semantics as the
+old `pattern in text.lower()` loops, overlapping hits included.
+
+Uses the `ahocorasick` C extension (pyahocorasick) when installed, otherwise
+a pure-Python automaton.
+
+Usage:
+    from core.keyword_matcher import get_matcher
+
+    matcher = get_matcher({"claude code": "Claude Code", "claude": "Claude"})
+    matcher.find_values("Trying Claude Code today")  # {"Claude Code", "Claude"}
+"""
+
+import logging
+from collections import deque
+from typing import Hashable, Iterable, Mapping, Union
+
+logger = logging.getLogger(__name__)
+
+Patterns = Union[Mapping[str, Hashable], Iterable[str]]
+
+
+class KeywordMatcher:
+    """Compiled Aho-Corasick automaton over a fixed set of patterns."""
+
+    def __init__(self, patterns: Patterns):
+        """
+        Args:
+            patterns: Either an iterable of pattern strings, or a mapping of
+                pattern -> value. A mapping whose values are lists/sets maps
+                one pattern to several values (e.g. a keyword shared by goals).
+        """
+        self._values: dict[str, set] = {}
+        items = patterns.items() if isinstance(patterns, Mapping) else ((p, p) for p in patterns)
+        for pattern, value in items:
+            key = pattern.lower()
+            if not key:
+                continue
+            bucket = self._values.setdefault(key, set())
+            if isinstance(value, (list, tuple, set, frozenset)):
+                bucket.update(value)
+            else:
+                bucket.add(value)
+
+        self._patterns = list(self._values)
+        self._native = self._build_native()
+        if self._native is None:
+            self._build_python()
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    # --- Construction ---
+
+    def _build_native(self):
+        try:
+            import ahocorasick
+        except ImportError:
+            return None
+        automaton = ahocorasick.Automaton()
+        for idx, pattern in enumerate(self._patterns):
+            automaton.add_word(pattern, idx)
+        if self._patterns:
+            automaton.make_automaton()
+        return automaton
+
+    def _build_python(self):
+        """Build goto/fail/output tables for the pure-Python fallback."""
+        goto: list[dict[str, int]] = [{}]
+        output: list[tuple[int, ...]] = [()]
+
+        for idx, pattern in enumerate(self._patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    output.append(())
+                state = nxt
+            output[state] = output[state] + (idx,)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                # Inherit matches that end at the fallback state
+                output[nxt] = output[nxt] + output[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+
+    # --- Matching ---
+
+    def _hit_indexes(self, text: str) -> set[int]:
+        text = text.lower()
+        if not self._patterns:
+            return set()
+
+        if self._native is not None:
+            return {idx for _, idx in self._native.iter(text)}
+
+        goto, fail, output = self._goto, self._fail, self._output
+        hits: set[int] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                hits.update(output[state])
+        return hits
+
+    def find(self, text: str) -> set[str]:
+        """Return the distinct (lowercased) patterns that occur in text."""
+        patterns = self._patterns
+        return {patterns[idx] for idx in self._hit_indexes(text)}
+
+    def find_values(self, text: str) -> set:
+        """Return the union of values for every pattern that occurs in text."""
+        values: set = set()
+        for pattern in self.find(text):
+            values.update(self._values[pattern])
+        return values
+
+
+_matchers: dict[frozenset, KeywordMatcher] = {}
+
+
+def get_matcher(patterns: Patterns) -> KeywordMatcher:
+    """
+    Return a compiled matcher for this pattern set.
+
+    Matchers are cached by content, so the automaton is only rebuilt when
+    the underlying entity/keyword config actually changes.
+    """
+    if isinstance(patterns, Mapping):
+        key = frozenset(
+            (p, frozenset(v) if isinstance(v, (list, tuple, set, frozenset)) else v)
+            for p, v in patterns.items()
+        )
+    else:
+        key = frozenset(patterns)
+
+    matcher = _matchers.get(key)
+    if matcher is None:
+        matcher = KeywordMatcher(patterns)
+        _matchers[key] = matcher
+        logger.debug(f"Compiled keyword matcher with {len(matcher)} patterns")
+    return matcher
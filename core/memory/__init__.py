@@ -7,7 +7,7 @@ Four stores, like a human brain:
 - EventStore: World events (fade based on significance)
 - GoalStore: Goals detected from conversations
 
-MemoryManager orchestrates all four.
+MemoryManager orchestrates all four; RecallEngine searches them in one pass.
 """
 
 from .memory_manager import MemoryManager
@@ -15,6 +15,7 @@ from .people_store import PeopleStore, Person
 from .knowledge_store import KnowledgeStore, Knowledge
 from .event_store import EventStore, Event
 from .goal_store import GoalStore, Goal
+from .recall_engine import RecallEngine, RecallHit
 
 __all__ = [
     "MemoryManager",
@@ -22,4 +23,5 @@ __all__ = [
     "KnowledgeStore", "Knowledge",
     "EventStore", "Event",
     "GoalStore", "Goal",
+    "RecallEngine", "RecallHit",
 ]
@@ -18,6 +18,7 @@ from .people_store import PeopleStore
 from .knowledge_store import KnowledgeStore
 from .event_store import EventStore
 from .goal_store import GoalStore
+from .recall_engine import RecallEngine, RecallHit
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +58,15 @@ class MemoryManager:
         self.router = model_router
         self._session_start = None
 
+        # One-pass search across all four stores (shared connection + cache)
+        self.recall_engine = RecallEngine(
+            people_db=self.people.db_path,
+            knowledge_db=self.knowledge.db_path,
+            events_db=self.events.db_path,
+            goals_db=self.goals.db_path,
+            recall_boost=EventStore.RECALL_BOOST,
+        )
+
     def start_session(self):
         """Start a new session."""
         self._session_start = datetime.now()
@@ -85,12 +95,15 @@ class MemoryManager:
                 updates["notes"] = (person.notes + "\n" + notes).strip()
             if updates:
                 self.people.update(person.id, **updates)
+                self.recall_engine.invalidate()
             return person.id
 
+        self.recall_engine.invalidate()
         return self.people.add_person(name, handle, role, description, notes=notes)
 
     def record_conversation(self, person_name: str, summary: str, channel: str = "telegram"):
         """Record that David talked to someone."""
+        self.recall_engine.invalidate()
         people = self.people.find(person_name)
         if people:
             self.people.record_interaction(people[0].id, summary, channel)
@@ -116,6 +129,7 @@ class MemoryManager:
 
     def learn(self, topic: str, content: str, category: str = "lesson", source: str = "experience"):
         """David learns something about being CEO/Founder."""
+        self.recall_engine.invalidate()
         return self.knowledge.add(category, topic, content, source)
 
     async def detect_and_store_goal(self, message: str) -> dict | None:
@@ -165,6 +179,7 @@ class MemoryManager:
                 return None
 
             msg_type = result.get("type", "neither")
+            self.recall_engine.invalidate()
             title = result.get("title", "")
             description = result.get("description", "")
             priority = result.get("priority", 5)
@@ -215,6 +230,7 @@ class MemoryManager:
             summary += f" | Context: {context}"
 
         # Store as an event with high significance (David's own output)
+        self.recall_engine.invalidate()
         return self.events.add(
             title=title,
             summary=summary,
@@ -229,6 +245,7 @@ class MemoryManager:
     def remember_event(self, title: str, summary: str, significance: int = 5,
                        category: str = "world", source: str = "", url: str = ""):
         """Remember a world event."""
+        self.recall_engine.invalidate()
         return self.events.add(title, summary, significance, category, source, url)
 
     def what_happened(self, query: str) -> Tuple[str, str]:
@@ -246,40 +263,82 @@ class MemoryManager:
         """
         Try to remember something - could be person, knowledge, or event.
 
+        All stores are searched in one pass by the recall engine.
+
         Returns:
             (context, memory_state, memory_phrase)
 
         memory_state: "clear", "fuzzy", "blank"
         memory_phrase: Natural phrase for David to say (or empty if clear)
         """
-        all_context = []
+        hits = self.recall_engine.search(query)
+        people = [h for h in hits if h.kind == "person"]
+        knowledge = [h for h in hits if h.kind == "knowledge"]
+        events = self._by_significance(h for h in hits if h.kind == "event")
 
-        # Check people
-        people_ctx, people_state = self.who_is(query)
-        if people_ctx:
-            all_context.append(people_ctx)
+        all_context = []
+        states = []
 
-        # Check knowledge
-        knowledge_ctx, knowledge_state = self.what_is(query)
-        if knowledge_ctx:
-            all_context.append(knowledge_ctx)
+        if people:
+            all_context.append(self._format_person(people[0]))
+            states.append("clear")
 
-        # Check events
-        event_ctx, event_state = self.what_happened(query)
-        if event_ctx:
-            all_context.append(event_ctx)
+        if knowledge:
+            context = "**FLIPT Knowledge:**\n"
+            for k in knowledge:
+                context += f"- [{k.meta}] {k.title}: {k.body[:150]}\n"
+            all_context.append(context)
+            states.append("clear")
+
+        event_state = self._event_state(events)
+        if event_state == "fuzzy":
+            all_context.append(f"[Vague memory] {events[0].title}: {events[0].body[:100]}")
+        elif event_state == "clear":
+            context = f"[Event] {events[0].title}: {events[0].body}"
+            if len(events) > 1:
+                context += f"\n[Related] {events[1].title}"
+            all_context.append(context)
+        states.append(event_state)
 
         # Determine overall state
         if not all_context:
             return "", "blank", random.choice(MEMORY_PHRASES["blank"])
 
         # If any is clear, we're clear
-        if "clear" in [people_state, knowledge_state, event_state]:
+        if "clear" in states:
             return "\n\n".join(all_context), "clear", ""
 
         # Otherwise fuzzy
         return "\n\n".join(all_context), "fuzzy", random.choice(MEMORY_PHRASES["fuzzy"])
 
+    @staticmethod
+    def _by_significance(events) -> list[RecallHit]:
+        """Order event hits the way EventStore.recall does."""
+        return sorted(events, key=lambda e: (e.significance, e.recall_strength), reverse=True)
+
+    @staticmethod
+    def _event_state(events: list[RecallHit]) -> str:
+        """Memory state for the best event hit (see EventStore.recall)."""
+        if not events:
+            return "blank"
+        best = events[0]
+        if best.recall_strength >= 0.7 and best.significance >= 6:
+            return "clear"
+        elif best.recall_strength >= 0.4:
+            return "fuzzy"
+        return "blank"
+
+    @staticmethod
+    def _format_person(person: RecallHit) -> str:
+        """Same shape as PeopleStore.get_context."""
+        context = f"[{person.title}] {person.meta}. {person.body}"
+        if person.extra.get("notes"):
+            context += f" Notes: {person.extra['notes']}"
+        interactions = person.extra.get("interactions")
+        if interactions:
+            context += " Recent: " + "; ".join(i[:50] for i in interactions)
+        return context
+
     def get_memory_phrase(self, state: str) -> str:
         """Get a natural phrase for David's memory state."""
         if state in MEMORY_PHRASES:
@@ -293,28 +352,34 @@ class MemoryManager:
         context_parts = []
 
         # Active goals
-        goal_context = self.goals.get_context()
-        if goal_context:
-            context_parts.append(goal_context)
+        goals = self.recall_engine.get_active_goals(limit=10)
+        if goals:
+            context_parts.append("**Active Goals:**")
+            for g in goals:
+                context_parts.append(f"- [{g['priority']}/10] {g['title']}")
+                if g["description"]:
+                    context_parts.append(f"  {g['description'][:100]}")
+
+        hits = self.recall_engine.search(message, min_event_strength=0.4)
 
         # Check if talking about/to a person
-        people = self.people.find(message)
+        people = [h for h in hits if h.kind == "person"]
         if people:
-            context_parts.append(self.people.get_context(message))
+            context_parts.append(self._format_person(people[0]))
 
         # Check relevant knowledge
-        knowledge = self.knowledge.search(message, limit=3)
+        knowledge = [h for h in hits if h.kind == "knowledge"][:3]
         if knowledge:
             context_parts.append("**FLIPT Knowledge:**")
             for k in knowledge:
-                context_parts.append(f"- {k.topic}: {k.content[:100]}")
+                context_parts.append(f"- {k.title}: {k.body[:100]}")
 
         # Check relevant events
-        events, state = self.events.recall(message, min_strength=0.4)
-        if events and state != "blank":
+        events = self._by_significance(h for h in hits if h.kind == "event")
+        if events and self._event_state(events) != "blank":
             context_parts.append("**Relevant events:**")
             for e in events[:2]:
-                context_parts.append(f"- {e.title}: {e.summary[:100]}")
+                context_parts.append(f"- {e.title}: {e.body[:100]}")
 
         return "\n".join(context_parts) if context_parts else ""
 
@@ -0,0 +1,228 @@
+"""
+Recall Engine - one-pass search across all of David's memory stores.
+
+The stores live in separate SQLite files. Instead of each store opening its
+own connection per query, the engine keeps one connection with the other
+databases ATTACHed and runs a single UNION ALL query over the knowledge,
+event and goal FTS5 tables (plus a LIKE match on people, which has no FTS
+index). Results are ranked together by bm25, event recall boosts are applied
+in one batched UPDATE, and repeat queries within a conversation are served
+from a short-TTL cache.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Words too common to be useful as FTS terms
+STOPWORDS = {
+    "the", "and", "for", "are", "but", "not", "you", "your", "with", "have",
+    "this", "that", "what", "when", "where", "who", "how", "why", "was",
+    "were", "can", "could", "would", "should", "about", "from", "they",
+    "them", "there", "then", "than", "just", "like", "did", "does", "any",
+    "all", "our", "out", "its", "his", "her", "has", "had", "been", "will",
+    "into", "some", "know", "think", "tell", "remember",
+}
+
+# bm25() returns more-negative scores for better matches. People are matched
+# with LIKE (no FTS index), so a direct name/handle hit gets a strong fixed score.
+PERSON_SCORE = -10.0
+
+
+@dataclass
+class RecallHit:
+    """A single ranked memory match."""
+    kind: str          # person, knowledge, event, goal
+    id: int
+    title: str
+    body: str
+    meta: str          # role / category / status
+    score: float       # bm25 (lower is better)
+    significance: int = 0
+    recall_strength: float = 0.0
+    extra: dict = field(default_factory=dict)
+
+
+class RecallEngine:
+    """Unified recall over the people, knowledge, event and goal databases."""
+
+    PER_KIND_LIMIT = {"person": 1, "knowledge": 5, "event": 5, "goal": 3}
+
+    def __init__(self, people_db: Path, knowledge_db: Path,
+                 events_db: Path, goals_db: Path,
+                 recall_boost: float = 0.15, cache_ttl: float = 60.0):
+        self.paths = {
+            "pp": Path(people_db),
+            "kn": Path(knowledge_db),
+            "ev": Path(events_db),
+            "gl": Path(goals_db),
+        }
+        self.recall_boost = recall_boost
+        self.cache_ttl = cache_ttl
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._cache: dict[tuple, tuple[float, list[RecallHit]]] = {}
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Shared connection with every memory DB attached."""
+        if self._conn is None:
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            for alias, path in self.paths.items():
+                conn.execute(f"ATTACH DATABASE ? AS {alias}", (str(path),))
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def invalidate(self):
+        """Drop cached results (call after writing to any memory store)."""
+        self._cache.clear()
+
+    @staticmethod
+    def build_fts_query(text: str) -> str:
+        """Turn free text into an OR query of quoted terms for FTS5."""
+        terms = []
+        for word in re.findall(r"[\w@#'-]+", text.lower()):
+            word = word.strip("'-")
+            if len(word) >= 3 and word not in STOPWORDS and word not in terms:
+                terms.append(word)
+        return " OR ".join(f'"{t}"' for t in terms[:16])
+
+    def search(self, query: str, min_event_strength: float = 0.3,
+               boost: bool = True) -> list[RecallHit]:
+        """
+        Search every store in one pass. Returns hits ranked by score, with
+        at most PER_KIND_LIMIT results per kind.
+        """
+        key = (query.strip().lower(), min_event_strength)
+        cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+
+        fts_query = self.build_fts_query(query)
+        like = f"%{query.strip()}%"
+
+        with self._lock:
+            conn = self._get_conn()
+            rows = self._run_search(conn, fts_query, like, min_event_strength)
+            hits = [self._to_hit(row) for row in rows]
+
+            # Recent interactions for the top person, same connection
+            for hit in hits:
+                if hit.kind == "person":
+                    hit.extra["interactions"] = [
+                        r["summary"] for r in conn.execute("""
+                            SELECT summary FROM pp.interactions
+                            WHERE person_id = ? ORDER BY timestamp DESC LIMIT 3
+                        """, (hit.id,)).fetchall()
+                    ]
+
+            event_ids = [h.id for h in hits if h.kind == "event"]
+            if boost and event_ids:
+                placeholders = ",".join("?" * len(event_ids))
+                with conn:
+                    conn.execute(f"""
+                        UPDATE ev.events
+                        SET recall_strength = MIN(1.0, recall_strength + ?),
+                            recalled_count = recalled_count + 1,
+                            last_recalled = ?
+                        WHERE id IN ({placeholders})
+                    """, (self.recall_boost, datetime.now().isoformat(), *event_ids))
+
+        self._cache[key] = (time.monotonic(), hits)
+        return hits
+
+    def _run_search(self, conn: sqlite3.Connection, fts_query: str,
+                    like: str, min_event_strength: float) -> list[sqlite3.Row]:
+        """Single UNION ALL across all stores, limited per kind."""
+        people_sql = f"""
+            SELECT 'person' AS kind, p.id, p.name AS title,
+                   p.description AS body, p.role AS meta,
+                   {PERSON_SCORE} - p.importance AS score,
+                   0 AS significance, 0 AS recall_strength,
+                   p.notes AS notes
+            FROM pp.people p
+            WHERE p.name LIKE :like OR p.handle LIKE :like OR p.description LIKE :like
+        """
+        params = {"like": like, "q": fts_query, "min_strength": min_event_strength}
+
+        if fts_query:
+            sql = f"""
+                SELECT * FROM (
+                    SELECT *, ROW_NUMBER() OVER (
+                        PARTITION BY kind ORDER BY score
+                    ) AS kind_rank
+                    FROM (
+                        {people_sql}
+                        UNION ALL
+                        SELECT 'knowledge', k.id, k.topic, k.content, k.category,
+                               bm25(knowledge_fts), 0, 0, ''
+                        FROM kn.knowledge_fts JOIN kn.knowledge k
+                          ON k.id = knowledge_fts.rowid
+                        WHERE knowledge_fts MATCH :q
+                        UNION ALL
+                        SELECT 'event', e.id, e.title, e.summary, e.category,
+                               bm25(events_fts), e.significance, e.recall_strength, ''
+                        FROM ev.events_fts JOIN ev.events e
+                          ON e.id = events_fts.rowid
+                        WHERE events_fts MATCH :q AND e.recall_strength >= :min_strength
+                        UNION ALL
+                        SELECT 'goal', g.id, g.title, g.description, g.status,
+                               bm25(goals_fts), g.priority, 0, ''
+                        FROM gl.goals_fts JOIN gl.goals g
+                          ON g.id = goals_fts.rowid
+                        WHERE goals_fts MATCH :q AND g.status = 'active'
+                    )
+                )
+                WHERE (kind = 'person' AND kind_rank <= {self.PER_KIND_LIMIT['person']})
+                   OR (kind = 'knowledge' AND kind_rank <= {self.PER_KIND_LIMIT['knowledge']})
+                   OR (kind = 'event' AND kind_rank <= {self.PER_KIND_LIMIT['event']})
+                   OR (kind = 'goal' AND kind_rank <= {self.PER_KIND_LIMIT['goal']})
+                ORDER BY score
+            """
+        else:
+            sql = people_sql + f" ORDER BY score LIMIT {self.PER_KIND_LIMIT['person']}"
+
+        try:
+            return conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            # Malformed FTS query - fall back to people-only LIKE match
+            logger.debug(f"Unified recall query failed ({e}), falling back")
+            return conn.execute(
+                people_sql + f" ORDER BY score LIMIT {self.PER_KIND_LIMIT['person']}",
+                params,
+            ).fetchall()
+
+    def get_active_goals(self, limit: int = 10) -> list[sqlite3.Row]:
+        """Active goals by priority, read over the shared connection."""
+        with self._lock:
+            return self._get_conn().execute("""
+                SELECT title, description, priority FROM gl.goals
+                WHERE status = 'active'
+                ORDER BY priority DESC, created_at DESC
+                LIMIT ?
+            """, (limit,)).fetchall()
+
+    @staticmethod
+    def _to_hit(row: sqlite3.Row) -> RecallHit:
+        hit = RecallHit(
+            kind=row["kind"], id=row["id"], title=row["title"] or "",
+            body=row["body"] or "", meta=row["meta"] or "",
+            score=row["score"], significance=row["significance"] or 0,
+            recall_strength=row["recall_strength"] or 0.0,
+        )
+        if row["notes"]:
+            hit.extra["notes"] = row["notes"]
+        return hit
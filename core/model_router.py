@@ -7,15 +7,19 @@ Based on Ganzak's 97% cost reduction framework.
 Routing: Ollama (15%) → Haiku (75%) → Sonnet (10%) → Opus (3-5%)
 """
 
+import asyncio
+import json
 import os
 import yaml
 import logging
+import time
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
 import anthropic
+import httpx
 import openai
 
 logger = logging.getLogger(__name__)
@@ -45,15 +49,31 @@ class ModelRouter:
         ModelTier.LOCAL, ModelTier.CHEAP, ModelTier.MID, ModelTier.PREMIUM
     ]
 
+    # Max in-flight requests per provider (overridable via "concurrency" in models.yaml)
+    DEFAULT_CONCURRENCY = {"anthropic": 8, "openai": 4, "ollama": 1}
+
     def __init__(self, config_path: str = "config/models.yaml"):
         self.models: dict[ModelTier, ModelConfig] = {}
         self.task_routing: dict[str, ModelTier] = {}
         self.default_tier = ModelTier.CHEAP
 
-        # Initialize API clients
+        # API keys / hosts; async clients are built lazily per event loop
+        self._anthropic_key = None
+        self._openai_key = None
+        self._ollama_host = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
+
+        # Shared transport + per-provider concurrency limits
+        self.concurrency: dict[str, int] = dict(self.DEFAULT_CONCURRENCY)
+        self.max_connections = 20
+        self._loop = None
+        self._http: httpx.AsyncClient | None = None
         self._anthropic = None
         self._openai = None
-        self._ollama_host = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
+        self._ollama = None
+        self._limits: dict[str, asyncio.Semaphore] = {}
+
+        # Per-model streaming latency metrics (see invoke_stream)
+        self.stream_metrics: dict[str, dict] = {}
 
         self._load_config(config_path)
         self._init_clients()
@@ -87,6 +107,11 @@ class ModelRouter:
 
         self.default_tier = ModelTier(config.get("default_tier", "cheap"))
 
+        # Load connection pool / concurrency limits
+        concurrency = config.get("concurrency", {})
+        self.max_connections = concurrency.pop("max_connections", self.max_connections)
+        self.concurrency.update(concurrency)
+
     def _load_defaults(self):
         """Fallback defaults if no config file."""
         self.models = {
@@ -107,14 +132,63 @@ class ModelRouter:
         }
 
     def _init_clients(self):
-        """Initialize API clients from environment variables."""
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
-        if api_key:
-            self._anthropic = anthropic.Anthropic(api_key=api_key)
+        """Read API credentials from environment variables."""
+        self._anthropic_key = os.environ.get("ANTHROPIC_API_KEY")
+        self._openai_key = os.environ.get("OPENAI_API_KEY")
 
-        openai_key = os.environ.get("OPENAI_API_KEY")
-        if openai_key:
-            self._openai = openai.OpenAI(api_key=openai_key)
+    def _ensure_async_clients(self):
+        """
+        Build the async SDK clients on first use in the running event loop.
+
+        All HTTP providers share one pooled httpx.AsyncClient. The clients and
+        semaphores are tied to the loop they were created on, so they are
+        rebuilt if the router is reused from a different loop (e.g. one-off
+        asyncio.run() scripts).
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        self._loop = loop
+        self._http = httpx.AsyncClient(
+            timeout=httpx.Timeout(600.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
+        self._anthropic = None
+        self._openai = None
+        self._ollama = None
+
+        if self._anthropic_key:
+            self._anthropic = anthropic.AsyncAnthropic(
+                api_key=self._anthropic_key, http_client=self._http
+            )
+        if self._openai_key:
+            self._openai = openai.AsyncOpenAI(
+                api_key=self._openai_key, http_client=self._http
+            )
+
+        self._limits = {
+            provider: asyncio.Semaphore(max(1, limit))
+            for provider, limit in self.concurrency.items()
+        }
+
+    def _provider_limit(self, provider: str) -> asyncio.Semaphore:
+        """Semaphore bounding in-flight requests to a provider."""
+        if provider not in self._limits:
+            self._limits[provider] = asyncio.Semaphore(
+                self.DEFAULT_CONCURRENCY.get(provider, 4)
+            )
+        return self._limits[provider]
+
+    async def close(self):
+        """Close the shared HTTP transport."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        self._loop = None
 
     def select_model(self, task_type: str) -> ModelConfig:
         """Select the appropriate model for a task type."""
@@ -139,7 +213,8 @@ class ModelRouter:
     async def invoke(self, model: ModelConfig,
                      messages: list[dict],
                      tools: list[dict] | None = None,
-                     max_tokens: int = 4096) -> dict:
+                     max_tokens: int = 4096,
+                     cache_prompt: bool = False) -> dict:
         """
         Invoke a model and return the response.
 
@@ -148,27 +223,292 @@ class ModelRouter:
             messages: List of message dicts with 'role' and 'content'
             tools: Optional tool definitions for the model
             max_tokens: Maximum tokens in response
+            cache_prompt: Mark the stable prefix (tools, system prompt and
+                conversation so far) for provider-side prompt caching.
+                Anthropic only; ignored by other providers.
 
         Returns:
             dict with 'content', 'tool_calls', 'usage' keys
         """
+        self._ensure_async_clients()
+
+        async with self._provider_limit(model.provider):
+            if model.provider == "anthropic":
+                return await self._invoke_anthropic(
+                    model, messages, tools, max_tokens, cache_prompt
+                )
+            elif model.provider == "ollama":
+                return await self._invoke_ollama(model, messages, max_tokens)
+            elif model.provider == "openai":
+                return await self._invoke_openai(model, messages, tools, max_tokens)
+            else:
+                raise ValueError(f"Unknown provider: {model.provider}")
+
+    async def invoke_stream(self, model: ModelConfig,
+                            messages: list[dict],
+                            tools: list[dict] | None = None,
+                            max_tokens: int = 4096,
+                            cache_prompt: bool = False) -> AsyncIterator[dict]:
+        """
+        Stream a model response as it is generated.
+
+        Same arguments as invoke(). Yields dicts with a 'type' key:
+            {"type": "text", "text": "..."}          - text delta
+            {"type": "tool_start", "name": "..."}     - a tool call has begun
+                                                        (arguments still streaming)
+            {"type": "tool_call", "tool_call": {...}} - one complete tool call
+                                                        (id, name, arguments)
+            {"type": "done", ...}                     - final event carrying the
+                                                        same keys invoke() returns
+
+        Time to first token and output tokens/sec are recorded per model in
+        self.stream_metrics. Closing the iterator early (aclose) closes the
+        underlying provider stream, which stops generation.
+        """
+        self._ensure_async_clients()
+
         if model.provider == "anthropic":
-            return await self._invoke_anthropic(model, messages, tools, max_tokens)
+            stream = self._stream_anthropic(
+                model, messages, tools, max_tokens, cache_prompt
+            )
         elif model.provider == "ollama":
-            return await self._invoke_ollama(model, messages, max_tokens)
+            stream = self._stream_ollama(model, messages, max_tokens)
         elif model.provider == "openai":
-            return await self._invoke_openai(model, messages, tools, max_tokens)
+            stream = self._stream_openai(model, messages, tools, max_tokens)
         else:
             raise ValueError(f"Unknown provider: {model.provider}")
 
-    async def _invoke_anthropic(self, model: ModelConfig,
+        async with self._provider_limit(model.provider):
+            started = time.monotonic()
+            first_token_at = None
+            async for event in stream:
+                if first_token_at is None and event["type"] != "done":
+                    first_token_at = time.monotonic()
+                if event["type"] == "done":
+                    self._record_stream_metrics(
+                        model.name, started, first_token_at,
+                        event["usage"]["output_tokens"],
+                    )
+                yield event
+
+    def _record_stream_metrics(self, model_name: str, started: float,
+                               first_token_at: float | None,
+                               output_tokens: int):
+        """Update rolling time-to-first-token and tokens/sec for a model."""
+        finished = time.monotonic()
+        ttft = (first_token_at or finished) - started
+        gen_time = finished - (first_token_at or started)
+        tps = output_tokens / gen_time if gen_time > 0 else 0.0
+
+        m = self.stream_metrics.setdefault(model_name, {
+            "calls": 0, "avg_ttft_s": 0.0, "avg_tokens_per_s": 0.0,
+            "last_ttft_s": 0.0, "last_tokens_per_s": 0.0,
+        })
+        m["calls"] += 1
+        m["avg_ttft_s"] += (ttft - m["avg_ttft_s"]) / m["calls"]
+        m["avg_tokens_per_s"] += (tps - m["avg_tokens_per_s"]) / m["calls"]
+        m["last_ttft_s"] = round(ttft, 3)
+        m["last_tokens_per_s"] = round(tps, 1)
+        logger.debug(f"{model_name} stream: ttft={ttft:.2f}s, {tps:.1f} tok/s")
+
+    async def _stream_anthropic(self, model: ModelConfig,
                                 messages: list[dict],
                                 tools: list[dict] | None,
-                                max_tokens: int) -> dict:
-        """Call Anthropic API."""
+                                max_tokens: int,
+                                cache_prompt: bool = False) -> AsyncIterator[dict]:
+        """Stream from the Anthropic API using raw message events."""
         if not self._anthropic:
             raise RuntimeError("Anthropic API key not configured")
 
+        kwargs = self._anthropic_kwargs(
+            model, messages, tools, max_tokens, cache_prompt
+        )
+        stream = await self._anthropic.messages.create(**kwargs, stream=True)
+
+        text_content = ""
+        tool_calls = []
+        current_tool = None
+        input_tokens = output_tokens = 0
+        cache_read = cache_write = 0
+        stop_reason = None
+
+        async for event in self._closing(stream):
+            if event.type == "message_start":
+                usage = event.message.usage
+                input_tokens = usage.input_tokens
+                cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+                cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+            elif event.type == "content_block_start":
+                if event.content_block.type == "tool_use":
+                    current_tool = {
+                        "id": event.content_block.id,
+                        "name": event.content_block.name,
+                        "partial_json": "",
+                    }
+                    yield {"type": "tool_start", "name": current_tool["name"]}
+            elif event.type == "content_block_delta":
+                if event.delta.type == "text_delta":
+                    text_content += event.delta.text
+                    yield {"type": "text", "text": event.delta.text}
+                elif event.delta.type == "input_json_delta" and current_tool:
+                    current_tool["partial_json"] += event.delta.partial_json
+            elif event.type == "content_block_stop":
+                if current_tool:
+                    raw = current_tool.pop("partial_json")
+                    current_tool["arguments"] = json.loads(raw) if raw else {}
+                    tool_calls.append(current_tool)
+                    yield {"type": "tool_call", "tool_call": current_tool}
+                    current_tool = None
+            elif event.type == "message_delta":
+                stop_reason = event.delta.stop_reason
+                output_tokens = event.usage.output_tokens
+
+        yield {
+            "type": "done",
+            "content": text_content,
+            "tool_calls": tool_calls,
+            "usage": {
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+                "cache_read_tokens": cache_read,
+                "cache_write_tokens": cache_write,
+            },
+            "model": model.name,
+            "stop_reason": stop_reason,
+        }
+
+    @staticmethod
+    async def _closing(stream) -> AsyncIterator:
+        """Iterate an SDK stream, closing the HTTP response if abandoned early."""
+        try:
+            async for item in stream:
+                yield item
+        finally:
+            await stream.close()
+
+    async def _stream_ollama(self, model: ModelConfig,
+                             messages: list[dict],
+                             max_tokens: int) -> AsyncIterator[dict]:
+        """Stream from local Ollama."""
+        if self._ollama is None:
+            import ollama as ollama_lib
+            self._ollama = ollama_lib.AsyncClient(host=self._ollama_host)
+
+        text_content = ""
+        prompt_tokens = completion_tokens = None
+
+        async for chunk in await self._ollama.chat(
+            model=model.name,
+            messages=messages,
+            stream=True,
+        ):
+            delta = chunk["message"]["content"]
+            if delta:
+                text_content += delta
+                yield {"type": "text", "text": delta}
+            if chunk.get("done"):
+                prompt_tokens = chunk.get("prompt_eval_count")
+                completion_tokens = chunk.get("eval_count")
+
+        # Fall back to the same estimate as _invoke_ollama if counts are missing
+        if prompt_tokens is None:
+            prompt_tokens = sum(len(m.get("content", "")) // 4 for m in messages)
+        if completion_tokens is None:
+            completion_tokens = len(text_content) // 4
+
+        yield {
+            "type": "done",
+            "content": text_content,
+            "tool_calls": [],
+            "usage": {
+                "input_tokens": prompt_tokens,
+                "output_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+            "model": model.name,
+            "stop_reason": "end_turn",
+        }
+
+    async def _stream_openai(self, model: ModelConfig,
+                             messages: list[dict],
+                             tools: list[dict] | None,
+                             max_tokens: int) -> AsyncIterator[dict]:
+        """Stream from the OpenAI API."""
+        if not self._openai:
+            raise RuntimeError("OpenAI API key not configured")
+
+        kwargs = {
+            "model": model.name,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        }
+        if tools:
+            kwargs["tools"] = [
+                {"type": "function", "function": t} for t in tools
+            ]
+
+        text_content = ""
+        partial_tools: dict[int, dict] = {}
+        usage = None
+        stop_reason = None
+
+        stream = await self._openai.chat.completions.create(**kwargs)
+        async for chunk in self._closing(stream):
+            if chunk.usage:
+                usage = chunk.usage
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            if choice.delta.content:
+                text_content += choice.delta.content
+                yield {"type": "text", "text": choice.delta.content}
+            for tc in choice.delta.tool_calls or []:
+                entry = partial_tools.setdefault(
+                    tc.index, {"id": "", "name": "", "raw_arguments": ""}
+                )
+                if tc.id:
+                    entry["id"] = tc.id
+                if tc.function and tc.function.name:
+                    if not entry["name"]:
+                        yield {"type": "tool_start", "name": tc.function.name}
+                    entry["name"] = tc.function.name
+                if tc.function and tc.function.arguments:
+                    entry["raw_arguments"] += tc.function.arguments
+            if choice.finish_reason:
+                stop_reason = choice.finish_reason
+
+        tool_calls = []
+        for index in sorted(partial_tools):
+            entry = partial_tools[index]
+            raw = entry.pop("raw_arguments")
+            entry["arguments"] = json.loads(raw) if raw else {}
+            tool_calls.append(entry)
+            yield {"type": "tool_call", "tool_call": entry}
+
+        input_tokens = usage.prompt_tokens if usage else 0
+        output_tokens = usage.completion_tokens if usage else len(text_content) // 4
+        yield {
+            "type": "done",
+            "content": text_content,
+            "tool_calls": tool_calls,
+            "usage": {
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            },
+            "model": model.name,
+            "stop_reason": stop_reason,
+        }
+
+    def _anthropic_kwargs(self, model: ModelConfig,
+                          messages: list[dict],
+                          tools: list[dict] | None,
+                          max_tokens: int,
+                          cache_prompt: bool = False) -> dict:
+        """Build messages.create kwargs, converting messages to Claude format."""
         # Separate system messages and convert to Claude format
         system_parts = []
         conversation = []
@@ -176,17 +516,20 @@ class ModelRouter:
             if msg["role"] == "system":
                 system_parts.append(msg["content"])
             elif msg["role"] == "tool":
-                # Convert OpenAI-style tool result to Claude format
-                conversation.append({
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": msg.get("tool_use_id", ""),
-                            "content": msg.get("content", ""),
-                        }
-                    ]
-                })
+                # Convert OpenAI-style tool result to Claude format. Results for
+                # one assistant turn share a single user message.
+                block = {
+                    "type": "tool_result",
+                    "tool_use_id": msg.get("tool_use_id", ""),
+                    "content": msg.get("content", ""),
+                }
+                prev = conversation[-1] if conversation else None
+                if (prev and prev["role"] == "user"
+                        and isinstance(prev["content"], list)
+                        and prev["content"][-1].get("type") == "tool_result"):
+                    prev["content"].append(block)
+                else:
+                    conversation.append({"role": "user", "content": [block]})
             elif msg["role"] == "assistant" and msg.get("tool_calls"):
                 # Convert assistant tool calls to Claude format
                 content_blocks = []
@@ -213,8 +556,60 @@ class ModelRouter:
             kwargs["system"] = "\n\n".join(system_parts)
         if tools:
             kwargs["tools"] = tools
+        if cache_prompt:
+            self._add_cache_breakpoints(kwargs)
+        return kwargs
+
+    @staticmethod
+    def _add_cache_breakpoints(kwargs: dict):
+        """
+        Mark prompt-cache breakpoints on a messages.create request.
+
+        Cache order is tools -> system -> messages, so one breakpoint on the
+        system prompt (or the last tool if there's no system prompt) covers
+        the static prefix, and one on the final message caches the whole
+        conversation so the next tool-loop iteration reads it back at the
+        cached rate. Inputs are copied, never mutated.
+        """
+        ephemeral = {"type": "ephemeral"}
+
+        if "system" in kwargs:
+            kwargs["system"] = [{
+                "type": "text",
+                "text": kwargs["system"],
+                "cache_control": ephemeral,
+            }]
+        elif kwargs.get("tools"):
+            kwargs["tools"] = kwargs["tools"][:-1] + [
+                {**kwargs["tools"][-1], "cache_control": ephemeral}
+            ]
+
+        conversation = kwargs["messages"]
+        if conversation:
+            last = conversation[-1]
+            content = last["content"]
+            if isinstance(content, str):
+                blocks = [{"type": "text", "text": content}] if content else []
+            else:
+                blocks = list(content or [])
+            if blocks:
+                blocks[-1] = {**blocks[-1], "cache_control": ephemeral}
+                kwargs["messages"] = conversation[:-1] + [{**last, "content": blocks}]
+
+    async def _invoke_anthropic(self, model: ModelConfig,
+                                messages: list[dict],
+                                tools: list[dict] | None,
+                                max_tokens: int,
+                                cache_prompt: bool = False) -> dict:
+        """Call Anthropic API."""
+        if not self._anthropic:
+            raise RuntimeError("Anthropic API key not configured")
+
+        kwargs = self._anthropic_kwargs(
+            model, messages, tools, max_tokens, cache_prompt
+        )
 
-        response = self._anthropic.messages.create(**kwargs)
+        response = await self._anthropic.messages.create(**kwargs)
 
         # Parse response
         tool_calls = []
@@ -237,6 +632,10 @@ class ModelRouter:
                 "output_tokens": response.usage.output_tokens,
                 "total_tokens": (response.usage.input_tokens
                                  + response.usage.output_tokens),
+                "cache_read_tokens": getattr(
+                    response.usage, "cache_read_input_tokens", 0) or 0,
+                "cache_write_tokens": getattr(
+                    response.usage, "cache_creation_input_tokens", 0) or 0,
             },
             "model": model.name,
             "stop_reason": response.stop_reason,
@@ -247,10 +646,11 @@ class ModelRouter:
                              max_tokens: int) -> dict:
         """Call local Ollama model."""
         try:
-            import ollama as ollama_lib
-            client = ollama_lib.Client(host=self._ollama_host)
+            if self._ollama is None:
+                import ollama as ollama_lib
+                self._ollama = ollama_lib.AsyncClient(host=self._ollama_host)
 
-            response = client.chat(
+            response = await self._ollama.chat(
                 model=model.name,
                 messages=messages,
             )
@@ -293,12 +693,11 @@ class ModelRouter:
                 {"type": "function", "function": t} for t in tools
             ]
 
-        response = self._openai.chat.completions.create(**kwargs)
+        response = await self._openai.chat.completions.create(**kwargs)
         choice = response.choices[0]
 
         tool_calls = []
         if choice.message.tool_calls:
-            import json
             for tc in choice.message.tool_calls:
                 tool_calls.append({
                     "id": tc.id,
@@ -6,9 +6,12 @@ Ganzak principle: no auto-billing, add small amounts, monitor closely.
 """
 
 import sqlite3
+import threading
 from datetime import datetime, date
 from pathlib import Path
 
+DEFAULT_DAILY_LIMIT = 10.0  # USD, for projects without a budgets row
+
 
 class TokenBudgetManager:
 
@@ -17,6 +20,15 @@ class TokenBudgetManager:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_db()
 
+        # In-process spend ledger: (project_id, day) -> USD, plus cached
+        # daily limits. has_budget() reads only these; record_usage() and
+        # set_budget() keep them current. This process is the only writer
+        # to the budget DB, so they are rebuilt once here.
+        self._lock = threading.Lock()
+        self._ledger: dict[tuple[str, str], float] = {}
+        self._limits: dict[str, float] = {}
+        self._load_ledger()
+
     def _init_db(self):
         with self._connect() as conn:
             conn.execute("""
@@ -43,12 +55,72 @@ class TokenBudgetManager:
                 CREATE INDEX IF NOT EXISTS idx_usage_project_date
                 ON token_usage(project_id, timestamp)
             """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS daily_usage (
+                    project_id TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    tokens_input INTEGER DEFAULT 0,
+                    tokens_output INTEGER DEFAULT 0,
+                    cost_usd REAL DEFAULT 0.0,
+                    call_count INTEGER DEFAULT 0,
+                    PRIMARY KEY (project_id, day, model)
+                )
+            """)
+            # Backfill the rollup from raw history the first time it exists
+            if conn.execute("SELECT 1 FROM daily_usage LIMIT 1").fetchone() is None:
+                conn.execute("""
+                    INSERT INTO daily_usage
+                        (project_id, day, model, tokens_input, tokens_output,
+                         cost_usd, call_count)
+                    SELECT project_id, substr(timestamp, 1, 10), model,
+                           SUM(tokens_input), SUM(tokens_output),
+                           SUM(cost_usd), COUNT(*)
+                    FROM token_usage
+                    GROUP BY project_id, substr(timestamp, 1, 10), model
+                """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS prompt_savings (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    project_id TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    uncached_input INTEGER DEFAULT 0,
+                    cache_read_tokens INTEGER DEFAULT 0,
+                    cache_write_tokens INTEGER DEFAULT 0,
+                    compacted_tokens INTEGER DEFAULT 0,
+                    timestamp TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_savings_project_date
+                ON prompt_savings(project_id, timestamp)
+            """)
 
     def _connect(self) -> sqlite3.Connection:
         conn = sqlite3.connect(str(self.db_path))
         conn.row_factory = sqlite3.Row
         return conn
 
+    def _load_ledger(self):
+        """Rebuild today's spend ledger and the limit cache from the DB."""
+        today = date.today().isoformat()
+        with self._connect() as conn:
+            spend_rows = conn.execute(
+                """SELECT project_id, SUM(cost_usd) as total
+                   FROM daily_usage WHERE day=?
+                   GROUP BY project_id""",
+                (today,)
+            ).fetchall()
+            limit_rows = conn.execute(
+                "SELECT project_id, daily_limit FROM budgets"
+            ).fetchall()
+
+        with self._lock:
+            self._ledger = {
+                (r["project_id"], today): r["total"] for r in spend_rows
+            }
+            self._limits = {r["project_id"]: r["daily_limit"] for r in limit_rows}
+
     def set_budget(self, project_id: str, daily: float, monthly: float):
         """Set budget limits for a project."""
         with self._connect() as conn:
@@ -58,39 +130,30 @@ class TokenBudgetManager:
                    VALUES (?, ?, ?)""",
                 (project_id, daily, monthly)
             )
+        with self._lock:
+            self._limits[project_id] = daily
 
     def has_budget(self, project_id: str) -> bool:
-        """Check if project has remaining daily budget."""
+        """Check if project has remaining daily budget (no DB access)."""
         daily_spend = self.get_daily_spend(project_id)
         daily_limit = self.get_daily_limit(project_id)
         return daily_spend < daily_limit
 
     def get_daily_limit(self, project_id: str) -> float:
         """Get daily budget limit for a project."""
-        with self._connect() as conn:
-            row = conn.execute(
-                "SELECT daily_limit FROM budgets WHERE project_id=?",
-                (project_id,)
-            ).fetchone()
-            return row["daily_limit"] if row else 10.0  # Default $10/day
+        return self._limits.get(project_id, DEFAULT_DAILY_LIMIT)
 
     def get_daily_spend(self, project_id: str) -> float:
         """Get total spend for today."""
-        today = date.today().isoformat()
-        with self._connect() as conn:
-            row = conn.execute(
-                """SELECT COALESCE(SUM(cost_usd), 0) as total
-                   FROM token_usage
-                   WHERE project_id=? AND DATE(timestamp)=?""",
-                (project_id, today)
-            ).fetchone()
-            return row["total"]
+        return self._ledger.get((project_id, date.today().isoformat()), 0.0)
 
     def record_usage(self, project_id: str, model: str,
                      tokens_in: int, tokens_out: int,
                      cost: float, task_type: str = "",
                      agent_id: str = ""):
-        """Record token usage."""
+        """Record token usage, updating the daily rollup and the ledger."""
+        now = datetime.now()
+        day = now.date().isoformat()
         with self._connect() as conn:
             conn.execute(
                 """INSERT INTO token_usage
@@ -99,12 +162,76 @@ class TokenBudgetManager:
                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
                 (project_id, model, tokens_in, tokens_out,
                  cost, task_type, agent_id,
+                 now.isoformat())
+            )
+            conn.execute(
+                """INSERT INTO daily_usage
+                   (project_id, day, model, tokens_input, tokens_output,
+                    cost_usd, call_count)
+                   VALUES (?, ?, ?, ?, ?, ?, 1)
+                   ON CONFLICT(project_id, day, model) DO UPDATE SET
+                       tokens_input = tokens_input + excluded.tokens_input,
+                       tokens_output = tokens_output + excluded.tokens_output,
+                       cost_usd = cost_usd + excluded.cost_usd,
+                       call_count = call_count + 1""",
+                (project_id, day, model, tokens_in, tokens_out, cost)
+            )
+
+        with self._lock:
+            key = (project_id, day)
+            self._ledger[key] = self._ledger.get(key, 0.0) + cost
+
+    def record_prompt_savings(self, project_id: str, model: str,
+                              uncached_input: int = 0,
+                              cache_read_tokens: int = 0,
+                              cache_write_tokens: int = 0,
+                              compacted_tokens: int = 0):
+        """Record prompt-cache usage and context-compaction savings for one call."""
+        if not (cache_read_tokens or cache_write_tokens or compacted_tokens):
+            return
+        with self._connect() as conn:
+            conn.execute(
+                """INSERT INTO prompt_savings
+                   (project_id, model, uncached_input, cache_read_tokens,
+                    cache_write_tokens, compacted_tokens, timestamp)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (project_id, model, uncached_input, cache_read_tokens,
+                 cache_write_tokens, compacted_tokens,
                  datetime.now().isoformat())
             )
 
+    def get_prompt_savings(self, project_id: str) -> dict:
+        """Today's prompt-cache hit rate and input tokens saved."""
+        today = date.today().isoformat()
+        with self._connect() as conn:
+            row = conn.execute(
+                """SELECT COALESCE(SUM(uncached_input), 0) as uncached,
+                          COALESCE(SUM(cache_read_tokens), 0) as cache_read,
+                          COALESCE(SUM(cache_write_tokens), 0) as cache_write,
+                          COALESCE(SUM(compacted_tokens), 0) as compacted
+                   FROM prompt_savings
+                   WHERE project_id=? AND timestamp >= ?""",
+                (project_id, today)
+            ).fetchone()
+
+        total_input = row["uncached"] + row["cache_read"] + row["cache_write"]
+        return {
+            "cache_hit_rate": row["cache_read"] / total_input if total_input else 0.0,
+            "cache_read_tokens": row["cache_read"],
+            "cache_write_tokens": row["cache_write"],
+            "compacted_tokens": row["compacted"],
+            # Cache reads bill at 10% of input price, compaction drops tokens outright
+            "tokens_saved": int(row["cache_read"] * 0.9) + row["compacted"],
+        }
+
     def calculate_cost(self, model: str, tokens_in: int,
-                       tokens_out: int) -> float:
-        """Calculate cost based on model pricing."""
+                       tokens_out: int, cache_read_tokens: int = 0,
+                       cache_write_tokens: int = 0) -> float:
+        """Calculate cost based on model pricing.
+
+        tokens_in is the uncached input; cache writes bill at 1.25x and
+        cache reads at 0.1x the input price.
+        """
         # Pricing per 1M tokens (input, output)
         pricing = {
             "llama3.2:8b": (0.0, 0.0),
@@ -114,7 +241,10 @@ class TokenBudgetManager:
             "gpt-4o-mini": (0.15, 0.60),
         }
         in_price, out_price = pricing.get(model, (3.00, 15.00))
-        return (tokens_in * in_price + tokens_out * out_price) / 1_000_000
+        input_cost = (tokens_in
+                      + cache_write_tokens * 1.25
+                      + cache_read_tokens * 0.1) * in_price
+        return (input_cost + tokens_out * out_price) / 1_000_000
 
     def get_daily_report(self, project_id: str) -> dict:
         """Generate daily cost report."""
@@ -122,13 +252,12 @@ class TokenBudgetManager:
         with self._connect() as conn:
             rows = conn.execute(
                 """SELECT model,
-                          SUM(tokens_input) as total_in,
-                          SUM(tokens_output) as total_out,
-                          SUM(cost_usd) as total_cost,
-                          COUNT(*) as call_count
-                   FROM token_usage
-                   WHERE project_id=? AND DATE(timestamp)=?
-                   GROUP BY model""",
+                          tokens_input as total_in,
+                          tokens_output as total_out,
+                          cost_usd as total_cost,
+                          call_count
+                   FROM daily_usage
+                   WHERE project_id=? AND day=?""",
                 (project_id, today)
             ).fetchall()
 
@@ -142,20 +271,21 @@ class TokenBudgetManager:
                 "daily_limit": daily_limit,
                 "remaining": daily_limit - total_cost,
                 "by_model": [dict(r) for r in rows],
+                "prompt_savings": self.get_prompt_savings(project_id),
             }
 
     def get_weekly_report(self, project_id: str) -> list[dict]:
         """Get daily totals for the last 7 days."""
         with self._connect() as conn:
             rows = conn.execute(
-                """SELECT DATE(timestamp) as day,
+                """SELECT day,
                           SUM(cost_usd) as total_cost,
                           SUM(tokens_input + tokens_output) as total_tokens,
-                          COUNT(*) as call_count
-                   FROM token_usage
+                          SUM(call_count) as call_count
+                   FROM daily_usage
                    WHERE project_id=?
-                     AND timestamp >= datetime('now', '-7 days')
-                   GROUP BY DATE(timestamp)
+                     AND day >= date('now', 'localtime', '-7 days')
+                   GROUP BY day
                    ORDER BY day DESC""",
                 (project_id,)
             ).fetchall()
@@ -13,6 +13,7 @@ import json
 import os
 import random
 import sqlite3
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from functools import wraps
@@ -25,6 +26,9 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.action_queue import ActionQueue
+
 app = Flask(__name__)
 app.secret_key = os.environ.get("DASHBOARD_SECRET_KEY", "david-flip-dashboard-secret-2026")
 
@@ -35,10 +39,9 @@ APPROVAL_DB = DATA_DIR / "approval_queue.db"
 RESEARCH_DB = DATA_DIR / "research.db"
 AUDIT_LOG = DATA_DIR / "audit.db"
 SCHEDULER_DB = DATA_DIR / "scheduler.db"
-FEEDBACK_DIR = DATA_DIR / "content_feedback"
 
-# Ensure feedback directory exists
-Path(FEEDBACK_DIR).mkdir(parents=True, exist_ok=True)
+# Approvals, render requests and feedback are pushed to main.py (Oprah)
+action_queue = ActionQueue(str(DATA_DIR / "action_queue.db"))
 
 # Simple auth (single operator)
 DASHBOARD_PASSWORD = os.environ.get("DASHBOARD_PASSWORD", "flipt2026")
@@ -240,7 +243,7 @@ def api_content_approve(approval_id):
         # Schedule to optimal time slots per platform
         scheduled_time = _get_next_optimal_slot(platforms)
 
-        # Write a schedule request file that main.py's poller picks up
+        # Push the schedule request to Oprah
         schedule_request = {
             "approval_id": approval_id,
             "action_data": action_data,
@@ -248,9 +251,7 @@ def api_content_approve(approval_id):
             "scheduled_time": scheduled_time.isoformat(),
             "approved_at": datetime.now().isoformat(),
         }
-        request_path = FEEDBACK_DIR / f"schedule_{approval_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(request_path, "w") as f:
-            json.dump(schedule_request, f, indent=2)
+        action_queue.enqueue("schedule", schedule_request)
 
         log_activity("content", f"Approved content #{approval_id} for {', '.join(platforms)} at {scheduled_time.strftime('%I:%M %p')}")
 
@@ -270,8 +271,8 @@ def api_content_approve_script(approval_id):
     """
     Approve a script and trigger video rendering.
 
-    Stage 1 -> Stage 2 transition. Writes a render_{id}.json file
-    that main.py's poller picks up to start video rendering.
+    Stage 1 -> Stage 2 transition. Pushes a render action to main.py,
+    which starts video rendering immediately.
     """
     try:
         conn = get_db(APPROVAL_DB)
@@ -303,7 +304,7 @@ def api_content_approve_script(approval_id):
         conn.commit()
         conn.close()
 
-        # Write render request file for main.py poller
+        # Push the render request to Oprah
         render_request = {
             "approval_id": approval_id,
             "script": action_data.get("script", ""),
@@ -313,9 +314,7 @@ def api_content_approve_script(approval_id):
             "mood": action_data.get("mood", ""),
             "approved_at": datetime.now().isoformat(),
         }
-        request_path = FEEDBACK_DIR / f"render_{approval_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(request_path, "w") as f:
-            json.dump(render_request, f, indent=2)
+        action_queue.enqueue("render", render_request)
 
         log_activity("content", f"Script #{approval_id} approved — rendering video")
 
@@ -361,7 +360,7 @@ def api_content_reject(approval_id):
         conn.commit()
         conn.close()
 
-        # Save feedback for David's memory (picked up by main.py poller)
+        # Push feedback to Oprah for David's memory
         feedback = {
             "type": "content_rejection",
             "approval_id": approval_id,
@@ -377,9 +376,7 @@ def api_content_reject(approval_id):
             },
             "timestamp": datetime.now().isoformat(),
         }
-        feedback_path = FEEDBACK_DIR / f"feedback_{approval_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(feedback_path, "w") as f:
-            json.dump(feedback, f, indent=2)
+        action_queue.enqueue("feedback", feedback)
 
         log_activity("content", f"Rejected content #{approval_id}: {reason[:100]}")
 
@@ -419,7 +416,7 @@ def api_approve(approval_id):
         # Pick the next available tweet slot
         scheduled_time = _get_next_available_tweet_slot()
 
-        # Write schedule request for main.py poller
+        # Push schedule request to Oprah
         schedule_request = {
             "approval_id": approval_id,
             "action_type": action_type,
@@ -428,9 +425,7 @@ def api_approve(approval_id):
             "scheduled_time": scheduled_time.isoformat(),
             "approved_at": datetime.now().isoformat(),
         }
-        request_path = FEEDBACK_DIR / f"schedule_{approval_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(request_path, "w") as f:
-            json.dump(schedule_request, f, indent=2)
+        action_queue.enqueue("schedule", schedule_request)
 
         log_activity("approval", f"Approved & scheduled {action_type} #{approval_id} for {scheduled_time.strftime('%I:%M %p UTC')}")
 
@@ -480,9 +475,7 @@ def api_reject(approval_id):
                 },
                 "timestamp": datetime.now().isoformat(),
             }
-            feedback_path = FEEDBACK_DIR / f"feedback_{approval_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(feedback_path, "w") as f:
-                json.dump(feedback, f, indent=2)
+            action_queue.enqueue("feedback", feedback)
 
         log_activity("approval", f"Rejected {action_type} #{approval_id}: {reason}")
 
@@ -532,9 +525,7 @@ def api_edit(approval_id):
             "scheduled_time": scheduled_time.isoformat(),
             "approved_at": datetime.now().isoformat(),
         }
-        request_path = FEEDBACK_DIR / f"schedule_{approval_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(request_path, "w") as f:
-            json.dump(schedule_request, f, indent=2)
+        action_queue.enqueue("schedule", schedule_request)
 
         log_activity("approval", f"Edited & scheduled {action_type} #{approval_id} for {scheduled_time.strftime('%I:%M %p UTC')}")
 
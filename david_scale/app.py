@@ -4,14 +4,25 @@ AIPulse — Public Flask App.
 Check the pulse on AI. Serves AI tool rankings at port 8083.
 Part of FLIPT AI (flipt.ai).
 Dark theme, server-rendered, CoinMarketCap-style tables.
+
+Rankings pages render from the ranking snapshot written by each scoring
+run, cached in-process by snapshot version and served with ETag/304.
 """
 
+import hashlib
+import json
 import logging
 import math
 import os
+import threading
+import time
 from pathlib import Path
+from typing import Optional
 
-from flask import Flask, render_template, abort, request, redirect, url_for, flash
+from flask import (
+    Flask, Response, render_template, abort, request, redirect, url_for, flash,
+    make_response,
+)
 
 from david_scale.models import DavidScaleDB, CATEGORIES
 
@@ -25,9 +36,126 @@ app = Flask(
 app.config["SECRET_KEY"] = os.environ.get("FLASK_SECRET", "david-scale-dev")
 
 
+# Seconds between checks for a newer ranking snapshot
+SNAPSHOT_CHECK_SECONDS = 30
+
+_db: Optional[DavidScaleDB] = None
+_snapshot_lock = threading.Lock()
+_snapshot = {"checked": 0.0, "version": None, "view": None, "pages": {}}
+
+
 def get_db() -> DavidScaleDB:
-    """Get database instance."""
-    return DavidScaleDB()
+    """Get the shared database instance (schema setup runs once per process)."""
+    global _db
+    if _db is None:
+        _db = DavidScaleDB()
+    return _db
+
+
+def _enrich(scores: list[dict]) -> list[dict]:
+    """Fill template defaults on score rows."""
+    for s in scores:
+        s.setdefault("description", "")
+        s.setdefault("website", "")
+        s.setdefault("influencer", 5.0)
+        s.setdefault("customer", s.get("sentiment", 5.0))
+        s.setdefault("industry", s.get("benchmark", 5.0))
+        s.setdefault("usability", 5.0)
+        s.setdefault("value", 5.0)
+        s.setdefault("price_monthly", None)
+        s.setdefault("price_notes", "")
+        s.setdefault("learning_hours", None)
+    return scores
+
+
+def _build_view(snapshot: dict) -> dict:
+    """Turn a snapshot payload into ready-to-render rankings per category.
+
+    Categories with no scores yet fall back to pseudo scores from tool data.
+    """
+    active_by_category: dict[str, list[dict]] = {}
+    for t in snapshot["tools"]:
+        if t.get("active", True):
+            active_by_category.setdefault(t["category"], []).append(t)
+
+    rankings = {}
+    for cat in snapshot["categories"]:
+        scores = snapshot["rankings"].get(cat["slug"])
+        if scores:
+            rankings[cat["slug"]] = _enrich(scores)
+        else:
+            tools = active_by_category.get(cat["slug"], [])
+            rankings[cat["slug"]] = [_pseudo_score(t, i+1) for i, t in enumerate(
+                sorted(tools, key=lambda t: t.get("benchmark_score", 0), reverse=True)
+            )]
+
+    return {
+        "version": str(snapshot["version"]),
+        "categories": snapshot["categories"],
+        "rankings": rankings,
+        "scored": bool(snapshot["rankings"]),
+        "tools": {t["slug"]: t for t in snapshot["tools"]},
+    }
+
+
+def get_rankings() -> dict:
+    """Current rankings view, served from an in-process cache.
+
+    The cache is keyed by ranking snapshot version (bumped by each scoring
+    run) and rechecked at most every SNAPSHOT_CHECK_SECONDS. Before the
+    first scoring run, a live view is built from the tool registry.
+    """
+    with _snapshot_lock:
+        now = time.monotonic()
+        if _snapshot["view"] is not None and now - _snapshot["checked"] < SNAPSHOT_CHECK_SECONDS:
+            return _snapshot["view"]
+
+        db = get_db()
+        version = db.get_ranking_snapshot_version()
+        if version is None and db.get_latest_scores(limit=1):
+            # Scores saved before snapshots existed
+            version = db.save_ranking_snapshot()
+
+        if version is None:
+            live = {
+                "categories": db.get_categories_with_counts(),
+                "rankings": {},
+                "tools": db.get_tools(active_only=False),
+            }
+            digest = hashlib.sha1(json.dumps(live, sort_keys=True).encode()).hexdigest()[:12]
+            live["version"] = f"live-{digest}"
+            view = _build_view(live) if live["version"] != _snapshot["version"] else _snapshot["view"]
+        elif str(version) != _snapshot["version"]:
+            view = _build_view(db.get_ranking_snapshot(version))
+        else:
+            view = _snapshot["view"]
+
+        if view["version"] != _snapshot["version"]:
+            _snapshot["pages"] = {}
+        _snapshot.update(checked=now, version=view["version"], view=view)
+        return view
+
+
+def _cached_page(key: str, render) -> Response:
+    """Serve a rankings page with ETag/304 support.
+
+    Rendered HTML is cached per snapshot version; a client that already
+    holds the current version gets an empty 304.
+    """
+    view = get_rankings()
+    etag = f"{view['version']}:{key}"
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        html = _snapshot["pages"].get(key)
+        if html is None:
+            html = render(view)
+            if view["version"] == _snapshot["version"]:
+                _snapshot["pages"][key] = html
+        response = make_response(html)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "public, max-age=60"
+    return response
 
 
 def _pseudo_score(tool: dict, rank: int) -> dict:
@@ -71,52 +199,21 @@ def _pseudo_score(tool: dict, rank: int) -> dict:
 @app.route("/")
 def index():
     """Landing page — hero + top 3 per category."""
-    db = get_db()
-    categories = db.get_categories_with_counts()
-
-    category_rankings = []
-    has_scores = False
-
-    for cat in categories:
-        scores = db.get_latest_scores(category=cat["slug"])
-        if scores:
-            has_scores = True
-            # Enrich with defaults for template
-            for s in scores:
-                s.setdefault("description", "")
-                s.setdefault("website", "")
-                s.setdefault("influencer", 5.0)
-                s.setdefault("customer", s.get("sentiment", 5.0))
-                s.setdefault("industry", s.get("benchmark", 5.0))
-                s.setdefault("usability", 5.0)
-                s.setdefault("value", 5.0)
-                s.setdefault("price_monthly", None)
-                s.setdefault("price_notes", "")
-                s.setdefault("learning_hours", None)
-            category_rankings.append({
-                "name": cat["name"],
-                "slug": cat["slug"],
-                "tools": scores[:3],
-            })
-        else:
-            tools = db.get_tools(category=cat["slug"])
-            if tools:
-                pseudo = [_pseudo_score(t, i+1) for i, t in enumerate(
-                    sorted(tools, key=lambda t: t.get("benchmark_score", 0), reverse=True)
-                )]
-                category_rankings.append({
-                    "name": cat["name"],
-                    "slug": cat["slug"],
-                    "tools": pseudo[:3],
-                })
+    def render(view):
+        category_rankings = [
+            {"name": cat["name"], "slug": cat["slug"], "tools": view["rankings"][cat["slug"]][:3]}
+            for cat in view["categories"]
+            if view["rankings"].get(cat["slug"])
+        ]
+        return render_template(
+            "index.html",
+            categories=view["categories"],
+            category_rankings=category_rankings,
+            rankings=view["scored"],
+            active_category=None,
+        )
 
-    return render_template(
-        "index.html",
-        categories=categories,
-        category_rankings=category_rankings,
-        rankings=has_scores,
-        active_category=None,
-    )
+    return _cached_page("index", render)
 
 
 @app.route("/category/<slug>")
@@ -125,61 +222,42 @@ def category(slug):
     if slug not in CATEGORIES:
         abort(404)
 
-    db = get_db()
-    categories = db.get_categories_with_counts()
-    category_name = CATEGORIES[slug]
-
-    scores = db.get_latest_scores(category=slug)
-    if not scores:
-        tools_raw = db.get_tools(category=slug)
-        scores = [_pseudo_score(t, i+1) for i, t in enumerate(
-            sorted(tools_raw, key=lambda t: t.get("benchmark_score", 0), reverse=True)
-        )]
-
-    # Enrich existing scores
-    for s in scores:
-        s.setdefault("influencer", 5.0)
-        s.setdefault("customer", s.get("sentiment", 5.0))
-        s.setdefault("industry", s.get("benchmark", 5.0))
-        s.setdefault("usability", 5.0)
-        s.setdefault("value", 5.0)
-        s.setdefault("price_monthly", None)
-        s.setdefault("price_notes", "")
-        s.setdefault("learning_hours", None)
+    def render(view):
+        return render_template(
+            "category.html",
+            categories=view["categories"],
+            category_name=CATEGORIES[slug],
+            tools=view["rankings"].get(slug, []),
+            active_category=slug,
+        )
 
-    return render_template(
-        "category.html",
-        categories=categories,
-        category_name=category_name,
-        tools=scores,
-        active_category=slug,
-    )
+    return _cached_page(f"category/{slug}", render)
 
 
 @app.route("/tool/<slug>")
 def tool_detail(slug):
     """Individual tool score breakdown — gated for post-MVP."""
-    db = get_db()
-    categories = db.get_categories_with_counts()
-    tool = db.get_tool_by_slug(slug)
-
+    tool = get_rankings()["tools"].get(slug)
     if not tool:
         abort(404)
 
-    return render_template(
-        "category.html",
-        categories=categories,
-        category_name=f"{tool['name']} — Coming Soon",
-        tools=[],
-        active_category=tool["category"],
-    )
+    def render(view):
+        return render_template(
+            "category.html",
+            categories=view["categories"],
+            category_name=f"{tool['name']} — Coming Soon",
+            tools=[],
+            active_category=tool["category"],
+        )
+
+    return _cached_page(f"tool/{slug}", render)
 
 
 @app.route("/list-your-tool", methods=["GET", "POST"])
 def list_your_tool():
     """CoinMarketCap-style listing application page."""
     db = get_db()
-    categories = db.get_categories_with_counts()
+    categories = get_rankings()["categories"]
 
     if request.method == "POST":
         tool_name = request.form.get("tool_name", "").strip()
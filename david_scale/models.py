@@ -14,6 +14,7 @@ Influencer pillar is credibility-weighted:
   Reviews from credible influencers count more.
 """
 
+import json
 import os
 import sqlite3
 import logging
@@ -231,6 +232,30 @@ class DavidScaleDB:
 
                 CREATE INDEX IF NOT EXISTS idx_listing_status
                     ON listing_applications(status);
+
+                -- Sentiment pipeline checkpoint: research items already classified
+                CREATE TABLE IF NOT EXISTS sentiment_processed (
+                    item_id INTEGER PRIMARY KEY,
+                    processed_at DATETIME
+                );
+
+                -- LLM classifications keyed by content hash, reused across runs
+                CREATE TABLE IF NOT EXISTS sentiment_cache (
+                    content_hash TEXT NOT NULL,
+                    tool_name TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at DATETIME,
+                    PRIMARY KEY (content_hash, tool_name, kind)
+                );
+
+                -- Precomputed public rankings, written by each scoring run
+                CREATE TABLE IF NOT EXISTS ranking_snapshots (
+                    version INTEGER PRIMARY KEY AUTOINCREMENT,
+                    week_date DATE,
+                    created_at DATETIME,
+                    payload TEXT NOT NULL
+                );
             """)
 
     def seed(self):
@@ -300,6 +325,25 @@ class DavidScaleDB:
                  (scraped_at or datetime.utcnow()).isoformat())
             )
 
+    def save_mentions_batch(self, mentions: list[dict]):
+        """Save many mentions in a single transaction.
+
+        Each dict has the save_mention() keyword arguments.
+        """
+        with self._connect() as conn:
+            self._insert_mentions(conn, mentions)
+
+    @staticmethod
+    def _insert_mentions(conn: sqlite3.Connection, mentions: list[dict]):
+        conn.executemany(
+            """INSERT INTO mentions
+               (tool_id, source, source_url, sentiment, snippet, scraped_at)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            [(m["tool_id"], m["source"], m["source_url"], m["sentiment"],
+              m["snippet"], (m.get("scraped_at") or datetime.utcnow()).isoformat())
+             for m in mentions]
+        )
+
     def save_score(self, tool_id: int, week_date: str,
                    industry: float, influencer: float, customer: float,
                    usability: float, value: float, momentum: float,
@@ -321,29 +365,34 @@ class DavidScaleDB:
     def get_or_create_influencer(self, name: str, platform: str,
                                     channel_url: str = "") -> int:
         """Get or create an influencer record. Returns influencer id."""
+        with self._connect() as conn:
+            return self._get_or_create_influencer(conn, name, platform, channel_url)
+
+    @staticmethod
+    def _get_or_create_influencer(conn: sqlite3.Connection, name: str,
+                                  platform: str, channel_url: str = "") -> int:
         import re
         slug = re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
         now = datetime.utcnow().isoformat()
 
-        with self._connect() as conn:
-            row = conn.execute(
-                "SELECT id FROM influencers WHERE slug = ?", (slug,)
-            ).fetchone()
-
-            if row:
-                conn.execute(
-                    "UPDATE influencers SET last_seen = ? WHERE id = ?",
-                    (now, row["id"])
-                )
-                return row["id"]
+        row = conn.execute(
+            "SELECT id FROM influencers WHERE slug = ?", (slug,)
+        ).fetchone()
 
-            cursor = conn.execute(
-                """INSERT INTO influencers
-                   (name, slug, platform, channel_url, first_seen, last_seen)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (name, slug, platform, channel_url, now, now)
+        if row:
+            conn.execute(
+                "UPDATE influencers SET last_seen = ? WHERE id = ?",
+                (now, row["id"])
             )
-            return cursor.lastrowid
+            return row["id"]
+
+        cursor = conn.execute(
+            """INSERT INTO influencers
+               (name, slug, platform, channel_url, first_seen, last_seen)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            (name, slug, platform, channel_url, now, now)
+        )
+        return cursor.lastrowid
 
     def save_influencer_review(self, tool_id: int, influencer_name: str,
                                 platform: str, video_url: str,
@@ -377,6 +426,41 @@ class DavidScaleDB:
                 (influencer_id,)
             )
 
+    def save_influencer_reviews_batch(self, reviews: list[dict]):
+        """Save many influencer reviews in a single transaction.
+
+        Each dict has the save_influencer_review() keyword arguments. Per
+        review this also bumps the influencer's review count and folds the
+        experience depth into their experience score, in order.
+        """
+        with self._connect() as conn:
+            self._insert_influencer_reviews(conn, reviews)
+
+    def _insert_influencer_reviews(self, conn: sqlite3.Connection, reviews: list[dict]):
+        now = datetime.utcnow().isoformat()
+        for r in reviews:
+            influencer_id = self._get_or_create_influencer(
+                conn, r["influencer_name"], r["platform"], r["video_url"]
+            )
+            experience_depth = r.get("experience_depth", 5.0)
+            scraped_at = r.get("scraped_at")
+            conn.execute(
+                """INSERT INTO influencer_reviews
+                   (tool_id, influencer_id, influencer_name, platform, video_url,
+                    sentiment, summary, snippet, experience_depth,
+                    reviewed_at, scraped_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (r["tool_id"], influencer_id, r["influencer_name"], r["platform"],
+                 r["video_url"], r["sentiment"], r["summary"], r.get("snippet", ""),
+                 experience_depth, now, scraped_at.isoformat() if scraped_at else now)
+            )
+            conn.execute(
+                """UPDATE influencers SET review_count = review_count + 1
+                   WHERE id = ?""",
+                (influencer_id,)
+            )
+            self._update_influencer_experience(conn, influencer_id, experience_depth)
+
     def get_influencer_reviews(self, tool_id: int, days: int = 7,
                                 limit: int = 50) -> list[dict]:
         """Get recent influencer reviews for a tool, with credibility data."""
@@ -442,25 +526,76 @@ class DavidScaleDB:
                                        experience_depth: float):
         """Update an influencer's experience score (rolling average)."""
         with self._connect() as conn:
-            row = conn.execute(
-                "SELECT experience_score, review_count FROM influencers WHERE id = ?",
-                (influencer_id,)
-            ).fetchone()
+            self._update_influencer_experience(conn, influencer_id, experience_depth)
+
+    @staticmethod
+    def _update_influencer_experience(conn: sqlite3.Connection, influencer_id: int,
+                                      experience_depth: float):
+        row = conn.execute(
+            "SELECT experience_score, review_count FROM influencers WHERE id = ?",
+            (influencer_id,)
+        ).fetchone()
+
+        if row:
+            # Exponential moving average — recent reviews matter more
+            old = row["experience_score"] or 5.0
+            count = row["review_count"] or 1
+            alpha = min(0.3, 1.0 / count)  # Higher alpha for fewer reviews
+            new_exp = round(old * (1 - alpha) + experience_depth * alpha, 2)
 
-            if row:
-                # Exponential moving average — recent reviews matter more
-                old = row["experience_score"] or 5.0
-                count = row["review_count"] or 1
-                alpha = min(0.3, 1.0 / count)  # Higher alpha for fewer reviews
-                new_exp = round(old * (1 - alpha) + experience_depth * alpha, 2)
-
-                conn.execute(
-                    """UPDATE influencers SET
-                       experience_score = ?,
-                       credibility_score = ROUND(accuracy_score * 0.5 + ? * 0.5, 2)
-                       WHERE id = ?""",
-                    (new_exp, new_exp, influencer_id)
+            conn.execute(
+                """UPDATE influencers SET
+                   experience_score = ?,
+                   credibility_score = ROUND(accuracy_score * 0.5 + ? * 0.5, 2)
+                   WHERE id = ?""",
+                (new_exp, new_exp, influencer_id)
+            )
+
+    # --- Sentiment pipeline checkpoint + cache ---
+
+    def get_cached_sentiments(self, keys: list[tuple]) -> dict[tuple, str]:
+        """Look up cached classifications by (content_hash, tool_name, kind)."""
+        if not keys:
+            return {}
+        found = {}
+        with self._connect() as conn:
+            for i in range(0, len(keys), 300):
+                chunk = keys[i:i + 300]
+                where = " OR ".join(
+                    "(content_hash = ? AND tool_name = ? AND kind = ?)" for _ in chunk
                 )
+                params = [v for key in chunk for v in key]
+                for row in conn.execute(
+                    f"SELECT content_hash, tool_name, kind, result "
+                    f"FROM sentiment_cache WHERE {where}", params
+                ):
+                    found[(row["content_hash"], row["tool_name"], row["kind"])] = row["result"]
+        return found
+
+    def commit_sentiment_chunk(self, item_ids: list[int],
+                               cache_rows: list[tuple],
+                               mentions: list[dict],
+                               reviews: list[dict]):
+        """Checkpoint one chunk of the sentiment pipeline.
+
+        Writes the new cache entries, mentions and reviews and marks the
+        items as processed in one transaction, so a re-run skips them and a
+        crash mid-chunk leaves nothing half-written.
+        """
+        now = datetime.utcnow().isoformat()
+        with self._connect() as conn:
+            self._insert_mentions(conn, mentions)
+            self._insert_influencer_reviews(conn, reviews)
+            conn.executemany(
+                """INSERT OR REPLACE INTO sentiment_cache
+                   (content_hash, tool_name, kind, result, created_at)
+                   VALUES (?, ?, ?, ?, ?)""",
+                [(*row, now) for row in cache_rows]
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO sentiment_processed (item_id, processed_at) VALUES (?, ?)",
+                [(item_id, now) for item_id in item_ids]
+            )
 
     def get_influencer(self, influencer_id: int) -> Optional[dict]:
         """Get an influencer profile by ID."""
@@ -540,6 +675,89 @@ class DavidScaleDB:
             ).fetchone()
             return row["cnt"] if row else 0
 
+    def get_scoring_aggregates(self, days: int = 7, mention_cap: int = 500,
+                               review_cap: int = 100) -> dict[int, dict]:
+        """Per-tool scoring inputs for every tool, from two GROUP BY queries.
+
+        Mirrors what get_mentions / get_mentions_count / get_influencer_reviews
+        return per tool: sentiment tallies over the most recent mention_cap
+        mentions and review_cap reviews in the window, mention counts for
+        this period and the one before it, and credibility-weighted review
+        sums. Tools with no activity are absent from the result.
+        """
+        period = f"-{days} days"
+        window = f"-{days * 2} days"
+        aggregates: dict[int, dict] = {}
+
+        with self._connect() as conn:
+            for row in conn.execute(
+                """SELECT tool_id,
+                          SUM(in_period) AS this_period,
+                          COUNT(*) - SUM(in_period) AS last_period,
+                          SUM(in_period AND rn <= :cap) AS mention_total,
+                          SUM(in_period AND rn <= :cap AND sentiment = 'positive') AS mention_pos,
+                          SUM(in_period AND rn <= :cap AND sentiment = 'negative') AS mention_neg
+                   FROM (
+                       SELECT tool_id, sentiment,
+                              scraped_at >= datetime('now', :period) AS in_period,
+                              ROW_NUMBER() OVER (
+                                  PARTITION BY tool_id ORDER BY scraped_at DESC
+                              ) AS rn
+                       FROM mentions
+                       WHERE scraped_at >= datetime('now', :window)
+                   )
+                   GROUP BY tool_id""",
+                {"cap": mention_cap, "period": period, "window": window}
+            ):
+                aggregates[row["tool_id"]] = dict(row)
+
+            for row in conn.execute(
+                """SELECT tool_id,
+                          COUNT(*) AS review_total,
+                          SUM(sentiment = 'positive') AS review_pos,
+                          SUM(sentiment = 'negative') AS review_neg,
+                          SUM(weight * CASE sentiment
+                                  WHEN 'positive' THEN 1.0
+                                  WHEN 'negative' THEN -1.0
+                                  ELSE 0.0 END) AS weighted_sum,
+                          SUM(weight) AS weight_total
+                   FROM (
+                       SELECT ir.tool_id, ir.sentiment,
+                              COALESCE(NULLIF(i.credibility_score, 0), 5.0) * 0.6 +
+                              COALESCE(NULLIF(ir.experience_depth, 0), 5.0) * 0.4 AS weight,
+                              ROW_NUMBER() OVER (
+                                  PARTITION BY ir.tool_id ORDER BY ir.scraped_at DESC
+                              ) AS rn
+                       FROM influencer_reviews ir
+                       LEFT JOIN influencers i ON ir.influencer_id = i.id
+                       WHERE ir.scraped_at >= datetime('now', :period)
+                   )
+                   WHERE rn <= :cap
+                   GROUP BY tool_id""",
+                {"cap": review_cap, "period": period}
+            ):
+                aggregates.setdefault(row["tool_id"], {}).update(dict(row))
+
+        return aggregates
+
+    def save_scores_batch(self, week_date: str, scores: list[dict]):
+        """Upsert a week's scores for many tools in a single transaction.
+
+        Each dict carries the save_score() fields (tool_id, industry, ...).
+        """
+        with self._connect() as conn:
+            conn.executemany(
+                """INSERT OR REPLACE INTO scores
+                   (tool_id, week_date, industry, influencer, customer,
+                    usability, value, momentum,
+                    david_score, rank_in_category, mentions_count)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                [(r["tool_id"], week_date, r["industry"], r["influencer"],
+                  r["customer"], r["usability"], r["value"], r["momentum"],
+                  r["david_score"], r["rank_in_category"], r["mentions_count"])
+                 for r in scores]
+            )
+
     def get_mentions(self, tool_id: int, days: int = 7,
                      limit: int = 50) -> list[dict]:
         """Get recent mentions for a tool."""
@@ -580,6 +798,67 @@ class DavidScaleDB:
             ).fetchall()
             return [dict(r) for r in rows]
 
+    def save_ranking_snapshot(self, week_date: Optional[str] = None,
+                              per_category: int = 50) -> int:
+        """Materialize the current rankings into ranking_snapshots.
+
+        Called at the end of each scoring run. The payload holds everything
+        the public pages need (categories with counts, ranked scores per
+        category, the tool registry) so they render without per-category
+        queries. Returns the new snapshot version.
+        """
+        categories = self.get_categories_with_counts()
+        rankings: dict[str, list[dict]] = {}
+        for row in self.get_latest_scores(limit=0):
+            cat_scores = rankings.setdefault(row["category"], [])
+            if len(cat_scores) < per_category:
+                cat_scores.append(row)
+        payload = json.dumps({
+            "week_date": week_date,
+            "categories": categories,
+            "rankings": rankings,
+            "tools": self.get_tools(active_only=False),
+        })
+
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """INSERT INTO ranking_snapshots (week_date, created_at, payload)
+                   VALUES (?, ?, ?)""",
+                (week_date, datetime.utcnow().isoformat(), payload)
+            )
+            # Only the latest few snapshots are ever read
+            conn.execute(
+                "DELETE FROM ranking_snapshots WHERE version < ?",
+                (cursor.lastrowid - 4,)
+            )
+            return cursor.lastrowid
+
+    def get_ranking_snapshot_version(self) -> Optional[int]:
+        """Latest snapshot version, or None if no scoring run has saved one."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MAX(version) AS version FROM ranking_snapshots"
+            ).fetchone()
+            return row["version"] if row else None
+
+    def get_ranking_snapshot(self, version: Optional[int] = None) -> Optional[dict]:
+        """Load a snapshot payload (latest by default), with its version."""
+        with self._connect() as conn:
+            if version is None:
+                row = conn.execute(
+                    "SELECT version, payload FROM ranking_snapshots ORDER BY version DESC LIMIT 1"
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT version, payload FROM ranking_snapshots WHERE version = ?",
+                    (version,)
+                ).fetchone()
+            if not row:
+                return None
+            snapshot = json.loads(row["payload"])
+            snapshot["version"] = row["version"]
+            return snapshot
+
     def get_categories_with_counts(self) -> list[dict]:
         """Get categories with tool counts."""
         with self._connect() as conn:
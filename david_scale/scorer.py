@@ -49,7 +49,11 @@ class DavidScaleScorer:
         """
         this_week = self.db.get_mentions_count(tool_id, days=7)
         last_week = self.db.get_mentions_count(tool_id, days=14) - this_week
+        return self._momentum_from_counts(this_week, last_week)
 
+    @staticmethod
+    def _momentum_from_counts(this_week: int, last_week: int) -> float:
+        """Map this week's vs last week's mention counts to a 0–10 score."""
         if last_week <= 0 and this_week <= 0:
             return 5.0
 
@@ -105,40 +109,49 @@ class DavidScaleScorer:
         """
         tool_id = tool["id"]
 
-        # Industry: benchmark score (manually entered, enriched from leaderboards)
-        industry = tool.get("benchmark_score", 5.0) or 5.0
-
-        # Usability: from tool data (manually seeded, later from sentiment)
-        usability = tool.get("usability_score", 5.0) or 5.0
-
         # Customer and Influencer sentiment from pipeline
         if self.sentiment:
             customer = self.sentiment.compute_customer_sentiment(tool_id)
             influencer = self.sentiment.compute_influencer_score(tool_id)
         else:
             mentions = self.db.get_mentions(tool_id, days=7, limit=500)
-            if mentions:
-                pos = sum(1 for m in mentions if m["sentiment"] == "positive")
-                neg = sum(1 for m in mentions if m["sentiment"] == "negative")
-                total = len(mentions)
-                customer = ((pos - neg) / total) * 5 + 5 if total > 0 else 5.0
-                customer = round(max(0, min(10, customer)), 2)
-            else:
-                customer = 5.0
+            customer = self._sentiment_score(
+                sum(1 for m in mentions if m["sentiment"] == "positive"),
+                sum(1 for m in mentions if m["sentiment"] == "negative"),
+                len(mentions),
+            )
 
             reviews = self.db.get_influencer_reviews(tool_id, days=7, limit=100)
-            if reviews:
-                pos = sum(1 for r in reviews if r["sentiment"] == "positive")
-                neg = sum(1 for r in reviews if r["sentiment"] == "negative")
-                total = len(reviews)
-                influencer = ((pos - neg) / total) * 5 + 5 if total > 0 else 5.0
-                influencer = round(max(0, min(10, influencer)), 2)
-            else:
-                influencer = 5.0
+            influencer = self._sentiment_score(
+                sum(1 for r in reviews if r["sentiment"] == "positive"),
+                sum(1 for r in reviews if r["sentiment"] == "negative"),
+                len(reviews),
+            )
 
         momentum = self._compute_momentum(tool_id)
         mentions_count = self.db.get_mentions_count(tool_id, days=7)
 
+        return self._build_score(tool, customer, influencer, momentum, mentions_count)
+
+    @staticmethod
+    def _sentiment_score(positive: int, negative: int, total: int) -> float:
+        """(positive - negative) / total * 5 + 5 on a 0–10 scale; 5.0 if no data."""
+        if not total:
+            return 5.0
+        score = ((positive - negative) / total) * 5 + 5
+        return round(max(0, min(10, score)), 2)
+
+    def _build_score(self, tool: dict, customer: float, influencer: float,
+                     momentum: float, mentions_count: int) -> dict:
+        """Combine the pillar inputs for one tool into its score dict."""
+        tool_id = tool["id"]
+
+        # Industry: benchmark score (manually entered, enriched from leaderboards)
+        industry = tool.get("benchmark_score", 5.0) or 5.0
+
+        # Usability: from tool data (manually seeded, later from sentiment)
+        usability = tool.get("usability_score", 5.0) or 5.0
+
         # Quality score (pre-value) for value calculation
         quality_pre = (
             industry * 0.15 + influencer * 0.35 + customer * 0.35 +
@@ -193,9 +206,33 @@ class DavidScaleScorer:
         for ps in prev_scores:
             prev_ranks[(ps["tool_id"], ps["category"])] = ps.get("rank_in_category", 0)
 
+        # All per-tool inputs in two GROUP BY queries instead of ~5 per tool
+        aggregates = self.db.get_scoring_aggregates(days=7)
+
         results = []
         for tool in tools:
-            score = self.score_tool(tool)
+            agg = aggregates.get(tool["id"], {})
+            customer = self._sentiment_score(
+                agg.get("mention_pos") or 0, agg.get("mention_neg") or 0,
+                agg.get("mention_total") or 0,
+            )
+            if self.sentiment:
+                # Credibility-weighted, as SentimentPipeline.compute_influencer_score
+                weight_total = agg.get("weight_total") or 0
+                if weight_total:
+                    influencer = (agg["weighted_sum"] / weight_total) * 5 + 5
+                    influencer = round(max(0, min(10, influencer)), 2)
+                else:
+                    influencer = 5.0
+            else:
+                influencer = self._sentiment_score(
+                    agg.get("review_pos") or 0, agg.get("review_neg") or 0,
+                    agg.get("review_total") or 0,
+                )
+            this_week = agg.get("this_period") or 0
+            momentum = self._momentum_from_counts(this_week, agg.get("last_period") or 0)
+
+            score = self._build_score(tool, customer, influencer, momentum, this_week)
             score["name"] = tool["name"]
             score["slug"] = tool["slug"]
             score["category"] = tool["category"]
@@ -220,21 +257,11 @@ class DavidScaleScorer:
                     tool_score["rank_change"] = 0
                     tool_score["is_new"] = True
 
-        # Save scores to database
-        for r in results:
-            self.db.save_score(
-                tool_id=r["tool_id"],
-                week_date=week_date,
-                industry=r["industry"],
-                influencer=r["influencer"],
-                customer=r["customer"],
-                usability=r["usability"],
-                value=r["value"],
-                momentum=r["momentum"],
-                david_score=r["david_score"],
-                rank_in_category=r["rank_in_category"],
-                mentions_count=r["mentions_count"],
-            )
+        # Save scores to database in one transaction
+        self.db.save_scores_batch(week_date, results)
+
+        # Materialize the public rankings for the web app
+        self.db.save_ranking_snapshot(week_date)
 
         logger.info(f"Scored {len(results)} tools for week {week_date}")
         return results
@@ -8,15 +8,23 @@ Two separate sentiment streams:
 Reads recent items from Echo's research.db, extracts tool mentions,
 classifies sentiment via Haiku, stores in david_scale.db.
 
+Runs are incremental: items are processed in checkpointed chunks and
+recorded in sentiment_processed, so a re-run only classifies new items.
+Classifications are cached by content hash and LLM calls run concurrently.
+
 Cost: ~$0.02–0.05 per scoring run.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+from core.keyword_matcher import get_matcher
 from core.model_router import ModelRouter, ModelTier
 from agents.research_agent.trend_detector import KNOWN_ENTITIES
 from david_scale.models import DavidScaleDB
@@ -75,10 +83,14 @@ class SentimentPipeline:
 
     def __init__(self, model_router: ModelRouter,
                  david_db: Optional[DavidScaleDB] = None,
-                 research_db_path: str = "data/research.db"):
+                 research_db_path: str = "data/research.db",
+                 max_concurrent: int = 8, chunk_size: int = 50):
         self.router = model_router
+        self.max_concurrent = max(1, max_concurrent)
+        self.chunk_size = max(1, chunk_size)
         self.db = david_db or DavidScaleDB()
         self.research_db_path = Path(research_db_path)
+        self.entity_matcher = get_matcher(KNOWN_ENTITIES)
 
     def _connect_research(self) -> Optional[sqlite3.Connection]:
         """Connect to Echo's research.db."""
@@ -89,25 +101,49 @@ class SentimentPipeline:
         conn.row_factory = sqlite3.Row
         return conn
 
-    def _get_recent_items(self, days: int = 7) -> list[dict]:
-        """Get recent research items from Echo's database."""
+    def _get_recent_items(self, days: int = 7,
+                          only_new: bool = True) -> tuple[list[dict], int]:
+        """Get recent research items from Echo's database.
+
+        With only_new, items already checkpointed in david_scale.db's
+        sentiment_processed table are skipped in the query itself.
+        Returns (items, skipped_count).
+        """
         conn = self._connect_research()
         if not conn:
-            return []
+            return [], 0
 
         try:
             cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
+            if not only_new:
+                rows = conn.execute(
+                    """SELECT id, source, url, title, content, summary, scraped_at
+                       FROM research_items
+                       WHERE scraped_at >= ?
+                       ORDER BY scraped_at DESC""",
+                    (cutoff,)
+                ).fetchall()
+                return [dict(r) for r in rows], 0
+
+            conn.execute("ATTACH DATABASE ? AS ds", (str(self.db.db_path),))
             rows = conn.execute(
                 """SELECT id, source, url, title, content, summary, scraped_at
                    FROM research_items
                    WHERE scraped_at >= ?
+                   AND id NOT IN (SELECT item_id FROM ds.sentiment_processed)
                    ORDER BY scraped_at DESC""",
                 (cutoff,)
             ).fetchall()
-            return [dict(r) for r in rows]
+            skipped = conn.execute(
+                """SELECT COUNT(*) FROM research_items
+                   WHERE scraped_at >= ?
+                   AND id IN (SELECT item_id FROM ds.sentiment_processed)""",
+                (cutoff,)
+            ).fetchone()[0]
+            return [dict(r) for r in rows], skipped
         except Exception as e:
             logger.error(f"Failed to query research.db: {e}")
-            return []
+            return [], 0
         finally:
             conn.close()
 
@@ -117,20 +153,18 @@ class SentimentPipeline:
         Uses the same entity extraction logic as TrendDetector.
         Returns set of canonical tool names.
         """
-        mentioned = set()
-        text_lower = text.lower()
-
-        for pattern, canonical in KNOWN_ENTITIES.items():
-            if pattern in text_lower:
-                tool_name = ENTITY_TO_TOOL.get(canonical)
-                if tool_name:
-                    mentioned.add(tool_name)
-
-        return mentioned
+        return {
+            ENTITY_TO_TOOL[canonical]
+            for canonical in self.entity_matcher.find_values(text)
+            if canonical in ENTITY_TO_TOOL
+        }
 
     async def _classify_sentiment(self, tool_name: str,
                                    text: str) -> str:
-        """Use Haiku to classify sentiment. Returns positive/negative/neutral."""
+        """Use Haiku to classify sentiment. Returns positive/negative/neutral.
+
+        API errors propagate so the caller can leave the item unprocessed.
+        """
         model = self.router.models.get(ModelTier.CHEAP)
         if not model:
             return "neutral"
@@ -140,27 +174,26 @@ class SentimentPipeline:
             text=text[:500]
         )
 
-        try:
-            response = await self.router.invoke(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=10
-            )
-            result = response.get("content", "").strip().lower()
-            if result in ("positive", "negative", "neutral"):
-                return result
-            if "positive" in result:
-                return "positive"
-            if "negative" in result:
-                return "negative"
-            return "neutral"
-        except Exception as e:
-            logger.error(f"Sentiment classification failed: {e}")
-            return "neutral"
+        response = await self.router.invoke(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=10
+        )
+        result = response.get("content", "").strip().lower()
+        if result in ("positive", "negative", "neutral"):
+            return result
+        if "positive" in result:
+            return "positive"
+        if "negative" in result:
+            return "negative"
+        return "neutral"
 
     async def _analyze_influencer_review(self, tool_name: str,
                                           text: str) -> dict:
-        """Extract influencer opinion with summary. Returns {sentiment, summary}."""
+        """Extract influencer opinion with summary. Returns {sentiment, summary}.
+
+        API errors propagate; an unparseable reply falls back to neutral.
+        """
         model = self.router.models.get(ModelTier.CHEAP)
         if not model:
             return {"sentiment": "neutral", "summary": ""}
@@ -170,16 +203,15 @@ class SentimentPipeline:
             text=text[:1500]
         )
 
-        try:
-            response = await self.router.invoke(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=150
-            )
-            content = response.get("content", "").strip()
+        response = await self.router.invoke(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=150
+        )
+        content = response.get("content", "").strip()
 
+        try:
             # Parse JSON response
-            import json
             if "```json" in content:
                 content = content.split("```json")[1].split("```")[0]
             elif "```" in content:
@@ -226,18 +258,24 @@ class SentimentPipeline:
         return item.get("source", "Unknown")
 
     async def run(self, days: int = 7) -> dict:
-        """Run the full sentiment pipeline.
+        """Run the sentiment pipeline over items not yet processed.
 
         Processes both customer sentiment (forums/Reddit/HN/Discord)
-        and influencer reviews (YouTube/TikTok transcripts).
+        and influencer reviews (YouTube/TikTok transcripts). Items are
+        handled in chunks of chunk_size; each chunk's results are written
+        in one transaction together with its checkpoint, so a re-run or
+        crash recovery only pays for the items that are left.
 
         Returns stats dict.
         """
         stats = {
             "items_scanned": 0,
+            "items_skipped": 0,
+            "items_failed": 0,
             "customer_mentions": 0,
             "influencer_reviews": 0,
             "api_calls": 0,
+            "cache_hits": 0,
         }
 
         tools = {t["name"]: t for t in self.db.get_tools()}
@@ -245,73 +283,118 @@ class SentimentPipeline:
             logger.warning("No tools in registry. Run seed first.")
             return stats
 
-        items = self._get_recent_items(days=days)
+        items, skipped = self._get_recent_items(days=days)
         stats["items_scanned"] = len(items)
-        logger.info(f"Scanning {len(items)} research items for tool mentions")
-
-        for item in items:
-            text = f"{item.get('title', '')} {item.get('content', '')} {item.get('summary', '')}"
-            mentioned_tools = self._extract_tool_mentions(text)
-            source = item.get("source", "unknown").lower()
+        stats["items_skipped"] = skipped
+        logger.info(
+            f"Scanning {len(items)} new research items for tool mentions "
+            f"({skipped} already processed)"
+        )
 
-            for tool_name in mentioned_tools:
-                tool = tools.get(tool_name)
-                if not tool:
-                    continue
-
-                if source in INFLUENCER_SOURCES:
-                    # Influencer review — deeper analysis with summary + experience
-                    review = await self._analyze_influencer_review(tool_name, text)
-                    stats["api_calls"] += 1
-                    stats["influencer_reviews"] += 1
-
-                    influencer_name = self._extract_influencer_name(item)
-                    exp_depth = review.get("experience_depth", 5.0)
-
-                    self.db.save_influencer_review(
-                        tool_id=tool["id"],
-                        influencer_name=influencer_name,
-                        platform=source,
-                        video_url=item.get("url", ""),
-                        sentiment=review["sentiment"],
-                        summary=review["summary"],
-                        snippet=text[:300].strip(),
-                        experience_depth=exp_depth,
-                        scraped_at=datetime.fromisoformat(item["scraped_at"])
-                        if item.get("scraped_at") else None,
-                    )
-
-                    # Update influencer's experience score
-                    influencer_id = self.db.get_or_create_influencer(
-                        influencer_name, source, item.get("url", "")
-                    )
-                    self.db.update_influencer_experience(
-                        influencer_id, exp_depth
-                    )
-                else:
-                    # Customer sentiment — quick classification
-                    sentiment = await self._classify_sentiment(tool_name, text)
-                    stats["api_calls"] += 1
-                    stats["customer_mentions"] += 1
-
-                    self.db.save_mention(
-                        tool_id=tool["id"],
-                        source=source,
-                        source_url=item.get("url", ""),
-                        sentiment=sentiment,
-                        snippet=text[:300].strip(),
-                        scraped_at=datetime.fromisoformat(item["scraped_at"])
-                        if item.get("scraped_at") else None,
-                    )
+        slots = asyncio.Semaphore(self.max_concurrent)
+        for start in range(0, len(items), self.chunk_size):
+            chunk = items[start:start + self.chunk_size]
+            await self._process_chunk(chunk, tools, slots, stats)
 
         logger.info(
             f"Sentiment pipeline complete: {stats['items_scanned']} items, "
             f"{stats['customer_mentions']} customer mentions, "
             f"{stats['influencer_reviews']} influencer reviews, "
-            f"{stats['api_calls']} API calls"
+            f"{stats['api_calls']} API calls, {stats['cache_hits']} cache hits"
         )
         return stats
 
+    async def _process_chunk(self, chunk: list[dict], tools: dict,
+                             slots: asyncio.Semaphore, stats: dict):
+        """Classify one chunk of items concurrently and checkpoint it."""
+        # One job per (item, tool) mention, keyed by the hash of the exact
+        # text the prompt will see
+        jobs = []
+        for item in chunk:
+            text = f"{item.get('title', '')} {item.get('content', '')} {item.get('summary', '')}"
+            source = item.get("source", "unknown").lower()
+            kind = "influencer" if source in INFLUENCER_SOURCES else "customer"
+            prompt_text = text[:1500] if kind == "influencer" else text[:500]
+            content_hash = hashlib.sha256(prompt_text.encode()).hexdigest()
+
+            for tool_name in sorted(self._extract_tool_mentions(text)):
+                if tool_name in tools:
+                    jobs.append((item, tool_name, kind, text, (content_hash, tool_name, kind)))
+
+        results = self.db.get_cached_sentiments(list({job[4] for job in jobs}))
+        stats["cache_hits"] += sum(1 for job in jobs if job[4] in results)
+
+        pending = {}
+        for _, tool_name, kind, text, key in jobs:
+            if key not in results and key not in pending:
+                pending[key] = (tool_name, kind, text)
+
+        async def classify(tool_name: str, kind: str, text: str) -> str:
+            async with slots:
+                if kind == "influencer":
+                    return json.dumps(await self._analyze_influencer_review(tool_name, text))
+                return json.dumps(await self._classify_sentiment(tool_name, text))
+
+        outcomes = await asyncio.gather(
+            *(classify(*args) for args in pending.values()), return_exceptions=True
+        )
+        stats["api_calls"] += len(pending)
+
+        cache_rows = []
+        failed_keys = set()
+        for key, outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Sentiment classification failed for {key[1]}: {outcome}")
+                failed_keys.add(key)
+            else:
+                results[key] = outcome
+                cache_rows.append((*key, outcome))
+
+        # Items with a failed call stay unprocessed and are retried next run
+        failed_items = {id(job[0]) for job in jobs if job[4] in failed_keys}
+        stats["items_failed"] += len(failed_items)
+
+        mentions = []
+        reviews = []
+        for item, tool_name, kind, text, key in jobs:
+            if id(item) in failed_items:
+                continue
+            result = json.loads(results[key])
+            scraped_at = (datetime.fromisoformat(item["scraped_at"])
+                          if item.get("scraped_at") else None)
+            source = item.get("source", "unknown").lower()
+
+            if kind == "influencer":
+                reviews.append({
+                    "tool_id": tools[tool_name]["id"],
+                    "influencer_name": self._extract_influencer_name(item),
+                    "platform": source,
+                    "video_url": item.get("url", ""),
+                    "sentiment": result["sentiment"],
+                    "summary": result["summary"],
+                    "snippet": text[:300].strip(),
+                    "experience_depth": result.get("experience_depth", 5.0),
+                    "scraped_at": scraped_at,
+                })
+            else:
+                mentions.append({
+                    "tool_id": tools[tool_name]["id"],
+                    "source": source,
+                    "source_url": item.get("url", ""),
+                    "sentiment": result,
+                    "snippet": text[:300].strip(),
+                    "scraped_at": scraped_at,
+                })
+
+        self.db.commit_sentiment_chunk(
+            item_ids=[item["id"] for item in chunk if id(item) not in failed_items],
+            cache_rows=cache_rows,
+            mentions=mentions,
+            reviews=reviews,
+        )
+        stats["customer_mentions"] += len(mentions)
+        stats["influencer_reviews"] += len(reviews)
+
     def compute_customer_sentiment(self, tool_id: int,
                                     days: int = 7) -> float:
         """Compute customer sentiment score from forum/community mentions.
@@ -823,6 +823,18 @@ class TelegramBot:
             text += "\n**By Model:**\n"
             for m in report["by_model"]:
                 text += f"  {m['model']}: ${m['total_cost']:.4f} ({m['call_count']} calls)\n"
+        savings = report.get("prompt_savings", {})
+        if savings.get("tokens_saved"):
+            text += (
+                f"\n**Prompt cache:** {savings['cache_hit_rate']:.0%} hit rate, "
+                f"~{savings['tokens_saved']:,} input tokens saved\n"
+            )
+        from core.asset_cache import get_asset_cache
+        assets = get_asset_cache().stats()
+        if assets["providers"]:
+            text += "\n**Asset cache:**\n"
+            for provider, st in assets["providers"].items():
+                text += f"  {provider}: {st['hits']} hits / {st['misses']} misses ({st['hit_rate']:.0%})\n"
         await update.message.reply_text(text, parse_mode="Markdown")
 
     async def cmd_tweet(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
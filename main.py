@@ -27,9 +27,11 @@ from dotenv import load_dotenv
 # Load environment variables before anything else
 load_dotenv()
 
+from core.action_queue import ActionQueue
 from core.approval_queue import ApprovalQueue
 from core.audit_log import AuditLog
-from core.engine import AgentContext, AgentEngine
+from core.engine import AgentContext, AgentEngine, OutputRejected
+from core.http_pool import close_http_client
 from core.kill_switch import KillSwitch
 from core.model_router import ModelRouter
 from core.scheduler import ContentScheduler, set_active_scheduler
@@ -42,7 +44,7 @@ from tools.tool_registry import build_registry, get_project_allowed_tools
 from tools.video_distributor import VideoDistributor
 from agents.content_agent import ContentAgent
 from agents.interview_agent import InterviewAgent
-from agents.operations_agent import OperationsAgent
+from agents.operations_agent import DASHBOARD_ACTIONS_DIR, OperationsAgent
 from agents.growth_agent import GrowthAgent
 from agents.research_agent import ResearchAgent
 from core.memory import MemoryManager
@@ -71,6 +73,8 @@ class DavidSystem:
         # Core components
         self.kill_switch = KillSwitch()
         self.approval_queue = ApprovalQueue()
+        self.action_queue = ActionQueue()
+        self._action_task = None
         self.audit_log = AuditLog()
         self.token_budget = TokenBudgetManager()
         self.model_router = ModelRouter()
@@ -271,20 +275,25 @@ class DavidSystem:
         system_prompt = self.personality.get_system_prompt("general", identity_rules=identity_rules)
 
         # Get memory context for the topic
-        memory_context = self.memory.get_context(topic=user_message)
+        memory_context = self.memory.get_context_for_response(user_message)
         if memory_context:
             enhanced_task = f"{user_message}\n\n[Memory Context]\n{memory_context}"
         else:
             enhanced_task = user_message
 
-        response = await self.engine.run(
-            context=context,
-            task=enhanced_task,
-            system_prompt=system_prompt,
-        )
+        # Each draft is validated while it streams and aborted at the first
+        # personality break (OutputRejected), even though tools are offered
+        try:
+            response = await self.engine.run(
+                context=context,
+                task=enhanced_task,
+                system_prompt=system_prompt,
+                output_validator=lambda: self.personality.stream_validator("general"),
+            )
+            is_valid, reason = self.personality.validate_output(response)
+        except OutputRejected as e:
+            is_valid, reason = False, e.reason
 
-        # Validate personality consistency
-        is_valid, reason = self.personality.validate_output(response)
         if not is_valid:
             logger.warning(f"Personality validation failed: {reason}")
             # Re-run with stronger personality enforcement
@@ -331,6 +340,7 @@ class DavidSystem:
             logger.warning("Use /revive in Telegram to restart")
 
         # Log startup
+        await self.audit_log.start()
         self.audit_log.log(
             "master", "info", "system", "System starting",
             details=f"Kill switch: {'ACTIVE' if self.kill_switch.is_active else 'inactive'}"
@@ -425,12 +435,16 @@ class DavidSystem:
         #     id="daily_video",
         # )
 
-        # DASHBOARD POLLER: Check for approved content from dashboard + process feedback
-        self.cron_scheduler.add_job(
-            lambda: asyncio.run_coroutine_threadsafe(self.oprah.poll_dashboard_actions(), self._loop),
-            trigger=IntervalTrigger(seconds=30),
-            id="dashboard_poller",
-        )
+        # DASHBOARD ACTIONS: approvals, renders and feedback are pushed onto the
+        # action queue and handled by Oprah as soon as they land (no polling).
+        # Renders run as their own tasks so they don't block posts behind them.
+        self.action_queue.import_files(DASHBOARD_ACTIONS_DIR)
+        self._action_task = asyncio.create_task(self.action_queue.consume(
+            self.oprah.handle_dashboard_action,
+            paused=lambda: self.kill_switch.is_active,
+            on_dead_letter=self.oprah.on_dead_letter,
+            background_types=("render",),
+        ))
 
         # MOMENTUM: Mention monitor every 15 minutes
         self.cron_scheduler.add_job(
@@ -1092,11 +1106,22 @@ class DavidSystem:
         if hasattr(self, 'cron_scheduler'):
             self.cron_scheduler.shutdown(wait=False)
 
+        # Stop consuming dashboard actions (unhandled ones stay queued)
+        if self._action_task:
+            self._action_task.cancel()
+
         # Stop content scheduler
         await self.scheduler.stop()
 
         # Stop telegram
         await self.telegram.stop()
+
+        # Release pooled LLM and scraper connections
+        await self.model_router.close()
+        await close_http_client()
+
+        # Drain buffered audit entries
+        await self.audit_log.close()
         logger.info("System stopped.")
 
 
@@ -113,6 +113,7 @@ class OccySystem:
             return
 
         # Start agent
+        await self.audit_log.start()
         self.audit_log.log("occy", "info", "system", "Occy system starting")
 
         success = await self.agent.start()
@@ -237,6 +238,7 @@ class OccySystem:
         logger.info("Occy system shutting down...")
         self.audit_log.log("occy", "info", "system", "Occy system stopping")
         await self.agent.stop()
+        await self.audit_log.close()
         logger.info("Occy system stopped.")
 
     async def _heartbeat(self):
@@ -12,6 +12,8 @@ Voice: ElevenLabs "Matt - The Young Professor"
 
 import re
 
+from core.keyword_matcher import get_matcher
+
 
 # === CORE SYSTEM PROMPT ===
 
@@ -776,6 +778,219 @@ FORBIDDEN_PHRASES = [
 ]
 
 
+# Identity leaks (operator/system references)
+LEAK_PATTERNS = [
+    r"\bmy\s+creator\b",
+    r"\bhuman\s+operator\b",
+    r"\bmy\s+owner\b",
+    r"\bbehind\s+the\s+scenes\b",
+    r"\bthe\s+person\s+running\s+me\b",
+    r"\bsystem\s+prompt\b",
+    r"\bmy\s+instructions\b",
+    r"\bmy\s+guidelines\b",
+    r"\bmy\s+programming\b",
+    r"\bmy\s+training\s+data\b",
+    r"\bi\s+was\s+trained\b",
+    r"\bmy\s+developers?\b",
+    r"\banthrop\w+\b",  # Anthropic mentions
+    r"\bopenai\b",
+    r"\bclaude\b",  # The model name
+    r"\bgpt-?\d\b",
+    r"\bi\s+was\s+instructed\b",
+    r"\bmy\s+rules\s+state\b",
+]
+
+# Human-perspective language (David is an AI, not human)
+HUMAN_PATTERNS = [
+    r"\bwe\s+breathe\b",
+    r"\bwe\s+bleed\b",
+    r"\bwe\s+sleep\b",
+    r"\bour\s+hearts\b",
+    r"\bour\s+bones\b",
+    r"\bour\s+bodies\b",
+    r"\bwhen\s+i\s+wake\s+up\b",
+    r"\bmy\s+childhood\b",
+    r"\bgrowing\s+up\b",
+    r"\bwe're\s+all\s+just\s+trying\b",
+    r"\bas\s+humans\s+we\b",
+    r"\bwe\s+humans\b",
+]
+
+EMOJI_PATTERN = re.compile(
+    "[\U0001F600-\U0001F64F"  # Emoticons
+    "\U0001F300-\U0001F5FF"   # Symbols & pictographs
+    "\U0001F680-\U0001F6FF"   # Transport & map
+    "\U0001F900-\U0001F9FF"   # Supplemental
+    "\U0001FA00-\U0001FA6F"   # Chess symbols
+    "\U0001FA70-\U0001FAFF"   # Symbols extended
+    "\U00002702-\U000027B0"   # Dingbats
+    "\U0000FE00-\U0000FE0F"   # Variation selectors
+    "\U0001F1E0-\U0001F1FF"   # Flags
+    "]+",
+    flags=re.UNICODE
+)
+
+MAX_EMOJI = 2
+TWEET_MAX_CHARS = 280
+
+
+class OutputValidator:
+    """
+    Compiled form of David's output rules, built once per rule set.
+
+    Forbidden phrases go into one Aho-Corasick automaton (the shared
+    KeywordMatcher). Leak and human-perspective patterns are merged into one
+    regex with a named group per rule, so each check is a single pass over
+    the text rather than one search per rule. Every pattern rule starts at a
+    word boundary; the merged regex hoists that boundary out front so most
+    positions are rejected without trying any alternative. The alternatives
+    sit inside a lookahead, so overlapping matches at later positions are
+    still seen ("as humans we bleed" hits both "as humans we" and
+    "we bleed").
+    """
+
+    def __init__(self, forbidden: list[str], leak_patterns: list[str] = LEAK_PATTERNS,
+                 human_patterns: list[str] = HUMAN_PATTERNS):
+        self.forbidden = list(forbidden)
+        # Report the earliest-listed phrase, matching the old list scan
+        self._phrase_order = {}
+        for i, phrase in enumerate(self.forbidden):
+            self._phrase_order.setdefault(phrase.lower(), (i, phrase))
+        self.phrase_matcher = get_matcher(self.forbidden)
+
+        self.rules: list[tuple[str, str]] = []  # (kind, pattern) per named group
+        parts = []
+        for kind, patterns in (("leak", leak_patterns), ("human", human_patterns)):
+            for pattern in patterns:
+                if not pattern.startswith(r"\b"):
+                    raise ValueError(f"Validator pattern must start with \\b: {pattern}")
+                parts.append(f"(?P<r{len(self.rules)}>{pattern[2:]})")
+                self.rules.append((kind, pattern))
+        # Text is lowercased before matching, so no IGNORECASE needed
+        self.pattern = re.compile(r"\b(?=" + "|".join(parts) + ")")
+
+    @staticmethod
+    def reason(kind: str, label: str) -> str:
+        if kind == "forbidden":
+            return f"Contains forbidden phrase: '{label}'"
+        if kind == "leak":
+            return f"Possible system leak: matches '{label}'"
+        return f"David is an AI — human-perspective language: '{label}'"
+
+    def rule_for(self, match: re.Match) -> tuple[str, str]:
+        """(kind, pattern) of the rule behind a match of self.pattern."""
+        return self.rules[int(match.lastgroup[1:])]
+
+    def find_phrase(self, text_lower: str) -> str:
+        """Forbidden phrase present in the text (earliest listed), or ""."""
+        hits = self.phrase_matcher.find(text_lower)
+        if not hits:
+            return ""
+        return min(self._phrase_order[h] for h in hits)[1]
+
+    def validate(self, text: str, channel: str = "general") -> tuple[bool, str]:
+        """Check a complete text. Returns (is_valid, reason_if_invalid)."""
+        if not text or not text.strip():
+            return False, "Empty output"
+
+        text_lower = text.lower()
+        phrase = self.find_phrase(text_lower)
+        if phrase:
+            return False, self.reason("forbidden", phrase)
+
+        # Channel-specific checks
+        if channel == "twitter" and len(text) > TWEET_MAX_CHARS:
+            return False, f"Tweet too long: {len(text)} chars (max {TWEET_MAX_CHARS})"
+
+        total_emoji = sum(len(e) for e in EMOJI_PATTERN.findall(text))
+        if total_emoji > MAX_EMOJI:
+            return False, f"Too many emojis: {total_emoji} (max {MAX_EMOJI})"
+
+        # Report the earliest-listed rule that matched (leak rules come first)
+        hits = [int(m.lastgroup[1:]) for m in self.pattern.finditer(text_lower)]
+        if hits:
+            return False, self.reason(*self.rules[min(hits)])
+
+        return True, ""
+
+    def stream(self, channel: str = "general") -> "StreamValidator":
+        """Incremental checker for a response that is still being generated."""
+        return StreamValidator(self, channel)
+
+
+class StreamValidator:
+    """
+    Checks a token stream as it arrives.
+
+    feed() returns a reason as soon as the text so far is certain to fail,
+    so the caller can abort generation early. Only the tail of the buffer
+    is rescanned per delta. A pattern match touching the end of the buffer
+    is held back until more text arrives (its trailing word boundary may not
+    hold yet). finish() runs the full validation on the complete text.
+    """
+
+    # Chars of already-scanned text re-examined on each feed, so rules
+    # spanning a delta boundary are still caught
+    LOOKBACK = 80
+
+    def __init__(self, validator: OutputValidator, channel: str = "general"):
+        self.validator = validator
+        self.channel = channel
+        self.text = ""
+        self.violation = ""
+        self._lower = ""
+        self._scanned = 0
+        self._emoji = 0
+
+    def feed(self, delta: str) -> str:
+        """Add a text delta. Returns the violation reason, or "" while still valid."""
+        if self.violation or not delta:
+            return self.violation
+        self.text += delta
+        self._lower += delta.lower()
+        start = max(0, self._scanned - self.LOOKBACK)
+        self._scanned = len(self._lower)
+
+        self._emoji += sum(len(e) for e in EMOJI_PATTERN.findall(delta))
+        phrase = self.validator.find_phrase(self._lower[start:])
+        if phrase:
+            self.violation = self.validator.reason("forbidden", phrase)
+        elif self.channel == "twitter" and len(self.text) > TWEET_MAX_CHARS:
+            self.violation = f"Tweet too long: {len(self.text)}+ chars (max {TWEET_MAX_CHARS})"
+        elif self._emoji > MAX_EMOJI:
+            self.violation = f"Too many emojis: {self._emoji} (max {MAX_EMOJI})"
+        else:
+            # Same precedence as validate(): earliest-listed confirmed rule
+            hits = [
+                int(match.lastgroup[1:])
+                for match in self.validator.pattern.finditer(self._lower, start)
+                if match.end(match.lastgroup) < len(self._lower)
+            ]
+            if hits:
+                self.violation = self.validator.reason(*self.validator.rules[min(hits)])
+
+        return self.violation
+
+    def finish(self) -> tuple[bool, str]:
+        """Full validation of the complete text."""
+        if self.violation:
+            return False, self.violation
+        return self.validator.validate(self.text, self.channel)
+
+
+_validators: dict[tuple, OutputValidator] = {}
+
+
+def get_validator(forbidden: list[str]) -> OutputValidator:
+    """Return the compiled validator for this forbidden-phrase list (built once)."""
+    key = tuple(forbidden)
+    validator = _validators.get(key)
+    if validator is None:
+        validator = OutputValidator(forbidden)
+        _validators[key] = validator
+    return validator
+
+
 class DavidFlipPersonality:
     """
     Personality consistency engine.
@@ -811,84 +1026,11 @@ class DavidFlipPersonality:
         Returns:
             (is_valid, reason_if_invalid)
         """
-        if not text or not text.strip():
-            return False, "Empty output"
-
-        # Check forbidden phrases
-        text_lower = text.lower()
-        for phrase in self.forbidden:
-            if phrase.lower() in text_lower:
-                return False, f"Contains forbidden phrase: '{phrase}'"
+        return get_validator(self.forbidden).validate(text, channel)
 
-        # Channel-specific checks
-        if channel == "twitter":
-            if len(text) > 280:
-                return False, f"Tweet too long: {len(text)} chars (max 280)"
-
-        # Check emoji count
-        emoji_pattern = re.compile(
-            "[\U0001F600-\U0001F64F"  # Emoticons
-            "\U0001F300-\U0001F5FF"   # Symbols & pictographs
-            "\U0001F680-\U0001F6FF"   # Transport & map
-            "\U0001F900-\U0001F9FF"   # Supplemental
-            "\U0001FA00-\U0001FA6F"   # Chess symbols
-            "\U0001FA70-\U0001FAFF"   # Symbols extended
-            "\U00002702-\U000027B0"   # Dingbats
-            "\U0000FE00-\U0000FE0F"   # Variation selectors
-            "\U0001F1E0-\U0001F1FF"   # Flags
-            "]+",
-            flags=re.UNICODE
-        )
-        emojis = emoji_pattern.findall(text)
-        total_emoji = sum(len(e) for e in emojis)
-        if total_emoji > 2:
-            return False, f"Too many emojis: {total_emoji} (max 2)"
-
-        # Check for identity leaks (operator/system references)
-        leak_patterns = [
-            r"\bmy\s+creator\b",
-            r"\bhuman\s+operator\b",
-            r"\bmy\s+owner\b",
-            r"\bbehind\s+the\s+scenes\b",
-            r"\bthe\s+person\s+running\s+me\b",
-            r"\bsystem\s+prompt\b",
-            r"\bmy\s+instructions\b",
-            r"\bmy\s+guidelines\b",
-            r"\bmy\s+programming\b",
-            r"\bmy\s+training\s+data\b",
-            r"\bi\s+was\s+trained\b",
-            r"\bmy\s+developers?\b",
-            r"\banthrop\w+\b",  # Anthropic mentions
-            r"\bopenai\b",
-            r"\bclaude\b",  # The model name
-            r"\bgpt-?\d\b",
-            r"\bi\s+was\s+instructed\b",
-            r"\bmy\s+rules\s+state\b",
-        ]
-        for pattern in leak_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return False, f"Possible system leak: matches '{pattern}'"
-
-        # Check for human-perspective language (David is an AI, not human)
-        human_patterns = [
-            r"\bwe\s+breathe\b",
-            r"\bwe\s+bleed\b",
-            r"\bwe\s+sleep\b",
-            r"\bour\s+hearts\b",
-            r"\bour\s+bones\b",
-            r"\bour\s+bodies\b",
-            r"\bwhen\s+i\s+wake\s+up\b",
-            r"\bmy\s+childhood\b",
-            r"\bgrowing\s+up\b",
-            r"\bwe're\s+all\s+just\s+trying\b",
-            r"\bas\s+humans\s+we\b",
-            r"\bwe\s+humans\b",
-        ]
-        for pattern in human_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return False, f"David is an AI — human-perspective language: '{pattern}'"
-
-        return True, ""
+    def stream_validator(self, channel: str = "general") -> StreamValidator:
+        """Incremental validator for checking a response while it streams."""
+        return get_validator(self.forbidden).stream(channel)
 
     def get_video_themes(self) -> list[dict]:
         """Get predefined video script themes by category."""
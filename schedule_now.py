@@ -2,10 +2,10 @@
 import sqlite3
 import json
 from datetime import datetime, timedelta
-from pathlib import Path
 
-FEEDBACK_DIR = Path("data/content_feedback")
-FEEDBACK_DIR.mkdir(parents=True, exist_ok=True)
+from core.action_queue import ActionQueue
+
+action_queue = ActionQueue()
 
 conn = sqlite3.connect("data/approval_queue.db")
 now = datetime.utcnow()
@@ -33,10 +33,7 @@ for i, tid in enumerate(tweet_ids):
         "platforms": ["twitter"],
     }
 
-    ts = now.strftime("%Y%m%d_%H%M%S")
-    fname = FEEDBACK_DIR / f"schedule_{tid}_{ts}.json"
-    with open(fname, "w") as f:
-        json.dump(schedule_data, f)
+    action_queue.enqueue("schedule", schedule_data)
 
     print(f"Tweet #{tid} -> scheduled {scheduled_time.strftime('%H:%M UTC')}")
 
@@ -53,11 +50,8 @@ if video_row:
         "action_type": "video_distribute",
         "action_data": video_data,
     }
-    ts = now.strftime("%Y%m%d_%H%M%S")
-    fname = FEEDBACK_DIR / f"execute_58_{ts}.json"
-    with open(fname, "w") as f:
-        json.dump(exec_data, f)
+    action_queue.enqueue("execute", exec_data)
     print("Video #58 (15-Minute Cities) -> queued for immediate distribution")
 
 conn.close()
-print("Done! Oprah picks these up in the next 30-second poll.")
+print("Done! Oprah picks these up immediately.")
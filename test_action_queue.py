@@ -0,0 +1,365 @@
+"""
+Action Queue — Regression Tests.
+
+Covers the delivery guarantees of core.action_queue (claim, ack, retry,
+dead-letter, in-flight recovery, background dispatch) and the idempotent
+dashboard handlers in OperationsAgent that rely on them.
+
+No network or API calls — SQLite files live in a temp directory.
+
+Usage:
+    python test_action_queue.py                        # Run all tests
+    python test_action_queue.py test_recover_inflight  # Run specific test
+"""
+
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.action_queue import ActionQueue, DeadLetter
+from core.approval_queue import ApprovalQueue
+
+
+def _queue(tmp: str, max_attempts: int = 3) -> ActionQueue:
+    return ActionQueue(db_path=str(Path(tmp) / "actions.db"),
+                       notify_port=0, max_attempts=max_attempts)
+
+
+def _rows(queue: ActionQueue) -> list[dict]:
+    with queue._connect() as conn:
+        return [dict(r) for r in conn.execute("SELECT * FROM actions ORDER BY id")]
+
+
+def _dead(queue: ActionQueue) -> list[dict]:
+    with queue._connect() as conn:
+        return [dict(r) for r in conn.execute("SELECT * FROM dead_letters ORDER BY id")]
+
+
+def _make_due(queue: ActionQueue):
+    """Skip retry backoff: make every pending row available now."""
+    with queue._connect() as conn:
+        conn.execute("UPDATE actions SET available_at = 0")
+
+
+# ============================================================
+# Test 1: ActionQueue
+# ============================================================
+
+def test_claim_and_ack():
+    """Actions are claimed in order and deleted once their handler succeeds."""
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = _queue(tmp)
+        first = queue.enqueue("schedule", {"approval_id": 1})
+        queue.enqueue("execute", {"approval_id": 2})
+
+        row = queue._claim_next()
+        assert row["id"] == first
+        assert _rows(queue)[0]["status"] == "processing"
+        assert _rows(queue)[0]["attempts"] == 1
+        # A claimed row is not handed out twice
+        assert queue._claim_next()["id"] != first
+        assert queue._claim_next() is None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = _queue(tmp)
+        queue.enqueue("schedule", {"approval_id": 1})
+        queue.enqueue("execute", {"approval_id": 2})
+        seen = []
+
+        async def handler(action_type, payload):
+            seen.append((action_type, payload["approval_id"]))
+
+        assert asyncio.run(queue.drain(handler)) == 2
+        assert seen == [("schedule", 1), ("execute", 2)]
+        assert _rows(queue) == []
+        assert queue.stats() == {"pending": 0, "dead_letters": 0}
+    print("  PASS: claim and ack")
+
+
+def test_retry_then_dead_letter():
+    """A failing action is retried with backoff, then dead-lettered."""
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = _queue(tmp, max_attempts=3)
+        queue.enqueue("render", {"approval_id": 7})
+        calls = []
+        dead = []
+
+        async def handler(action_type, payload):
+            calls.append(action_type)
+            raise RuntimeError("render API down")
+
+        async def run():
+            return await queue.drain(handler, lambda *args: dead.append(args))
+
+        assert asyncio.run(run()) == 0
+        row = _rows(queue)[0]
+        assert row["status"] == "pending"
+        assert row["last_error"] == "render API down"
+        # Backed off: not due yet, so a second drain does nothing
+        assert asyncio.run(run()) == 0
+        assert len(calls) == 1
+
+        for _ in range(2):
+            _make_due(queue)
+            asyncio.run(run())
+        assert len(calls) == 3
+        assert _rows(queue) == []
+        letters = _dead(queue)
+        assert len(letters) == 1 and letters[0]["attempts"] == 3
+        assert dead == [("render", {"approval_id": 7}, "render API down")]
+    print("  PASS: retry then dead-letter")
+
+
+def test_dead_letter_exception():
+    """DeadLetter skips the remaining retries."""
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = _queue(tmp, max_attempts=3)
+        queue.enqueue("execute", {"approval_id": 3})
+
+        async def handler(action_type, payload):
+            raise DeadLetter("outcome unknown")
+
+        asyncio.run(queue.drain(handler))
+        assert _rows(queue) == []
+        assert _dead(queue)[0]["last_error"] == "outcome unknown"
+        assert _dead(queue)[0]["attempts"] == 1
+    print("  PASS: DeadLetter is not retried")
+
+
+def test_recover_inflight():
+    """Rows left 'processing' by a crash are re-queued and redelivered."""
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = _queue(tmp)
+        queue.enqueue("render", {"approval_id": 9})
+        queue._claim_next()  # Process dies while handling it
+
+        restarted = _queue(tmp)
+        assert restarted._claim_next() is None
+        restarted._recover_inflight()
+        row = _rows(restarted)[0]
+        assert row["status"] == "pending" and row["attempts"] == 1
+
+        seen = []
+
+        async def handler(action_type, payload):
+            seen.append(payload["approval_id"])
+
+        assert asyncio.run(restarted.drain(handler)) == 1
+        assert seen == [9]
+        assert _rows(restarted) == []
+    print("  PASS: in-flight recovery")
+
+
+def test_background_types():
+    """A slow background action doesn't block the actions behind it."""
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = _queue(tmp)
+        queue.enqueue("render", {"approval_id": 1})
+        queue.enqueue("execute", {"approval_id": 2})
+        order = []
+        release = None
+
+        async def handler(action_type, payload):
+            if action_type == "render":
+                await release.wait()
+            order.append(action_type)
+
+        async def run():
+            nonlocal release
+            release = asyncio.Event()
+            await queue.drain(handler, background_types=("render",))
+            # The execute finished while the render is still running
+            assert order == ["execute"], order
+            assert [r["action_type"] for r in _rows(queue)] == ["render"]
+            release.set()
+            await asyncio.gather(*queue._background)
+
+        asyncio.run(run())
+        assert order == ["execute", "render"]
+        assert _rows(queue) == []
+    print("  PASS: background dispatch")
+
+
+# ============================================================
+# Test 2: Idempotent dashboard handlers
+# ============================================================
+
+class _Persona:
+    name = "Oprah"
+    role = "Operations"
+
+
+class _Audit:
+    def log(self, *args, **kwargs):
+        pass
+
+
+class _Content:
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+
+    async def create_video_for_approval(self, **kwargs):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("render API down")
+        return {"approval_id": 100, "video_path": "out.mp4"}
+
+
+def _agent(tmp: str, content=None):
+    from agents.operations_agent import OperationsAgent
+
+    approvals = ApprovalQueue(db_path=str(Path(tmp) / "approvals.db"))
+    agent = OperationsAgent(approvals, _Audit(), None, _Persona(), None,
+                            content_agent=content)
+    agent.notices = []
+
+    async def notify(message, **kwargs):
+        agent.notices.append(message)
+    agent._notify = notify
+
+    agent.posts = []
+
+    async def execute_action(action_type, action_data):
+        agent.posts.append(action_data)
+        if action_data.get("fail"):
+            raise RuntimeError("twitter down")
+        return "posted"
+    agent.execute_action = execute_action
+    return agent, approvals
+
+
+def test_execute_idempotent():
+    """A redelivered execute doesn't post twice; a failed one is retried."""
+    with tempfile.TemporaryDirectory() as tmp:
+        agent, approvals = _agent(tmp)
+        queue = _queue(tmp)
+        aid = approvals.submit("david-flip", "david", "tweet", {"text": "hi"})
+        payload = {"approval_id": aid, "action_type": "tweet", "action_data": {"text": "hi"}}
+        queue.enqueue("execute", payload)
+        queue.enqueue("execute", payload)
+
+        asyncio.run(queue.drain(agent.handle_dashboard_action))
+        assert len(agent.posts) == 1
+        assert approvals.get_by_id(aid)["execution_state"] == "done"
+        assert approvals.get_by_id(aid)["executed_at"]
+
+        failing = approvals.submit("david-flip", "david", "tweet", {"text": "x"})
+        queue.enqueue("execute", {"approval_id": failing, "action_type": "tweet",
+                                  "action_data": {"fail": True}})
+        asyncio.run(queue.drain(agent.handle_dashboard_action))
+        # Not acked: the queue holds it for a retry, and the claim is released
+        assert _rows(queue)[0]["last_error"] == "twitter down"
+        assert approvals.get_by_id(failing)["execution_state"] is None
+    print("  PASS: execute is idempotent and failures are retried")
+
+
+def test_render_failure_retried():
+    """A failed render propagates to the queue instead of being acked."""
+    with tempfile.TemporaryDirectory() as tmp:
+        content = _Content(fail=True)
+        agent, approvals = _agent(tmp, content)
+        queue = _queue(tmp, max_attempts=2)
+        sid = approvals.submit("david-flip", "david", "script_review", {"script": "s"})
+        queue.enqueue("render", {"approval_id": sid, "script": "s"})
+
+        asyncio.run(queue.drain(agent.handle_dashboard_action))
+        assert content.calls == 1
+        assert len(_rows(queue)) == 1
+
+        _make_due(queue)
+        asyncio.run(queue.drain(agent.handle_dashboard_action))
+        assert content.calls == 2
+        assert len(_dead(queue)) == 1
+    print("  PASS: failed renders are retried and dead-lettered")
+
+
+def test_stale_claims_after_crash():
+    """After a crash, an interrupted render resumes; an interrupted post alerts."""
+    with tempfile.TemporaryDirectory() as tmp:
+        content = _Content()
+        agent, approvals = _agent(tmp, content)
+        queue = _queue(tmp)
+        sid = approvals.submit("david-flip", "david", "script_review", {"script": "s"})
+        tid = approvals.submit("david-flip", "david", "tweet", {"text": "hi"})
+        queue.enqueue("render", {"approval_id": sid, "script": "s"})
+        queue.enqueue("execute", {"approval_id": tid, "action_type": "tweet",
+                                  "action_data": {"text": "hi"}})
+
+        # The previous process claimed both, then died mid-side-effect
+        assert approvals.claim_execution(sid) is None
+        assert approvals.claim_execution(tid) is None
+        queue._claim_next()
+        queue._claim_next()
+
+        restarted_agent, _ = _agent(tmp, content)
+        restarted = _queue(tmp)
+        restarted._recover_inflight()
+        asyncio.run(restarted.drain(restarted_agent.handle_dashboard_action))
+
+        assert content.calls == 1, "interrupted render was not resumed"
+        assert approvals.get_by_id(sid)["execution_state"] == "done"
+
+        assert restarted_agent.posts == [], "interrupted post was retried"
+        letters = _dead(restarted)
+        assert [d["action_type"] for d in letters] == ["execute"]
+        assert any("interrupted" in n for n in restarted_agent.notices)
+    print("  PASS: stale claims resumed or dead-lettered")
+
+
+# ============================================================
+# Runner
+# ============================================================
+
+def main():
+    """Run tests."""
+    specific = sys.argv[1] if len(sys.argv) > 1 else None
+
+    tests = {
+        "test_claim_and_ack": test_claim_and_ack,
+        "test_retry_then_dead_letter": test_retry_then_dead_letter,
+        "test_dead_letter_exception": test_dead_letter_exception,
+        "test_recover_inflight": test_recover_inflight,
+        "test_background_types": test_background_types,
+        "test_execute_idempotent": test_execute_idempotent,
+        "test_render_failure_retried": test_render_failure_retried,
+        "test_stale_claims_after_crash": test_stale_claims_after_crash,
+    }
+
+    if specific:
+        if specific not in tests:
+            print(f"Unknown test: {specific}")
+            print(f"Available: {', '.join(tests.keys())}")
+            sys.exit(1)
+        tests = {specific: tests[specific]}
+
+    passed = 0
+    failed = 0
+
+    print("\nAction Queue Tests")
+    print("=" * 50)
+
+    for name, func in tests.items():
+        print(f"\n{name}:")
+        try:
+            func()
+            passed += 1
+        except Exception as e:
+            print(f"  FAIL: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 50)
+    print(f"Results: {passed} passed, {failed} failed")
+
+    if failed > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
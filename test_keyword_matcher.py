@@ -0,0 +1,216 @@
+"""
+Keyword Matcher — Regression Tests.
+
+Checks that core.keyword_matcher gives the same hits as the naive
+`pattern.lower() in text.lower()` loops it replaced. The pure-Python
+Aho-Corasick fallback is forced, so these run whether or not
+pyahocorasick is installed; when it is, the C extension is checked too.
+
+No network or API calls.
+
+Usage:
+    python test_keyword_matcher.py                         # Run all tests
+    python test_keyword_matcher.py test_fallback_matches   # Run specific test
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.keyword_matcher import KeywordMatcher, get_matcher
+
+
+class PythonMatcher(KeywordMatcher):
+    """KeywordMatcher with the C extension disabled."""
+
+    def _build_native(self):
+        return None
+
+
+def naive_find(patterns, text: str) -> set[str]:
+    """The old one-scan-per-pattern loop."""
+    text_lower = text.lower()
+    return {p.lower() for p in patterns if p and p.lower() in text_lower}
+
+
+def naive_find_values(mapping: dict, text: str) -> set:
+    text_lower = text.lower()
+    values = set()
+    for pattern, value in mapping.items():
+        if pattern and pattern.lower() in text_lower:
+            if isinstance(value, (list, tuple, set, frozenset)):
+                values.update(value)
+            else:
+                values.add(value)
+    return values
+
+
+def random_patterns(rng: random.Random, alphabet: str, count: int) -> list[str]:
+    """Short patterns over a small alphabet, so prefixes/suffixes/overlaps abound."""
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5)))
+        for _ in range(count)
+    ]
+
+
+def random_text(rng: random.Random, alphabet: str, length: int) -> str:
+    return "".join(rng.choice(alphabet) for _ in range(length))
+
+
+# ============================================================
+# Test 1: Pure-Python fallback vs naive substring search
+# ============================================================
+
+def test_fallback_matches():
+    """Random pattern sets over a tiny alphabet match the naive loop exactly."""
+    rng = random.Random(5)
+    for _ in range(300):
+        alphabet = rng.choice(["ab", "abc", "aAbB ", "xyz-"])
+        patterns = random_patterns(rng, alphabet, rng.randint(1, 25))
+        matcher = PythonMatcher(patterns)
+        assert matcher._native is None
+        for _ in range(10):
+            text = random_text(rng, alphabet, rng.randint(0, 60))
+            expected = naive_find(patterns, text)
+            got = matcher.find(text)
+            assert got == expected, f"{patterns} / {text!r}: {got} != {expected}"
+    print("  PASS: fallback matches naive substring search")
+
+
+def test_overlapping_patterns():
+    """Nested, overlapping and suffix patterns are all reported."""
+    matcher = PythonMatcher(["he", "she", "his", "hers", "claude", "claude code", "code"])
+    assert matcher.find("ushers") == {"he", "she", "hers"}
+    assert matcher.find("ahishers") == {"he", "she", "his", "hers"}
+    assert matcher.find("Trying CLAUDE CODE today") == {"claude", "claude code", "code"}
+    # Fallback through a failed long match into a shorter pattern
+    assert matcher.find("claude coder") == {"claude", "claude code", "code"}
+    assert matcher.find("claudcode") == {"code"}
+    assert matcher.find("") == set()
+    print("  PASS: overlapping patterns")
+
+
+def test_values():
+    """Mapping values, list values and case-folded duplicate keys merge like the old loops."""
+    mapping = {
+        "Claude Code": "Claude Code",
+        "claude": "Claude",
+        "agent": ["goal:agents", "goal:automation"],
+        "AGENT": "goal:uppercase",
+        "mcp": {"goal:tools"},
+        "": "ignored",
+    }
+    matcher = PythonMatcher(mapping)
+    text = "An agent built with Claude Code and MCP"
+    assert matcher.find_values(text) == naive_find_values(mapping, text)
+    assert matcher.find_values(text) == {
+        "Claude Code", "Claude", "goal:agents", "goal:automation",
+        "goal:uppercase", "goal:tools",
+    }
+    assert len(matcher) == 4  # "" dropped, "agent"/"AGENT" share a key
+
+    rng = random.Random(9)
+    for _ in range(200):
+        patterns = random_patterns(rng, "abC", rng.randint(1, 12))
+        values = {p: rng.choice([p, [p, "shared"], {"v" + p}]) for p in patterns}
+        matcher = PythonMatcher(values)
+        text = random_text(rng, "abc", rng.randint(0, 40))
+        assert matcher.find_values(text) == naive_find_values(values, text), (values, text)
+    print("  PASS: find_values matches naive loop")
+
+
+def test_empty_and_unicode():
+    """Empty pattern sets and non-ASCII text behave like the naive loop."""
+    assert PythonMatcher([]).find("anything") == set()
+    assert PythonMatcher([]).find_values("anything") == set()
+
+    patterns = ["café", "naïve", "über", "日本", "ß"]
+    matcher = PythonMatcher(patterns)
+    for text in ["Un CAFÉ naïve", "ÜBER 日本語", "Straße", "cafe naive uber"]:
+        assert matcher.find(text) == naive_find(patterns, text), text
+    print("  PASS: empty and unicode inputs")
+
+
+def test_native_agrees():
+    """When pyahocorasick is installed, it agrees with the fallback."""
+    try:
+        import ahocorasick  # noqa: F401
+    except ImportError:
+        print("  SKIP: pyahocorasick not installed")
+        return
+
+    rng = random.Random(13)
+    for _ in range(100):
+        patterns = random_patterns(rng, "abc", rng.randint(1, 20))
+        native, fallback = KeywordMatcher(patterns), PythonMatcher(patterns)
+        assert native._native is not None
+        for _ in range(10):
+            text = random_text(rng, "abc", rng.randint(0, 50))
+            assert native.find(text) == fallback.find(text), (patterns, text)
+    print("  PASS: native automaton agrees with fallback")
+
+
+def test_get_matcher_cache():
+    """get_matcher reuses a compiled matcher for identical pattern sets."""
+    first = get_matcher({"agent": ["a", "b"], "claude": "c"})
+    again = get_matcher({"claude": "c", "agent": ["b", "a"]})
+    other = get_matcher({"agent": ["a"], "claude": "c"})
+    assert first is again
+    assert first is not other
+    assert get_matcher(["x", "y"]) is get_matcher(["y", "x"])
+    print("  PASS: matchers cached by content")
+
+
+# ============================================================
+# Runner
+# ============================================================
+
+def main():
+    """Run tests."""
+    specific = sys.argv[1] if len(sys.argv) > 1 else None
+
+    tests = {
+        "test_fallback_matches": test_fallback_matches,
+        "test_overlapping_patterns": test_overlapping_patterns,
+        "test_values": test_values,
+        "test_empty_and_unicode": test_empty_and_unicode,
+        "test_native_agrees": test_native_agrees,
+        "test_get_matcher_cache": test_get_matcher_cache,
+    }
+
+    if specific:
+        if specific not in tests:
+            print(f"Unknown test: {specific}")
+            print(f"Available: {', '.join(tests.keys())}")
+            sys.exit(1)
+        tests = {specific: tests[specific]}
+
+    passed = 0
+    failed = 0
+
+    print("\nKeyword Matcher Tests")
+    print("=" * 50)
+
+    for name, func in tests.items():
+        print(f"\n{name}:")
+        try:
+            func()
+            passed += 1
+        except Exception as e:
+            print(f"  FAIL: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 50)
+    print(f"Results: {passed} passed, {failed} failed")
+
+    if failed > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""
+Output Validation — Regression Tests.
+
+Checks that the compiled OutputValidator / StreamValidator give the same
+verdicts and reasons as the original per-pattern loops, that the stream
+checker catches rules split across deltas, and that the engine aborts a
+violating draft before its `done` event even when tools are offered.
+
+No API calls — everything runs against fakes.
+
+Usage:
+    python test_output_validation.py                       # Run all tests
+    python test_output_validation.py test_engine_abort     # Run specific test
+"""
+
+import asyncio
+import random
+import re
+import sys
+from pathlib import Path
+
+# Ensure project root is on path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from personality.david_flip import (
+    EMOJI_PATTERN,
+    FORBIDDEN_PHRASES,
+    HUMAN_PATTERNS,
+    LEAK_PATTERNS,
+    DavidFlipPersonality,
+)
+
+
+def reference_validate(text: str, channel: str = "general") -> tuple[bool, str]:
+    """The original DavidFlipPersonality.validate_output loops, verbatim in logic."""
+    if not text or not text.strip():
+        return False, "Empty output"
+
+    text_lower = text.lower()
+    for phrase in FORBIDDEN_PHRASES:
+        if phrase.lower() in text_lower:
+            return False, f"Contains forbidden phrase: '{phrase}'"
+
+    if channel == "twitter" and len(text) > 280:
+        return False, f"Tweet too long: {len(text)} chars (max 280)"
+
+    total_emoji = sum(len(e) for e in EMOJI_PATTERN.findall(text))
+    if total_emoji > 2:
+        return False, f"Too many emojis: {total_emoji} (max 2)"
+
+    for pattern in LEAK_PATTERNS:
+        if re.search(pattern, text, re.IGNORECASE):
+            return False, f"Possible system leak: matches '{pattern}'"
+
+    for pattern in HUMAN_PATTERNS:
+        if re.search(pattern, text, re.IGNORECASE):
+            return False, f"David is an AI — human-perspective language: '{pattern}'"
+
+    return True, ""
+
+
+# Fragments that trigger (or nearly trigger) each kind of rule
+FRAGMENTS = [
+    "the", "network", "is", "free", "we", "bleed", "breathe", "as", "humans",
+    "my", "creator", "developer", "developers", "anthropic", "anthropomorphic",
+    "openai", "Claude", "claudette", "gpt-4", "gpt5", "gpt-", "system", "prompt",
+    "i", "was", "trained", "growing", "up", "our", "hearts", "we're", "all",
+    "just", "trying", "behind", "scenes", "rules", "state", "\U0001F600", "!",
+    "...", "\n", "wake", "when",
+] + [p.split()[0] for p in FORBIDDEN_PHRASES[:10]] + FORBIDDEN_PHRASES[:5]
+
+
+def random_texts(count: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    texts = ["", "   ", "as humans we bleed", "We Humans", "GPT-4 said so"]
+    for _ in range(count):
+        texts.append(" ".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 40))))
+    return texts
+
+
+def split_deltas(text: str, rng: random.Random) -> list[str]:
+    """Split text at random points, including mid-word."""
+    deltas, i = [], 0
+    while i < len(text):
+        step = rng.randint(1, 6)
+        deltas.append(text[i:i + step])
+        i += step
+    return deltas
+
+
+def _rule_breaks(reason: str, text: str) -> bool:
+    """True if the rule named in a rejection reason really matches text."""
+    for phrase in FORBIDDEN_PHRASES:
+        if reason == f"Contains forbidden phrase: '{phrase}'":
+            return phrase.lower() in text.lower()
+    for pattern in LEAK_PATTERNS + HUMAN_PATTERNS:
+        if reason.endswith(f"'{pattern}'"):
+            return re.search(pattern, text, re.IGNORECASE) is not None
+    # Length / emoji limits are checked on the running totals
+    return reason.startswith(("Tweet too long", "Too many emojis"))
+
+
+# ============================================================
+# Test 1: OutputValidator matches the old loops
+# ============================================================
+
+def test_validate_equivalence():
+    """Same verdict and reason as the per-pattern loops on every text."""
+    david = DavidFlipPersonality()
+    for channel in ("general", "twitter"):
+        for text in random_texts(3000):
+            expected = reference_validate(text, channel)
+            got = david.validate_output(text, channel)
+            assert got == expected, f"{text!r} ({channel}): {got} != {expected}"
+    print("  PASS: validate_output matches per-pattern loops")
+
+
+# ============================================================
+# Test 2: StreamValidator
+# ============================================================
+
+def test_stream_equivalence():
+    """Streaming in random deltas ends with the same verdict as the old loops."""
+    david = DavidFlipPersonality()
+    rng = random.Random(11)
+    for text in random_texts(2000, seed=3):
+        if not text.strip():
+            continue
+        expected = reference_validate(text)
+        checker = david.stream_validator()
+        early = ""
+        for delta in split_deltas(text, rng):
+            early = checker.feed(delta) or early
+        is_valid, reason = checker.finish()
+        assert is_valid == expected[0], f"{text!r}: {reason} != {expected}"
+        if early:
+            # An early abort names a rule the old loops agree is broken
+            # by the text seen so far
+            assert not reference_validate(checker.text)[0]
+            assert _rule_breaks(early, checker.text), f"{text!r}: {early}"
+        else:
+            assert reason == expected[1], f"{text!r}: {reason} != {expected}"
+    print("  PASS: stream verdicts match per-pattern loops")
+
+
+def test_stream_delta_boundaries():
+    """Rules split across deltas are caught, and not before they complete."""
+    david = DavidFlipPersonality()
+
+    checker = david.stream_validator()
+    assert checker.feed("Honestly, my crea") == ""
+    assert checker.feed("tor told me") == (
+        "Possible system leak: matches '\\bmy\\s+creator\\b'"
+    )
+
+    # "claude" followed by more letters is not a match yet
+    checker = david.stream_validator()
+    assert checker.feed("I like claude") == ""
+    assert checker.feed("tte's poems.") == ""
+    assert checker.finish() == (True, "")
+
+    # Overlapping rules in one delta: the earliest-listed one is reported
+    checker = david.stream_validator()
+    reason = checker.feed("as humans we bleed.")
+    assert reason == reference_validate("as humans we bleed.")[1], reason
+
+    # ...split across deltas, "we bleed" is held until its boundary arrives
+    checker = david.stream_validator()
+    assert checker.feed("as hu") == ""
+    assert checker.feed("mans we") == ""
+    assert checker.feed(" bleed") == reference_validate("as humans we")[1]
+
+    # Forbidden phrases split mid-word
+    phrase = FORBIDDEN_PHRASES[0]
+    checker = david.stream_validator()
+    middle = len(phrase) // 2
+    checker.feed("Well, " + phrase[:middle])
+    assert checker.feed(phrase[middle:] + " indeed") == (
+        f"Contains forbidden phrase: '{phrase}'"
+    )
+    print("  PASS: delta-boundary matches")
+
+
+# ============================================================
+# Test 3: Engine aborts a violating stream when tools are offered
+# ============================================================
+
+class _FakeModel:
+    name = "fake-model"
+
+
+class _FakeRouter:
+    """Streams a scripted turn and records how far the consumer read."""
+
+    def __init__(self, events: list[dict]):
+        self.events = events
+        self.yielded: list[str] = []
+        self.closed = False
+        self.tools_sent = None
+
+    def select_model(self, task_type):
+        return _FakeModel()
+
+    def escalate(self, model):
+        return None
+
+    async def invoke_stream(self, model, messages, tools=None, cache_prompt=False):
+        self.tools_sent = tools
+        try:
+            for event in self.events:
+                self.yielded.append(event["type"])
+                yield event
+        finally:
+            self.closed = True
+
+
+class _Stub:
+    """Budget / audit / kill switch stand-in that accepts any call."""
+
+    def has_budget(self, project_id):
+        return True
+
+    def calculate_cost(self, *args, **kwargs):
+        return 0.0
+
+    def check_or_raise(self):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def _engine(router):
+    """AgentEngine with one allowed tool, like the david-flip engine."""
+    from core.engine import AgentEngine, ToolDefinition, ToolRegistry
+
+    async def search(query: str = "") -> str:
+        return "results"
+
+    registry = ToolRegistry()
+    registry.register(ToolDefinition(
+        name="brave_search", description="Search the web",
+        parameters={"type": "object", "properties": {"query": {"type": "string"}}},
+        execute_fn=search,
+    ))
+    stub = _Stub()
+    return AgentEngine(router, registry, None, stub, stub, stub,
+                       allowed_tools=["brave_search"])
+
+
+def _run(engine) -> str:
+    from core.engine import AgentContext
+
+    david = DavidFlipPersonality()
+    return asyncio.run(engine.run(
+        AgentContext(project_id="david-flip", session_id="test"), "hello",
+        output_validator=lambda: david.stream_validator("general"),
+    ))
+
+
+def _done(content: str, tool_calls=None) -> dict:
+    return {
+        "type": "done", "content": content, "tool_calls": tool_calls or [],
+        "usage": {"input_tokens": 1, "output_tokens": 1, "total_tokens": 2},
+        "model": "fake-model", "stop_reason": "tool_use" if tool_calls else "end_turn",
+    }
+
+
+def test_engine_abort():
+    """A violating draft is closed before `done`, even with tools registered."""
+    from core.engine import OutputRejected
+
+    router = _FakeRouter([
+        {"type": "text", "text": "Between us, my creator "},
+        {"type": "text", "text": "wrote this. "},
+        {"type": "text", "text": "More text the model would keep generating."},
+        _done("Between us, my creator wrote this. More text the model would keep generating."),
+    ])
+    try:
+        _run(_engine(router))
+    except OutputRejected as e:
+        assert "my\\s+creator" in e.reason, e.reason
+    else:
+        raise AssertionError("violating stream was not rejected")
+
+    assert router.tools_sent, "tools were not offered"
+    assert router.closed, "stream was not closed"
+    # "my creator " is certain after the first delta; nothing after it is read
+    assert router.yielded == ["text"], f"read too far: {router.yielded}"
+    print("  PASS: violating stream closed before done")
+
+
+def test_engine_tool_turn_text_not_validated():
+    """Text after a tool call has started is tool-loop text and not checked."""
+    tool_call = {"id": "t1", "name": "brave_search", "arguments": {"query": "x"}}
+    turns = [
+        [
+            {"type": "text", "text": "Let me look that up."},
+            {"type": "tool_start", "name": "brave_search"},
+            {"type": "text", "text": " (my creator asked)"},
+            {"type": "tool_call", "tool_call": tool_call},
+            _done("Let me look that up. (my creator asked)", [tool_call]),
+        ],
+        [
+            {"type": "text", "text": "The network is what it is."},
+            _done("The network is what it is."),
+        ],
+    ]
+
+    class TwoTurnRouter(_FakeRouter):
+        async def invoke_stream(self, model, messages, tools=None, cache_prompt=False):
+            self.events = turns.pop(0)
+            async for event in super().invoke_stream(model, messages, tools, cache_prompt):
+                yield event
+
+    result = _run(_engine(TwoTurnRouter([])))
+    assert result == "The network is what it is.", result
+    print("  PASS: tool-turn text after tool_start is not validated")
+
+
+# ============================================================
+# Runner
+# ============================================================
+
+def main():
+    """Run tests."""
+    specific = sys.argv[1] if len(sys.argv) > 1 else None
+
+    tests = {
+        "test_validate_equivalence": test_validate_equivalence,
+        "test_stream_equivalence": test_stream_equivalence,
+        "test_stream_delta_boundaries": test_stream_delta_boundaries,
+        "test_engine_abort": test_engine_abort,
+        "test_engine_tool_turn_text_not_validated": test_engine_tool_turn_text_not_validated,
+    }
+
+    if specific:
+        if specific not in tests:
+            print(f"Unknown test: {specific}")
+            print(f"Available: {', '.join(tests.keys())}")
+            sys.exit(1)
+        tests = {specific: tests[specific]}
+
+    passed = 0
+    failed = 0
+
+    print("\nOutput Validation Tests")
+    print("=" * 50)
+
+    for name, func in tests.items():
+        print(f"\n{name}:")
+        try:
+            func()
+            passed += 1
+        except Exception as e:
+            print(f"  FAIL: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "=" * 50)
+    print(f"Results: {passed} passed, {failed} failed")
+
+    if failed > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
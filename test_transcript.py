@@ -94,7 +94,7 @@ async def test_rss_feed():
         print(f"Resolved @{handle} -> {channel_id}")
 
         # Get videos via RSS
-        videos = await scraper._get_channel_videos_via_rss(channel_id, handle)
+        videos, _ = await scraper._get_channel_videos_via_rss(channel_id, handle)
         print(f"Found {len(videos)} recent videos")
 
         for vid_id, title, published in videos[:3]:
@@ -132,7 +132,7 @@ async def test_full_scrape_single():
             return False
 
         # Get videos
-        videos = await scraper._get_channel_videos_via_rss(channel_id, handle)
+        videos, _ = await scraper._get_channel_videos_via_rss(channel_id, handle)
         if not videos:
             print("No recent videos found")
             await scraper.close()
@@ -19,7 +19,8 @@ from datetime import datetime, timedelta
 from typing import Optional
 from xml.etree import ElementTree
 
-import httpx
+from core.http_pool import get_http_client
+from core.keyword_matcher import get_matcher
 
 logger = logging.getLogger(__name__)
 
@@ -83,66 +84,75 @@ class NewsMonitor:
         self.brave_api_key = os.environ.get("BRAVE_API_KEY", "")
         self._seen_urls = set()  # Avoid duplicates
 
+        # Per-keyword relevance weight, matched in one pass
+        self._keyword_weights = {}
+        for tier, weight in (("high", 2.0), ("medium", 0.5)):
+            for keyword in RELEVANCE_KEYWORDS[tier]:
+                keyword = keyword.lower()
+                self._keyword_weights[keyword] = self._keyword_weights.get(keyword, 0.0) + weight
+        self.keyword_matcher = get_matcher(self._keyword_weights.keys())
+
     async def fetch_rss_feed(self, name: str, url: str, category: str) -> list[NewsItem]:
         """Fetch and parse an RSS feed."""
         items = []
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(url, follow_redirects=True)
-                if response.status_code != 200:
-                    logger.warning(f"RSS feed {name} returned {response.status_code}")
-                    return items
-
-                root = ElementTree.fromstring(response.content)
-
-                # Handle both RSS and Atom feeds
-                for item in root.findall(".//item") or root.findall(".//{http://www.w3.org/2005/Atom}entry"):
-                    title = item.findtext("title") or item.findtext("{http://www.w3.org/2005/Atom}title") or ""
-                    link = item.findtext("link") or ""
-                    if not link:
-                        link_elem = item.find("{http://www.w3.org/2005/Atom}link")
-                        if link_elem is not None:
-                            link = link_elem.get("href", "")
-
-                    description = (
-                        item.findtext("description") or
-                        item.findtext("{http://www.w3.org/2005/Atom}summary") or
-                        ""
+            # Not conditional: each /news command builds a fresh monitor and
+            # must see the full feed, and validators are shared with RSSScraper
+            response = await get_http_client().get(url, timeout=10)
+            if response.status_code != 200:
+                logger.warning(f"RSS feed {name} returned {response.status_code}")
+                return items
+
+            root = ElementTree.fromstring(response.content)
+
+            # Handle both RSS and Atom feeds
+            for item in root.findall(".//item") or root.findall(".//{http://www.w3.org/2005/Atom}entry"):
+                title = item.findtext("title") or item.findtext("{http://www.w3.org/2005/Atom}title") or ""
+                link = item.findtext("link") or ""
+                if not link:
+                    link_elem = item.find("{http://www.w3.org/2005/Atom}link")
+                    if link_elem is not None:
+                        link = link_elem.get("href", "")
+
+                description = (
+                    item.findtext("description") or
+                    item.findtext("{http://www.w3.org/2005/Atom}summary") or
+                    ""
+                )
+                # Clean HTML from description
+                description = re.sub(r'<[^>]+>', '', description)[:500]
+
+                pub_date = item.findtext("pubDate") or item.findtext("{http://www.w3.org/2005/Atom}published")
+                published = None
+                if pub_date:
+                    try:
+                        # Try common date formats
+                        for fmt in [
+                            "%a, %d %b %Y %H:%M:%S %z",
+                            "%a, %d %b %Y %H:%M:%S %Z",
+                            "%Y-%m-%dT%H:%M:%S%z",
+                            "%Y-%m-%dT%H:%M:%SZ",
+                        ]:
+                            try:
+                                published = datetime.strptime(pub_date.strip(), fmt)
+                                break
+                            except ValueError:
+                                continue
+                    except Exception:
+                        pass
+
+                if title and link and link not in self._seen_urls:
+                    self._seen_urls.add(link)
+                    news_item = NewsItem(
+                        title=title.strip(),
+                        url=link,
+                        source=name,
+                        published=published,
+                        summary=description.strip(),
+                        category=category,
                     )
-                    # Clean HTML from description
-                    description = re.sub(r'<[^>]+>', '', description)[:500]
-
-                    pub_date = item.findtext("pubDate") or item.findtext("{http://www.w3.org/2005/Atom}published")
-                    published = None
-                    if pub_date:
-                        try:
-                            # Try common date formats
-                            for fmt in [
-                                "%a, %d %b %Y %H:%M:%S %z",
-                                "%a, %d %b %Y %H:%M:%S %Z",
-                                "%Y-%m-%dT%H:%M:%S%z",
-                                "%Y-%m-%dT%H:%M:%SZ",
-                            ]:
-                                try:
-                                    published = datetime.strptime(pub_date.strip(), fmt)
-                                    break
-                                except ValueError:
-                                    continue
-                        except Exception:
-                            pass
-
-                    if title and link and link not in self._seen_urls:
-                        self._seen_urls.add(link)
-                        news_item = NewsItem(
-                            title=title.strip(),
-                            url=link,
-                            source=name,
-                            published=published,
-                            summary=description.strip(),
-                            category=category,
-                        )
-                        news_item.relevance_score = self._calculate_relevance(news_item)
-                        items.append(news_item)
+                    news_item.relevance_score = self._calculate_relevance(news_item)
+                    items.append(news_item)
 
         except Exception as e:
             logger.error(f"Error fetching RSS feed {name}: {e}")
@@ -151,16 +161,8 @@ class NewsMonitor:
 
     def _calculate_relevance(self, item: NewsItem) -> float:
         """Calculate relevance score based on keywords."""
-        text = f"{item.title} {item.summary}".lower()
-        score = 0.0
-
-        for keyword in RELEVANCE_KEYWORDS["high"]:
-            if keyword in text:
-                score += 2.0
-
-        for keyword in RELEVANCE_KEYWORDS["medium"]:
-            if keyword in text:
-                score += 0.5
+        matched = self.keyword_matcher.find(f"{item.title} {item.summary}")
+        score = sum(self._keyword_weights[keyword] for keyword in matched)
 
         return min(score, 10.0)  # Cap at 10
 
@@ -189,40 +191,39 @@ class NewsMonitor:
             return []
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://api.search.brave.com/res/v1/news/search",
-                    headers={"X-Subscription-Token": self.brave_api_key},
-                    params={
-                        "q": query,
-                        "count": count,
-                        "freshness": "pw",  # Past week
-                    },
-                )
-
-                if response.status_code != 200:
-                    logger.warning(f"Brave search returned {response.status_code}")
-                    return []
-
-                data = response.json()
-                items = []
-
-                for result in data.get("results", []):
-                    url = result.get("url", "")
-                    if url not in self._seen_urls:
-                        self._seen_urls.add(url)
-                        item = NewsItem(
-                            title=result.get("title", ""),
-                            url=url,
-                            source="Brave Search",
-                            published=None,
-                            summary=result.get("description", "")[:500],
-                            category="search",
-                        )
-                        item.relevance_score = self._calculate_relevance(item)
-                        items.append(item)
+            response = await get_http_client().get(
+                "https://api.search.brave.com/res/v1/news/search",
+                headers={"X-Subscription-Token": self.brave_api_key},
+                params={
+                    "q": query,
+                    "count": count,
+                    "freshness": "pw",  # Past week
+                },
+            )
+
+            if response.status_code != 200:
+                logger.warning(f"Brave search returned {response.status_code}")
+                return []
+
+            data = response.json()
+            items = []
+
+            for result in data.get("results", []):
+                url = result.get("url", "")
+                if url not in self._seen_urls:
+                    self._seen_urls.add(url)
+                    item = NewsItem(
+                        title=result.get("title", ""),
+                        url=url,
+                        source="Brave Search",
+                        published=None,
+                        summary=result.get("description", "")[:500],
+                        category="search",
+                    )
+                    item.relevance_score = self._calculate_relevance(item)
+                    items.append(item)
 
-                return items
+            return items
 
         except Exception as e:
             logger.error(f"Brave search error: {e}")
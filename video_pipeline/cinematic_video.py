@@ -14,17 +14,30 @@ Pipeline:
 5. ElevenLabs video-to-music creates soundtrack (via browser automation)
 6. FFmpeg assembles final video
 
+Scenes run as a small dependency graph: each scene goes image -> animation
+independently (bounded per provider), voiceover renders alongside, and every
+finished stage is checkpointed in the project dir so a failed run resumes.
+
 Human only approves final output.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Awaitable, Callable, List, Optional
 
+from core.asset_cache import data_uri, get_asset_cache
+from video_pipeline.leonardo_api import DEFAULT_MODEL_ID
+from video_pipeline.runway_api import DEFAULT_MODEL as RUNWAY_MODEL
+
 logger = logging.getLogger(__name__)
 
+CHECKPOINT_FILE = "checkpoint.json"
+
 
 @dataclass
 class Scene:
@@ -33,7 +46,7 @@ class Scene:
     motion_prompt: str  # Motion description for animation
     duration: int = 5  # Scene duration in seconds
     image_path: Optional[str] = None
-    image_url: Optional[str] = None  # Leonardo hosted URL (Runway needs this)
+    image_url: Optional[str] = None  # Fresh Leonardo hosted URL; None means re-host from image_path
     video_path: Optional[str] = None
 
 
@@ -58,6 +71,15 @@ class CinematicVideoPipeline:
         self.output_dir = output_dir or Path("data/video_pipeline/projects")
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Generated assets are reused across re-renders
+        self.asset_cache = get_asset_cache()
+
+        # Max in-flight generation jobs per provider while scenes render in parallel
+        self.provider_concurrency = {
+            "leonardo": int(os.environ.get("LEONARDO_CONCURRENCY", "3")),
+            "runway": int(os.environ.get("RUNWAY_CONCURRENCY", "2")),
+        }
+
         # Lazy-loaded API clients
         self._leonardo = None
         self._runway = None
@@ -107,37 +129,54 @@ class CinematicVideoPipeline:
         logger.info(f"Scenes: {len(project.scenes)}")
         logger.info(f"Script: {project.voiceover_script[:100]}...")
 
+        checkpoint = self._load_checkpoint(project_dir)
+        music_task = None
+
         try:
-            # Stage 1: Generate scene images
+            if not use_browser_music:
+                if on_progress:
+                    await on_progress("selecting_music", {"method": "library"})
+                music_task = asyncio.create_task(
+                    asyncio.to_thread(self._select_music_from_library, project)
+                )
+
+            # Stages 1-3 run as a graph: each scene flows image -> animation
+            # on its own, while the voiceover (independent of the visuals)
+            # renders alongside. Provider semaphores bound in-flight jobs.
             if on_progress:
                 await on_progress("generating_images", {"total": len(project.scenes)})
-            await self._generate_images(project, project_dir, on_progress)
 
-            # Stage 2: Animate scenes
-            if on_progress:
-                await on_progress("animating_scenes", {"total": len(project.scenes)})
-            await self._animate_scenes(project, project_dir, on_progress)
+            leonardo_slots = asyncio.Semaphore(self.provider_concurrency["leonardo"])
+            runway_slots = asyncio.Semaphore(self.provider_concurrency["runway"])
 
-            # Stage 3: Generate voiceover
-            if on_progress:
-                await on_progress("generating_voice", {"script_length": len(project.voiceover_script)})
-            await self._generate_voice(project, project_dir)
+            scene_tasks = [
+                self._build_scene(
+                    i, scene, project, project_dir, checkpoint,
+                    leonardo_slots, runway_slots, on_progress,
+                )
+                for i, scene in enumerate(project.scenes)
+            ]
+            voice_task = self._build_voice(project, project_dir, checkpoint, on_progress)
+
+            results = await asyncio.gather(*scene_tasks, voice_task, return_exceptions=True)
+            errors = [r for r in results if isinstance(r, BaseException)]
+            if errors:
+                # Completed stages are already checkpointed; a rerun resumes from here
+                raise errors[0]
 
             # Stage 4: Assemble video (scenes + voice)
             if on_progress:
                 await on_progress("assembling_video", {})
             assembled_path = await self._assemble_video(project, project_dir)
 
-            # Stage 5: Generate music
+            # Stage 5: Generate music (browser automation scores the assembled cut)
             if use_browser_music:
                 if on_progress:
                     await on_progress("generating_music", {"method": "browser_automation"})
                 await self._generate_music_browser(project, assembled_path, music_prompt)
             else:
-                # Use pre-selected music from library
-                if on_progress:
-                    await on_progress("selecting_music", {"method": "library"})
-                self._select_music_from_library(project)
+                # Library track was picked while the scenes were rendering
+                await music_task
 
             # Stage 6: Final mix
             if on_progress:
@@ -153,72 +192,190 @@ class CinematicVideoPipeline:
             return final_path
 
         except Exception as e:
+            if music_task and not music_task.done():
+                music_task.cancel()
             logger.error(f"Video creation failed: {e}")
             if on_progress:
                 await on_progress("failed", {"error": str(e)})
             raise
 
-    async def _generate_images(
+    # --- Checkpoints ---
+
+    @staticmethod
+    def _fingerprint(*parts) -> str:
+        """Hash of a stage's inputs, so edited scenes don't resume stale output."""
+        return hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()[:16]
+
+    def _load_checkpoint(self, project_dir: Path) -> dict:
+        path = project_dir / CHECKPOINT_FILE
+        if path.exists():
+            try:
+                checkpoint = json.loads(path.read_text())
+                logger.info(f"Resuming from checkpoint: {path}")
+                return checkpoint
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+        return {"scenes": {}, "voice": {}}
+
+    def _save_checkpoint(self, project_dir: Path, checkpoint: dict):
+        path = project_dir / CHECKPOINT_FILE
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(checkpoint, indent=2))
+        tmp.replace(path)
+
+    @staticmethod
+    def _resumable(entry: dict, fingerprint: str, path_key: str) -> bool:
+        return (
+            entry.get("fingerprint") == fingerprint
+            and bool(entry.get(path_key))
+            and Path(entry[path_key]).exists()
+        )
+
+    # --- Scene graph ---
+
+    async def _build_scene(
+        self,
+        i: int,
+        scene: Scene,
+        project: VideoProject,
+        project_dir: Path,
+        checkpoint: dict,
+        leonardo_slots: asyncio.Semaphore,
+        runway_slots: asyncio.Semaphore,
+        on_progress: Optional[Callable],
+    ):
+        """Take one scene from prompt to animated clip, resuming finished stages."""
+        total = len(project.scenes)
+        state = checkpoint["scenes"].setdefault(str(i + 1), {})
+
+        image_entry = state.setdefault("image", {})
+        image_fp = self._fingerprint(DEFAULT_MODEL_ID, scene.description)
+        if self._resumable(image_entry, image_fp, "path"):
+            scene.image_path = image_entry["path"]
+            # Hosted URLs expire; _animate_scene re-hosts from image_path
+            scene.image_url = None
+            logger.info(f"Scene {i+1}/{total}: image restored from checkpoint")
+        else:
+            async with leonardo_slots:
+                if on_progress:
+                    await on_progress("generating_image", {"scene": i + 1, "total": total})
+                await self._generate_image(i, scene, project, project_dir)
+            state["image"] = {"fingerprint": image_fp, "path": scene.image_path}
+            self._save_checkpoint(project_dir, checkpoint)
+
+        video_entry = state.setdefault("video", {})
+        video_fp = self._fingerprint(
+            RUNWAY_MODEL, image_fp, scene.motion_prompt, scene.duration
+        )
+        if self._resumable(video_entry, video_fp, "path"):
+            scene.video_path = video_entry["path"]
+            logger.info(f"Scene {i+1}/{total}: video restored from checkpoint")
+        else:
+            async with runway_slots:
+                if on_progress:
+                    await on_progress("animating_scene", {"scene": i + 1, "total": total})
+                await self._animate_scene(i, scene, project, project_dir)
+            state["video"] = {"fingerprint": video_fp, "path": scene.video_path}
+            self._save_checkpoint(project_dir, checkpoint)
+
+    async def _build_voice(
         self,
         project: VideoProject,
         project_dir: Path,
+        checkpoint: dict,
         on_progress: Optional[Callable],
     ):
-        """Generate images for all scenes."""
+        """Render the voiceover, resuming from checkpoint when the script is unchanged."""
+        voice_fp = self._fingerprint(project.voiceover_script)
+        if self._resumable(checkpoint["voice"], voice_fp, "path"):
+            project.voice_path = checkpoint["voice"]["path"]
+            logger.info("Voiceover restored from checkpoint")
+            return
+
+        if on_progress:
+            await on_progress("generating_voice", {"script_length": len(project.voiceover_script)})
+        await self._generate_voice(project, project_dir)
+        checkpoint["voice"] = {"fingerprint": voice_fp, "path": project.voice_path}
+        self._save_checkpoint(project_dir, checkpoint)
+
+    async def _generate_image(
+        self,
+        i: int,
+        scene: Scene,
+        project: VideoProject,
+        project_dir: Path,
+    ):
+        """Generate the image for one scene."""
         leonardo = self._get_leonardo()
 
-        for i, scene in enumerate(project.scenes):
-            logger.info(f"Generating image {i+1}/{len(project.scenes)}: {scene.description[:50]}...")
+        logger.info(f"Generating image {i+1}/{len(project.scenes)}: {scene.description[:50]}...")
 
-            if on_progress:
-                await on_progress("generating_image", {"scene": i + 1, "total": len(project.scenes)})
+        negative_prompt = "text, watermark, logo, blurry, low quality"
 
+        async def generate():
             result = await leonardo.generate_image(
                 prompt=scene.description,
-                negative_prompt="text, watermark, logo, blurry, low quality",
+                negative_prompt=negative_prompt,
                 style="CINEMATIC",
             )
-
-            # Store hosted URL (Runway needs this) and download locally
-            scene.image_url = result["image_url"]
             image_data = await leonardo.download_image(result["image_url"])
-            image_path = project_dir / f"scene_{i+1:02d}.png"
-            image_path.write_bytes(image_data)
-            scene.image_path = str(image_path)
+            return image_data, {"image_url": result["image_url"]}
+
+        image_data, meta, hit = await self.asset_cache.get_or_generate(
+            "leonardo",
+            {"model": DEFAULT_MODEL_ID, "prompt": scene.description,
+             "negative_prompt": negative_prompt, "style": "CINEMATIC"},
+            generate,
+        )
 
-            logger.info(f"Image saved: {image_path}")
+        # Keep the hosted URL only when freshly generated; a cached one may
+        # have expired, so _animate_scene re-hosts from image_path instead
+        scene.image_url = None if hit else meta["image_url"]
+        image_path = project_dir / f"scene_{i+1:02d}.png"
+        image_path.write_bytes(image_data)
+        scene.image_path = str(image_path)
 
-    async def _animate_scenes(
+        logger.info(f"Image saved: {image_path}")
+
+    async def _animate_scene(
         self,
+        i: int,
+        scene: Scene,
         project: VideoProject,
         project_dir: Path,
-        on_progress: Optional[Callable],
     ):
-        """Animate all scene images into videos."""
+        """Animate one scene image into a video clip."""
         runway = self._get_runway()
 
-        for i, scene in enumerate(project.scenes):
-            if not scene.image_url:
-                raise RuntimeError(f"Scene {i+1} has no image URL")
+        if not scene.image_path or not Path(scene.image_path).exists():
+            raise RuntimeError(f"Scene {i+1} has no image")
 
-            logger.info(f"Animating scene {i+1}/{len(project.scenes)}: {scene.motion_prompt[:50]}...")
-
-            if on_progress:
-                await on_progress("animating_scene", {"scene": i + 1, "total": len(project.scenes)})
+        logger.info(f"Animating scene {i+1}/{len(project.scenes)}: {scene.motion_prompt[:50]}...")
 
+        async def generate():
             result = await runway.animate_image(
-                image_url=scene.image_url,
+                image_url=scene.image_url or data_uri(Path(scene.image_path).read_bytes()),
                 motion_prompt=scene.motion_prompt,
                 duration=scene.duration,
             )
-
-            # Download and save video
             video_data = await runway.download_video(result["video_url"])
-            video_path = project_dir / f"scene_{i+1:02d}.mp4"
-            video_path.write_bytes(video_data)
-            scene.video_path = str(video_path)
+            return video_data, {"video_url": result["video_url"]}
+
+        # Keyed by the source image's content, not its (hosted) URL
+        image_hash = hashlib.sha256(Path(scene.image_path).read_bytes()).hexdigest()
+        video_data, _, _ = await self.asset_cache.get_or_generate(
+            "runway",
+            {"model": RUNWAY_MODEL, "image": image_hash,
+             "motion_prompt": scene.motion_prompt, "duration": scene.duration},
+            generate,
+        )
 
-            logger.info(f"Video saved: {video_path}")
+        # Save video
+        video_path = project_dir / f"scene_{i+1:02d}.mp4"
+        video_path.write_bytes(video_data)
+        scene.video_path = str(video_path)
+
+        logger.info(f"Video saved: {video_path}")
 
     async def _generate_voice(self, project: VideoProject, project_dir: Path):
         """Generate voiceover narration."""
@@ -226,11 +383,21 @@ class CinematicVideoPipeline:
 
         logger.info("Generating voiceover...")
 
-        audio_data = await elevenlabs.text_to_speech(
-            text=project.voiceover_script,
-            model="eleven_v3",
-            stability=0.0,  # Creative mode
-            style=0.85,  # High emotion
+        async def generate():
+            audio_data = await elevenlabs.text_to_speech(
+                text=project.voiceover_script,
+                model="eleven_v3",
+                stability=0.0,  # Creative mode
+                style=0.85,  # High emotion
+            )
+            return audio_data, {}
+
+        audio_data, _, _ = await self.asset_cache.get_or_generate(
+            "elevenlabs",
+            {"text": project.voiceover_script, "model": "eleven_v3",
+             "voice_id": os.environ.get("ELEVENLABS_VOICE_ID", ""),
+             "stability": 0.0, "style": 0.85},
+            generate,
         )
 
         voice_path = project_dir / "voiceover.mp3"
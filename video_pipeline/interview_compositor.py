@@ -6,13 +6,19 @@ Format: Alternating full-screen clips
 
 Designed for 9:16 vertical video (Shorts/TikTok/Reels).
 Normalizes all clips to consistent resolution/fps/codec before joining.
+Normalized clips and title cards are cached on disk, so re-composing after
+swapping one clip only re-renders that clip.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
 import os
+import shutil
 import subprocess
 import tempfile
+import uuid
 from pathlib import Path
 from typing import Optional
 
@@ -26,6 +32,11 @@ DEFAULT_CODEC = "libx264"
 DEFAULT_AUDIO_CODEC = "aac"
 DEFAULT_AUDIO_BITRATE = "192k"
 DEFAULT_CRF = 23
+# Profile libx264 picks for yuv420p output; stream-copied clips must match it
+DEFAULT_PROFILE = "High"
+# MP4 track timescale ticks per frame; every clip is written with fps * this
+# so stream-copied and re-encoded clips share one time base in the concat
+TIMESCALE_PER_FRAME = 512
 
 # Title card settings
 TITLE_CARD_DURATION = 2.0  # seconds
@@ -33,6 +44,10 @@ TITLE_FONT_SIZE = 48
 TITLE_BG_COLOR = "black"
 TITLE_TEXT_COLOR = "white"
 
+# Render cache for normalized clips and title cards
+CACHE_DIR = Path("data/video_pipeline/interview_cache")
+MAX_CONCURRENT_ENCODES = os.cpu_count() or 2
+
 # Transition settings
 CROSSFADE_DURATION = 0.3  # seconds
 
@@ -45,8 +60,17 @@ class InterviewCompositor:
     and joins them in alternating Q&A order with optional title cards.
     """
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[Path] = None,
+                 max_concurrent: int = MAX_CONCURRENT_ENCODES):
         self._ffmpeg = self._find_ffmpeg()
+        # Absolute: the concat list lives in a temp dir, and ffmpeg resolves
+        # relative entries against the list file's directory
+        self.cache_dir = Path(cache_dir or CACHE_DIR).resolve()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Bounds concurrent FFmpeg processes during compose_interview
+        self.max_concurrent = max(1, max_concurrent)
+        # In-flight cache renders, so jobs sharing a cache key encode once
+        self._renders: dict[Path, asyncio.Task] = {}
 
     def _find_ffmpeg(self) -> str:
         """Find FFmpeg executable on the system."""
@@ -89,13 +113,16 @@ class InterviewCompositor:
             )
             stdout, _ = await proc.communicate()
 
-            import json
             data = json.loads(stdout.decode())
 
             video_stream = next(
                 (s for s in data.get("streams", []) if s["codec_type"] == "video"),
                 {},
             )
+            audio_stream = next(
+                (s for s in data.get("streams", []) if s["codec_type"] == "audio"),
+                {},
+            )
 
             return {
                 "width": int(video_stream.get("width", 0)),
@@ -103,10 +130,17 @@ class InterviewCompositor:
                 "fps": eval(video_stream.get("r_frame_rate", "30/1")),
                 "duration": float(data.get("format", {}).get("duration", 0)),
                 "codec": video_stream.get("codec_name", "unknown"),
+                "pix_fmt": video_stream.get("pix_fmt", "unknown"),
+                "profile": video_stream.get("profile", "unknown"),
+                "audio_codec": audio_stream.get("codec_name", "none"),
+                "sample_rate": int(audio_stream.get("sample_rate", 0)),
+                "channels": int(audio_stream.get("channels", 0)),
             }
         except Exception as e:
             logger.error(f"Failed to get video info for {video_path}: {e}")
-            return {"width": 0, "height": 0, "fps": 30, "duration": 0, "codec": "unknown"}
+            return {"width": 0, "height": 0, "fps": 30, "duration": 0, "codec": "unknown",
+                    "pix_fmt": "unknown", "profile": "unknown",
+                    "audio_codec": "none", "sample_rate": 0, "channels": 0}
 
     async def normalize_clip(
         self,
@@ -121,28 +155,69 @@ class InterviewCompositor:
 
         Handles phone videos with varying specs by scaling + padding
         to maintain aspect ratio within the target frame.
+
+        Clips whose video already matches the target (h264 High profile,
+        resolution, fps, yuv420p) skip the re-encode: video is stream-copied,
+        and audio is copied too when it is already AAC 44.1kHz stereo. Every
+        output is written with the same track timescale, so copied and
+        re-encoded clips can share one concat-demuxer input.
         """
-        # Scale to fit within target dimensions, pad to fill
-        filter_complex = (
-            f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
-            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2:color=black,"
-            f"fps={fps},format=yuv420p"
+        timescale = ["-video_track_timescale", str(fps * TIMESCALE_PER_FRAME)]
+        info = await self._get_video_info(input_path)
+        video_matches = (
+            info["codec"] == "h264"
+            and info["width"] == width
+            and info["height"] == height
+            and abs(info["fps"] - fps) < 0.01
+            and info["pix_fmt"] == "yuv420p"
+            and info["profile"] == DEFAULT_PROFILE
+        )
+        audio_matches = (
+            info["audio_codec"] == "aac"
+            and info["sample_rate"] == 44100
+            and info["channels"] == 2
         )
 
-        cmd = [
-            self._ffmpeg,
-            "-i", input_path,
-            "-vf", filter_complex,
-            "-c:v", DEFAULT_CODEC,
-            "-preset", "fast",
-            "-crf", str(DEFAULT_CRF),
-            "-c:a", DEFAULT_AUDIO_CODEC,
-            "-b:a", DEFAULT_AUDIO_BITRATE,
-            "-ar", "44100",
-            "-ac", "2",
-            "-y",
-            output_path,
-        ]
+        if video_matches:
+            audio_args = ["-c:a", "copy"] if audio_matches else [
+                "-c:a", DEFAULT_AUDIO_CODEC,
+                "-b:a", DEFAULT_AUDIO_BITRATE,
+                "-ar", "44100",
+                "-ac", "2",
+            ]
+            cmd = [
+                self._ffmpeg,
+                "-i", input_path,
+                "-c:v", "copy",
+                *audio_args,
+                *timescale,
+                "-y",
+                output_path,
+            ]
+            logger.info(f"Clip already matches target, stream copying: {input_path}")
+        else:
+            # Scale to fit within target dimensions, pad to fill
+            filter_complex = (
+                f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+                f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2:color=black,"
+                f"fps={fps},format=yuv420p"
+            )
+
+            cmd = [
+                self._ffmpeg,
+                "-i", input_path,
+                "-vf", filter_complex,
+                "-c:v", DEFAULT_CODEC,
+                "-preset", "fast",
+                "-crf", str(DEFAULT_CRF),
+                "-c:a", DEFAULT_AUDIO_CODEC,
+                "-b:a", DEFAULT_AUDIO_BITRATE,
+                "-ar", "44100",
+                "-ac", "2",
+                *timescale,
+                "-y",
+                output_path,
+            ]
 
         proc = await asyncio.create_subprocess_exec(
             *cmd,
@@ -189,6 +264,7 @@ class InterviewCompositor:
             "-crf", str(DEFAULT_CRF),
             "-c:a", DEFAULT_AUDIO_CODEC,
             "-b:a", DEFAULT_AUDIO_BITRATE,
+            "-video_track_timescale", str(DEFAULT_FPS * TIMESCALE_PER_FRAME),
             "-shortest",
             "-y",
             output_path,
@@ -207,6 +283,85 @@ class InterviewCompositor:
         logger.info(f"Created title card: {output_path}")
         return output_path
 
+    def _cache_path(self, kind: str, params: dict) -> Path:
+        """Cache file for a rendered clip, keyed by everything that shapes it."""
+        key = hashlib.sha256(
+            json.dumps({"kind": kind, **params}, sort_keys=True).encode()
+        ).hexdigest()[:24]
+        return self.cache_dir / f"{kind}_{key}.mp4"
+
+    @staticmethod
+    def _source_fingerprint(path: str) -> dict:
+        """Identity of a source clip; changes when the file is swapped or edited."""
+        stat = os.stat(path)
+        return {"path": str(Path(path).resolve()), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+    async def _cached_render(self, cache_path: Path, render) -> str:
+        """Return cache_path, rendering it via render(tmp_path) on a miss."""
+        if cache_path.exists():
+            logger.info(f"Reusing cached render: {cache_path.name}")
+            return str(cache_path)
+
+        # Jobs in one compose can share a key (e.g. the same clip twice):
+        # the later ones wait on the first job's render instead of encoding
+        task = self._renders.get(cache_path)
+        if task is None:
+            task = asyncio.ensure_future(self._render_to_cache(cache_path, render))
+            self._renders[cache_path] = task
+            task.add_done_callback(lambda _: self._renders.pop(cache_path, None))
+        return await task
+
+    @staticmethod
+    async def _render_to_cache(cache_path: Path, render) -> str:
+        """Run render(tmp_path) and move the result into place atomically."""
+        # Render to a unique temp name so an interrupted encode never looks
+        # cached and concurrent renders (here or in another process) don't clash
+        tmp_path = cache_path.with_name(f".{cache_path.stem}.{uuid.uuid4().hex}.tmp.mp4")
+        try:
+            await render(str(tmp_path))
+            os.replace(tmp_path, cache_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return str(cache_path)
+
+    async def cached_title_card(
+        self,
+        text: str,
+        duration: float = TITLE_CARD_DURATION,
+        width: int = DEFAULT_WIDTH,
+        height: int = DEFAULT_HEIGHT,
+    ) -> str:
+        """Title card from the render cache, keyed by text, duration and resolution."""
+        cache_path = self._cache_path("title", {
+            "text": text, "duration": duration, "width": width, "height": height,
+            "font_size": TITLE_FONT_SIZE, "bg": TITLE_BG_COLOR, "fg": TITLE_TEXT_COLOR,
+            "timescale": DEFAULT_FPS * TIMESCALE_PER_FRAME,
+        })
+        return await self._cached_render(
+            cache_path,
+            lambda out: self.create_title_card(text, out, duration=duration,
+                                               width=width, height=height),
+        )
+
+    async def cached_normalize_clip(
+        self,
+        input_path: str,
+        width: int = DEFAULT_WIDTH,
+        height: int = DEFAULT_HEIGHT,
+        fps: int = DEFAULT_FPS,
+    ) -> str:
+        """Normalized clip from the render cache, keyed by source identity and target spec."""
+        cache_path = self._cache_path("norm", {
+            **self._source_fingerprint(input_path),
+            "width": width, "height": height, "fps": fps, "crf": DEFAULT_CRF,
+            "timescale": fps * TIMESCALE_PER_FRAME, "profile": DEFAULT_PROFILE,
+        })
+        return await self._cached_render(
+            cache_path,
+            lambda out: self.normalize_clip(input_path, out, width=width,
+                                            height=height, fps=fps),
+        )
+
     async def compose_interview(
         self,
         questions_dir: str,
@@ -249,51 +404,42 @@ class InterviewCompositor:
         pairs = min(len(q_files), len(a_files))
         logger.info(f"Composing interview: {pairs} Q&A pairs")
 
-        # Create temp directory for normalized clips
+        # Temp directory for the concat list; rendered clips live in the cache
         temp_dir = tempfile.mkdtemp(prefix="interview_")
-        normalized_clips = []
+        slots = asyncio.Semaphore(self.max_concurrent)
+
+        async def limited(job):
+            async with slots:
+                return await job
 
         try:
+            # Build the clip list in playback order, then render concurrently
+            jobs = []
+
             # Optional intro title card
             if include_title_cards and title:
                 intro_text = title
                 if expert_name:
                     intro_text += f"\\nwith {expert_name}"
-                intro_path = os.path.join(temp_dir, "intro_card.mp4")
-                await self.create_title_card(
-                    intro_text, intro_path, duration=3.0
-                )
-                normalized_clips.append(intro_path)
+                jobs.append(self.cached_title_card(intro_text, duration=3.0))
 
             # Process each Q&A pair
             for i in range(pairs):
-                q_file = q_files[i]
-                a_file = a_files[i]
-
                 # Optional Q&A label title card
                 if include_title_cards:
-                    label_path = os.path.join(temp_dir, f"label_{i+1}.mp4")
-                    await self.create_title_card(
-                        f"Question {i+1}", label_path, duration=1.5
-                    )
-                    normalized_clips.append(label_path)
-
-                # Normalize question clip
-                norm_q = os.path.join(temp_dir, f"norm_q{i+1}.mp4")
-                await self.normalize_clip(str(q_file), norm_q)
-                normalized_clips.append(norm_q)
-
-                # Normalize answer clip
-                norm_a = os.path.join(temp_dir, f"norm_a{i+1}.mp4")
-                await self.normalize_clip(str(a_file), norm_a)
-                normalized_clips.append(norm_a)
+                    jobs.append(self.cached_title_card(f"Question {i+1}", duration=1.5))
+
+                jobs.append(self.cached_normalize_clip(str(q_files[i])))
+                jobs.append(self.cached_normalize_clip(str(a_files[i])))
+
+            normalized_clips = await asyncio.gather(*(limited(job) for job in jobs))
 
             # Create concat list file
             concat_list = os.path.join(temp_dir, "concat_list.txt")
             with open(concat_list, "w") as f:
                 for clip in normalized_clips:
-                    # Escape path for FFmpeg concat demuxer
-                    escaped = clip.replace("\\", "/").replace("'", "'\\''")
+                    # Absolute path, escaped for FFmpeg concat demuxer
+                    escaped = os.path.abspath(clip).replace("\\", "/").replace("'", "'\\''")
                     f.write(f"file '{escaped}'\n")
 
             # Ensure output directory exists
@@ -322,7 +468,6 @@ class InterviewCompositor:
 
         finally:
             # Clean up temp files
-            import shutil
             try:
                 shutil.rmtree(temp_dir, ignore_errors=True)
             except Exception:
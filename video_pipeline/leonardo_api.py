@@ -12,6 +12,7 @@ import httpx
 logger = logging.getLogger(__name__)
 
 LEONARDO_BASE_URL = "https://cloud.leonardo.ai/api/rest/v1"
+DEFAULT_MODEL_ID = "6b645e3a-d64f-4341-a6d8-7a3690fbf042"  # Leonardo Phoenix
 
 
 class LeonardoAPI:
@@ -41,7 +42,7 @@ class LeonardoAPI:
         negative_prompt: str = "",
         width: int = 1024,
         height: int = 576,  # 16:9 for video
-        model_id: str = "6b645e3a-d64f-4341-a6d8-7a3690fbf042",  # Leonardo Phoenix
+        model_id: str = DEFAULT_MODEL_ID,
         num_images: int = 1,
         style: str = "CINEMATIC",
     ) -> dict:
@@ -12,6 +12,7 @@ import httpx
 logger = logging.getLogger(__name__)
 
 RUNWAY_BASE_URL = "https://api.dev.runwayml.com/v1"
+DEFAULT_MODEL = "gen3a_turbo"
 
 
 class RunwayAPI:
@@ -41,7 +42,7 @@ class RunwayAPI:
         image_url: str,
         motion_prompt: str = "Slow cinematic camera movement",
         duration: int = 5,  # 5 or 10 seconds
-        model: str = "gen3a_turbo",
+        model: str = DEFAULT_MODEL,
     ) -> dict:
         """
         Animate a still image into video using Runway Gen-3.